@@ -0,0 +1,196 @@
+"""Benchmark: every indicator of the 'ta' DataFrame extension.
+
+Times each indicator on data/SPY_D.csv and on synthetic 10k, 1M and 10M bar
+frames resampled from it, with warmup runs and repeats, and writes the timings
+as JSON, along with the time 'import ta' takes in a fresh interpreter.  A
+stored run can be compared against a new one, flagging the indicators that
+got slower.
+
+    python bench.py --output baseline.json
+    python bench.py --sizes spy 10k --indicators rsi macd --repeat 10
+    python bench.py --compare baseline.json --output current.json
+    python bench.py --compare baseline.json current.json # No new run
+
+The comparison uses the best (minimum) time of each indicator and exits with
+status 1 if any indicator regressed.
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import warnings
+
+import numpy as np
+import pandas as pd
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, ROOT)
+import ta
+
+DATA = os.path.join(ROOT, 'data', 'SPY_D.csv')
+SIZES = {'spy': None, '10k': 10000, '1m': 1000000, '10m': 10000000}
+HELPER_METHODS = ['indicators', 'cache', 'constants', 'preallocate', 'stage', 'strategy']
+
+
+def indicators():
+    """Names of the indicators of the 'ta' extension."""
+    names = [x for x in dir(pd.DataFrame().ta) if not x.startswith('_') and not x.endswith('_')]
+    return [x for x in names if x not in HELPER_METHODS]
+
+
+def synthetic(spy:pd.DataFrame, bars:int, seed:int = 0):
+    """'bars' OHLCV bars resampled from SPY: the closes follow SPY's daily log
+    returns drawn at random, and each bar takes the open, high and low
+    relative to the close and the volume of the SPY bar its return came from."""
+    rng = np.random.RandomState(seed)
+    log_returns = np.log(spy['close']).diff().values
+    rows = rng.randint(1, len(spy), bars)
+
+    close = spy['close'].iloc[0] * np.exp(np.cumsum(log_returns[rows]))
+    df = pd.DataFrame({
+        'open': close * (spy['open'].values / spy['close'].values)[rows],
+        'high': close * (spy['high'].values / spy['close'].values)[rows],
+        'low': close * (spy['low'].values / spy['close'].values)[rows],
+        'close': close,
+        'volume': spy['volume'].values[rows],
+    }, index=pd.date_range('2000-01-03', periods=bars, freq='min', name='date'))
+    return df
+
+
+def frames(sizes:list):
+    """The benchmark DataFrame of every size."""
+    spy = pd.read_csv(DATA, index_col='date', parse_dates=True)
+    for size in sizes:
+        yield size, spy.copy() if SIZES[size] is None else synthetic(spy, SIZES[size])
+
+
+def measure(fn, repeat:int = 5, warmup:int = 1):
+    """Timings in seconds of 'repeat' calls of fn after 'warmup' calls."""
+    for _ in range(warmup):
+        fn()
+    timings = []
+    for _ in range(repeat):
+        stime = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - stime)
+    return timings
+
+
+def import_time(module:str, repeat:int = 5):
+    """Timings in seconds of 'import module' in 'repeat' fresh interpreters."""
+    code = f"import sys, time; sys.path.insert(0, {ROOT!r}); stime = time.perf_counter(); import {module}; print(time.perf_counter() - stime)"
+    return [float(subprocess.check_output([sys.executable, '-c', code])) for _ in range(repeat)]
+
+
+def summary(timings:list, bars:int = 0):
+    """Best, median and mean of the timings."""
+    return {
+        'bars': bars,
+        'best': min(timings),
+        'median': float(np.median(timings)),
+        'mean': float(np.mean(timings)),
+        'runs': timings,
+    }
+
+
+def run(sizes:list, names:list, repeat:int = 5, warmup:int = 1):
+    """Benchmarks the indicators 'names' on the frames of 'sizes'."""
+    # pandas is imported by ta, its time is the floor of ta's
+    results = {'import': {}}
+    print("import", file=sys.stderr)
+    for module in ['pandas', 'ta']:
+        results['import'][module] = summary(import_time(module, repeat=repeat))
+        print(f"    {module:<16} {1000 * results['import'][module]['best']:>12.3f} ms", file=sys.stderr)
+
+    for size, df in frames(sizes):
+        results[size] = {}
+        print(f"{size}: {len(df)} bars", file=sys.stderr)
+        for name in names:
+            fn = getattr(df.ta, name)
+            try:
+                timings = measure(fn, repeat=repeat, warmup=warmup)
+            except Exception as e:
+                results[size][name] = {'bars': len(df), 'error': repr(e)}
+                print(f"    {name:<16} {e!r}", file=sys.stderr)
+                continue
+
+            results[size][name] = summary(timings, bars=len(df))
+            print(f"    {name:<16} {1000 * min(timings):>12.3f} ms", file=sys.stderr)
+
+    return {
+        'meta': {
+            'time': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'numpy': np.__version__,
+            'pandas': pd.__version__,
+            'repeat': repeat,
+            'warmup': warmup,
+        },
+        'results': results,
+    }
+
+
+def compare(baseline:dict, current:dict, threshold:float = 0.2, noise:float = 1e-4):
+    """Rows of (size, name, baseline best, current best, ratio, regressed) of
+    the indicators in both runs.  An indicator regressed if its best time grew
+    by more than 'threshold' (relative) and 'noise' seconds."""
+    rows = []
+    for size, results in current['results'].items():
+        for name, result in results.items():
+            base = baseline['results'].get(size, {}).get(name)
+            if base is None or 'best' not in base or 'best' not in result:
+                continue
+            ratio = result['best'] / base['best'] if base['best'] > 0 else np.inf
+            regressed = ratio > 1 + threshold and result['best'] - base['best'] > noise
+            rows.append((size, name, base['best'], result['best'], ratio, regressed))
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', nargs='+', choices=list(SIZES), default=list(SIZES))
+    parser.add_argument('--indicators', nargs='+', default=None, help="Default: all of them")
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--warmup', type=int, default=1)
+    parser.add_argument('--output', default=None, help="JSON file of the run, default: stdout")
+    parser.add_argument('--compare', nargs='+', metavar=('BASELINE', 'CURRENT'), default=None,
+        help="Compares a new run, or the stored run CURRENT, against BASELINE")
+    parser.add_argument('--threshold', type=float, default=0.2, help="Relative slowdown flagged, default: 0.2")
+    parser.add_argument('--noise', type=float, default=1e-4, help="Absolute slowdown in seconds ignored, default: 1e-4")
+    args = parser.parse_args(argv)
+
+    warnings.filterwarnings('ignore')
+    if args.compare and len(args.compare) > 1:
+        with open(args.compare[1]) as f:
+            current = json.load(f)
+    else:
+        current = run(args.sizes, args.indicators or indicators(), repeat=args.repeat, warmup=args.warmup)
+        if args.output:
+            with open(args.output, 'w') as f:
+                json.dump(current, f, indent=2)
+        elif not args.compare:
+            json.dump(current, sys.stdout, indent=2)
+
+    if not args.compare:
+        return 0
+
+    with open(args.compare[0]) as f:
+        baseline = json.load(f)
+    rows = compare(baseline, current, threshold=args.threshold, noise=args.noise)
+
+    print(f"{'size':<6} {'indicator':<16} {'baseline ms':>12} {'current ms':>12} {'ratio':>7}")
+    for size, name, base, best, ratio, regressed in rows:
+        flag = '  REGRESSION' if regressed else ''
+        print(f"{size:<6} {name:<16} {1000 * base:>12.3f} {1000 * best:>12.3f} {ratio:>7.2f}{flag}")
+
+    regressions = sum(x[-1] for x in rows)
+    print(f"{regressions} regression(s) in {len(rows)} indicator(s)")
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
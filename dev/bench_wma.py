@@ -0,0 +1,37 @@
+"""Benchmark: WMA runtime as the window length grows.
+
+The default (recursive) WMA should stay flat from length 10 to 1000 while the
+convolution based weighted window grows with the length.
+"""
+import time
+
+import numpy as np
+import pandas as pd
+
+import sys
+sys.path.append("..") # Adds higher directory to python modules path.
+from ta import wma
+
+# Synthetic data: 1M bars resampled from SPY daily log returns
+spy = pd.read_csv('../data/SPY_D.csv', index_col='date', parse_dates=True)
+log_returns = np.log(spy['close']).diff().dropna().values
+rng = np.random.RandomState(0)
+close = pd.Series(spy['close'].iloc[0] * np.exp(np.cumsum(rng.choice(log_returns, 1000000))))
+
+
+def best_of(fn, repeat=5):
+    fn() # Warmup
+    timings = []
+    for _ in range(repeat):
+        stime = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - stime)
+    return min(timings)
+
+
+print(f"WMA over {close.size} bars (best of 5, ms)")
+print(f"{'length':>8} {'recursive':>10} {'convolve':>10}")
+for length in [10, 50, 100, 250, 500, 1000]:
+    recursive = best_of(lambda: wma(close, length=length))
+    convolve = best_of(lambda: wma(close, length=length, recursive=False))
+    print(f"{length:>8} {1000 * recursive:>10.1f} {1000 * convolve:>10.1f}")
@@ -2,7 +2,7 @@
 from distutils.core import setup
 setup(
     name = 'ta',
-    packages = ['ta'],
+    packages = ['ta', 'ta.core'],
     version = '0.3.2',
     description='Technical Analysis Library in Python',
     long_description='It is a Technical Analysis library to financial time series datasets. You can use to do feature engineering. It is builded on Python Pandas library.',
@@ -12,8 +12,8 @@ setup(
     maintainer='Dario Lopez Padial (Bukosabino)',
     maintainer_email='Bukosabino@gmail.com',
     install_requires=[
-        'numpy',
-        'pandas'
+        'numpy>=1.17',
+        'pandas>=1.0'
     ],
     download_url = 'https://github.com/bukosabino/ta/tarball/0.2.0',
     keywords = ['technical analysis', 'python3', 'pandas'],
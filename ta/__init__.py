@@ -7,6 +7,57 @@ Python's Pandas library.
 .. moduleauthor:: Dario Lopez Padial (Bukosabino)
 
 """
+from importlib import import_module
+from inspect import ismodule
+
 from ._extension import *
 from .utils import *
-from .wrapper import *
\ No newline at end of file
+
+# The indicator modules, the wrapper and the submodules below are imported on
+# first access of one of their names, e.g. ta.rsi or ta.parallel, instead of
+# by 'import ta'.  Their names are looked up in this order, the order in which
+# they used to be star imported, latest first.
+_LAZY_MODULES = [
+    'others', 'momentum', 'trend', 'volatility', 'volume', 'overlap',
+    'performance', 'statistics', 'wrapper'
+]
+_SUBMODULES = [
+    'core', 'instrumentation', 'others', 'momentum', 'overlap', 'parallel',
+    'performance', 'statistics', 'stream', 'trend', 'utils', 'volatility',
+    'volume', 'wrapper'
+]
+
+
+def _public(namespace:dict):
+    """The public names of a module's namespace: its __all__ if it has one,
+    otherwise the non private objects defined in ta, leaving out the modules
+    and helpers it imports, like np or reduce."""
+    if '__all__' in namespace:
+        return list(namespace['__all__'])
+    return [
+        x for x, value in namespace.items()
+        if not x.startswith('_') and not ismodule(value)
+        and (getattr(value, '__module__', None) or '').split('.')[0] == __name__
+    ]
+
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        return import_module(f'.{name}', __name__)
+    if name == '__all__':
+        names = _public(globals())
+        for module in _LAZY_MODULES:
+            names.extend(_public(vars(import_module(f'.{module}', __name__))))
+        return sorted(set(names))
+
+    if not name.startswith('_'):
+        for module in _LAZY_MODULES:
+            module = import_module(f'.{module}', __name__)
+            if name in _public(vars(module)):
+                value = globals()[name] = vars(module)[name]
+                return value
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_SUBMODULES))
@@ -1,20 +1,424 @@
 # -*- coding: utf-8 -*-
 import time
+import weakref
+import numpy as np
 import pandas as pd
 
-from .momentum import *
-from .overlap import *
-from .performance import *
-from .statistics import *
-from .trend import *
-from .volatility import *
-from .volume import *
+from collections import OrderedDict
+from importlib import import_module
+from inspect import Parameter, signature
+from zlib import crc32
 
-from .utils import verify_series
+from .utils import IntermediateCache, _intermediate_key, get_dtype, verify_series
 from pandas.core.base import PandasObject
 
 
 
+class IndicatorCache(object):
+    """Indicator Cache
+
+    An opt-in, bounded LRU cache of indicator results for the 'ta' extension.
+    It is shared by all DataFrames and disabled by default.
+
+    Results are keyed on the indicator, the identity of its input columns
+    (name, data and index buffers) and its normalized arguments.  Each entry
+    also keeps a checksum of its input columns as their version, so when a
+    column is mutated in place, the entries computed from it are invalidated
+    on their next lookup.  Once the results held exceed max_bytes, the least
+    recently used entries are evicted.  Only the results count towards
+    max_bytes, the input columns they reference are not.
+
+    Hits and misses return copies, so the cached results can not be modified.
+
+    >>> df.ta.cache(True, max_bytes=128 * 2**20)
+    >>> df.ta.rsi(); df.ta.rsi() # The second call is a hit
+    >>> df.ta.cache().stats()
+    """
+    def __init__(self, max_bytes=256 * 2**20):
+        self.enabled = False
+        self.max_bytes = int(max_bytes)
+        self.clear()
+
+    def __call__(self, indicator, **kwargs):
+        """Returns indicator(**kwargs), from the cache if possible."""
+        key, columns = self._key(indicator, kwargs)
+        if key is None:
+            return indicator(**kwargs)
+
+        version = tuple(self._version(x) for x in columns)
+        if key in self.entries:
+            result, nbytes, entry_version, _ = self.entries[key]
+            if entry_version == version:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return _copy_result(result)
+            self._evict(key)
+            self.invalidations += 1
+
+        self.misses += 1
+        result = indicator(**kwargs)
+        nbytes = _result_bytes(result)
+        if nbytes <= self.max_bytes:
+            # Keep the input columns alive so their buffers are not reused
+            self.entries[key] = (result, nbytes, version, columns)
+            self.bytes += nbytes
+            self._shrink(self.max_bytes)
+            return _copy_result(result)
+        return result
+
+    def _evict(self, key):
+        self.bytes -= self.entries.pop(key)[1]
+
+    def _key(self, indicator, kwargs):
+        """Normalized (indicator, arguments) key and the input columns.  The
+        key is None if an argument can not be hashed."""
+        indicator_signature = signature(indicator)
+        bound = indicator_signature.bind(**{k: v for k, v in kwargs.items() if k != 'append'})
+        bound.apply_defaults()
+        params = []
+        for name, value in bound.arguments.items():
+            if indicator_signature.parameters[name].kind == Parameter.VAR_KEYWORD:
+                params.extend(value.items())
+            else:
+                params.append((name, value))
+
+        key, columns = [indicator.__module__, indicator.__name__, get_dtype().str], []
+        for name, value in sorted(params, key=lambda x: x[0]):
+            value_key = _intermediate_key(value)
+            if value_key is None and value is not None:
+                return None, None
+            if isinstance(value, pd.Series):
+                columns.append(value)
+                value_key = (value.name, value_key)
+            key.append((name, value_key))
+        return tuple(key), tuple(columns)
+
+    def _shrink(self, max_bytes):
+        while self.bytes > max_bytes and len(self.entries):
+            self._evict(next(iter(self.entries)))
+            self.evictions += 1
+
+    @staticmethod
+    def _version(series):
+        return crc32(np.ascontiguousarray(series.values))
+
+    def clear(self):
+        """Removes all the entries and resets the statistics."""
+        self.entries = OrderedDict()
+        self.bytes = 0
+        self.hits = self.misses = self.evictions = self.invalidations = 0
+
+    def resize(self, max_bytes):
+        """Sets the memory budget, evicting entries if needed."""
+        self.max_bytes = int(max_bytes)
+        self._shrink(self.max_bytes)
+
+    def stats(self):
+        """Hit/miss statistics and memory usage as a dict."""
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'evictions': self.evictions,
+            'invalidations': self.invalidations,
+            'entries': len(self.entries),
+            'bytes': self.bytes,
+            'max_bytes': self.max_bytes,
+        }
+
+
+def _copy_result(result):
+    """Copy of an indicator result, including its category."""
+    if isinstance(result, tuple):
+        return tuple(_copy_result(x) for x in result)
+    copy = result.copy()
+    if 'category' in vars(result):
+        copy.category = result.category
+    return copy
+
+
+def _result_bytes(result):
+    if isinstance(result, tuple):
+        return sum(_result_bytes(x) for x in result)
+    if isinstance(result, pd.DataFrame):
+        return int(result.memory_usage(index=False, deep=True).sum())
+    return int(result.memory_usage(index=False, deep=True))
+
+
+indicator_cache = IndicatorCache()
+
+
+
+class _ColumnCache(object):
+    """A DataFrame's resolved column names, and contiguous copies of its
+    strided columns, e.g. those of a DataFrame built from a 2D array.  The
+    names are valid while the DataFrame keeps the same columns and index:
+    inserting, removing or renaming columns or replacing the index
+    invalidates them.  A copy is valid while its column is backed by the same
+    array; writing into that array in place is not detected."""
+    def __init__(self, df):
+        self.version = (df.columns, df.index)
+        self.aliases = {}  # Lower case name -> column, e.g. 'close' -> 'Close'
+        for column in df.columns:
+            if isinstance(column, str):
+                self.aliases.setdefault(column.lower(), column)
+        self.resolved = {}
+        self.series = {}  # Column -> (contiguous Series, its column's values)
+
+    def valid(self, df):
+        columns, index = self.version
+        return df.columns is columns and df.index is index
+
+
+def _same_buffer(a, b):
+    """Whether the arrays a and b view the same memory the same way."""
+    return a.__array_interface__['data'][0] == b.__array_interface__['data'][0] and a.strides == b.strides and a.shape == b.shape
+
+
+_COLUMN_CACHES = {} # id(DataFrame) -> _ColumnCache
+
+
+def _column_cache(df):
+    """The _ColumnCache of df, rebuilt if df has changed since."""
+    cache = _COLUMN_CACHES.get(id(df))
+    if cache is not None and cache.valid(df):
+        return cache
+    if cache is None:
+        weakref.finalize(df, _COLUMN_CACHES.pop, id(df), None)
+    cache = _COLUMN_CACHES[id(df)] = _ColumnCache(df)
+    return cache
+
+
+
+_APPEND_STAGES = [] # Active AppendStage stack
+_INSERTS = {} # id(DataFrame) -> columns inserted since it was consolidated
+_MAX_INSERTS = 80 # Pandas warns about fragmented DataFrames past 100 blocks
+
+
+class AppendStage(object):
+    """Append Stage
+
+    While active, the results of the indicators called with append=True on
+    its DataFrame are staged instead of inserted one column at a time, which
+    fragments the DataFrame.  They are committed together when the context
+    exits, see df.ta.stage().
+
+    >>> with df.ta.stage():
+    ...     df.ta.rsi(append=True)
+    ...     df.ta.macd(append=True)
+    """
+    def __init__(self, df):
+        self.df = df
+        self.results = []
+
+    def __enter__(self):
+        _APPEND_STAGES.append(self)
+        return self
+
+    def __exit__(self, *exc):
+        _APPEND_STAGES.remove(self)
+        results, self.results = self.results, []
+        _commit(self.df, results)
+
+
+def _commit(df, results, consolidate=True):
+    """Writes the results' columns into df in place.  Columns df already has,
+    like preallocated ones, are overwritten in their existing memory when
+    their dtype can hold the values, cast to that dtype.  The new columns are
+    joined onto df with a single concatenation if consolidate, else inserted
+    one at a time like a plain df[name] = values, consolidating df every
+    _MAX_INSERTS columns so that it does not fragment."""
+    if len(results) == 0: return
+    frames = [x.to_frame() if isinstance(x, pd.Series) else x for x in results]
+    result = frames[0] if len(frames) == 1 else pd.concat(frames, axis=1)
+    duplicated = result.columns.duplicated(keep='last')
+    if duplicated.any():
+        result = result.loc[:, ~duplicated]
+
+    existing = result.columns.isin(df.columns)
+    for column in result.columns[existing]:
+        values, loc = result[column], df.columns.get_loc(column)
+        dtype = df[column].dtype
+        if isinstance(loc, int) and dtype.kind in 'fc' and np.can_cast(values.dtype, dtype, casting='same_kind'):
+            # Of the column's dtype, the values are set into its memory
+            df.iloc[:, loc] = values.to_numpy(dtype=dtype)
+        else:
+            df[column] = values
+
+    if existing.all(): return
+    if consolidate:
+        _join(df, result.loc[:, ~existing].copy())
+        return
+
+    for column in result.columns[~existing]:
+        df[column] = result[column]
+    if id(df) not in _INSERTS:
+        weakref.finalize(df, _INSERTS.pop, id(df), None)
+    _INSERTS[id(df)] = _INSERTS.get(id(df), 0) + int((~existing).sum())
+    if _INSERTS[id(df)] >= _MAX_INSERTS and hasattr(df, '_consolidate_inplace'):
+        # Merges the blocks of each dtype, as Pandas does before most
+        # operations, through the private method it uses for it (0.23 - 3.0)
+        df._consolidate_inplace()
+        _INSERTS[id(df)] = 0
+
+
+def _join(df, frame):
+    """Joins the columns of frame onto df in place, as one block.  The
+    concatenation is swapped into df through DataFrame._update_inplace, the
+    private method Pandas' own inplace methods use, there from Pandas 0.23
+    through 3.0.  Without it, the columns are inserted one at a time."""
+    if hasattr(df, '_update_inplace'):
+        df._update_inplace(pd.concat([df, frame], axis=1))
+        return
+    for column in frame.columns:
+        df[column] = frame[column]
+
+
+
+# Indicators that compute a panel in one pass over a (bars, symbols) frame.
+# The others are computed symbol by symbol.
+_PANEL_VECTORIZED = [
+    'accbands', 'ad', 'adosc', 'adx', 'ao', 'apo', 'aroon', 'atr', 'bbands',
+    'bop', 'cci', 'cmf', 'cmo', 'coppock', 'decreasing', 'donchian', 'dpo',
+    'efi', 'ema', 'eom', 'fwma', 'hl2', 'hlc3', 'hma', 'increasing', 'kc',
+    'kst', 'kurtosis', 'log_return', 'macd', 'mad', 'median', 'mfi',
+    'midpoint', 'midprice', 'mom', 'natr', 'nvi', 'obv', 'ohlc4',
+    'percent_return', 'ppo', 'pvi', 'pvol', 'pvt', 'pwma', 'quantile', 'rma',
+    'roc', 'rsi', 'skew', 'sma', 'stdev', 'stoch', 'trima', 'true_range',
+    'tsi', 'uo', 'variance', 'vortex', 'vwap', 'vwma', 'willr', 'wma',
+    'zscore'
+]
+
+
+class _PanelLayout(object):
+    """Maps the rows of a (symbol, date) MultiIndex onto a (bars, symbols)
+    grid where row i holds the i-th bar of every symbol."""
+    def __init__(self, index:pd.MultiIndex):
+        self.index = index
+        self.codes, self.symbols = pd.factorize(index.get_level_values(0))
+        self.counts = np.bincount(self.codes, minlength=len(self.symbols))
+        self.starts = np.cumsum(self.counts) - self.counts
+        self.order = np.argsort(self.codes, kind='stable')
+        self.bars = np.empty(self.codes.size, dtype=np.intp)
+        self.bars[self.order] = np.arange(self.codes.size) - np.repeat(self.starts, self.counts)
+
+    def rows(self, code:int):
+        """Row positions of a symbol, in order."""
+        return self.order[self.starts[code]:self.starts[code] + self.counts[code]]
+
+    def to_wide(self, series:pd.Series):
+        wide = np.full((self.counts.max(initial=0), len(self.symbols)), np.nan)
+        wide[self.bars, self.codes] = series.values
+        return pd.DataFrame(wide, columns=self.symbols)
+
+    def from_wide(self, result:pd.DataFrame):
+        if isinstance(result.columns, pd.MultiIndex):
+            names = result.columns.get_level_values(0).unique()
+            data = {name: self.from_wide(result[name]) for name in names}
+            panel = pd.DataFrame(data, index=self.index)
+        else:
+            values = result.reindex(columns=self.symbols).values[self.bars, self.codes]
+            panel = pd.Series(values, index=self.index)
+        return _copy_attributes(result, panel)
+
+    def from_symbols(self, results:list):
+        """Scatters the results of each symbol back onto the panel's rows."""
+        stacked = pd.concat([x.reset_index(drop=True) for x in results], ignore_index=True)
+        inverse = np.empty_like(self.order)
+        inverse[self.order] = np.arange(self.order.size)
+        panel = stacked.iloc[inverse]
+        panel.index = self.index
+        return _copy_attributes(results[0], panel)
+
+
+def _copy_attributes(source, target):
+    """Copies the name and category of an indicator result."""
+    name = source.name if isinstance(source, pd.Series) else vars(source).get('name')
+    if name is not None:
+        target.name = name
+    if 'category' in vars(source):
+        target.category = source.category
+    return target
+
+
+def panel(indicator, **kwargs):
+    """Panel Mode
+
+    Computes an indicator for every symbol of a long format panel, a Series
+    or DataFrame with a (symbol, date) MultiIndex.  Rolling windows and
+    recursive state start over at each symbol and the result is aligned to
+    the panel's index.  The rows of each symbol must be in chronological
+    order; the symbols may be interleaved.
+
+    Most indicators compute all the symbols in one vectorized pass over a
+    (bars, symbols) frame where row i holds the i-th bar of every symbol.
+    The others are computed symbol by symbol: dema, massi, t3, tema and trix,
+    whose EMA cascades are 1D, and ichimoku, whose forward spans are indexed
+    per symbol.
+
+    The 'ta' extension uses it for DataFrames with a MultiIndex.
+
+    >>> df = df.set_index(['symbol', 'date'])
+    >>> df.ta.rsi(append=True)
+    >>> ta.panel(ta.rsi, close=df['close'], length=14)
+
+    Args:
+        indicator (function): The indicator, e.g. ta.rsi
+        kwargs: The indicator's arguments.  Series arguments must share the
+            panel's MultiIndex.
+
+    Returns:
+        The indicator's Series or DataFrame on the panel's index.  For
+        Ichimoku, the span DataFrames are returned in a dict by symbol.
+    """
+    columns = {k: v for k, v in kwargs.items() if isinstance(v, pd.Series)}
+    if len(columns) == 0:
+        return indicator(**kwargs)
+    layout = _PanelLayout(next(iter(columns.values())).index)
+
+    if indicator.__name__ in _PANEL_VECTORIZED:
+        wide = {k: layout.to_wide(v) for k, v in columns.items()}
+        return layout.from_wide(indicator(**{**kwargs, **wide}))
+
+    dates = layout.index.get_level_values(-1)
+    results, extras = [], {}
+    for code, symbol in enumerate(layout.symbols):
+        rows = layout.rows(code)
+        symbol_columns = {k: pd.Series(v.values[rows], index=dates[rows], name=v.name) for k, v in columns.items()}
+        result = indicator(**{**kwargs, **symbol_columns})
+        if isinstance(result, tuple):
+            result, extras[symbol] = result[0], result[1]
+        results.append(result)
+
+    result = layout.from_symbols(results)
+    return (result, extras) if len(extras) else result
+
+
+
+# The indicator modules are imported by the first DataFrame extension, not by
+# 'import ta', see _import_indicators().
+_INDICATOR_MODULES = ['momentum', 'overlap', 'performance', 'statistics', 'trend', 'volatility', 'volume']
+_INDICATORS_IMPORTED = False
+
+
+def _import_indicators():
+    """Binds the indicators into this module, as 'from .momentum import *'
+    et al would, the first time it is called.  Names this module defines
+    itself take precedence."""
+    global _INDICATORS_IMPORTED
+    if _INDICATORS_IMPORTED: return
+
+    namespace = globals()
+    for name in reversed(_INDICATOR_MODULES):
+        module = import_module(f'.{name}', __package__)
+        for k, v in vars(module).items():
+            if not k.startswith('_'):
+                namespace.setdefault(k, v)
+    _INDICATORS_IMPORTED = True
+
+
+
 class BasePandasObject(PandasObject):
     """Simple PandasObject Extension
 
@@ -24,6 +428,7 @@ class BasePandasObject(PandasObject):
         df (pd.DataFrame): Extends Pandas DataFrame
     """
     def __init__(self, df, **kwargs):
+        _import_indicators()
         if df.empty: return
 
         if len(df.columns) > 0:
@@ -64,6 +469,7 @@ class AnalysisIndicators(BasePandasObject):
             kind to lowercase before calling.
         timed (bool, optional): Default: False.  Curious about the execution
             speed?  Well it's not ground breaking, but you can enable with True.
+            For metrics of every indicator call, see ta.instrumentation.
         kwargs: Extension specific modifiers.
             append (bool, optional):  Default: False.  When True, it appends to
             result column(s) of the indicator onto the DataFrame.
@@ -114,13 +520,13 @@ class AnalysisIndicators(BasePandasObject):
                 fn = getattr(self, kind)
 
                 if timed:
-                    stime = time.time()
+                    stime = time.perf_counter()
 
                 # Run the indicator
                 indicator = fn(**kwargs)
 
                 if timed:
-                    time_diff = time.time() - stime
+                    time_diff = time.perf_counter() - stime
                     ms = time_diff * 1000
                     indicator.timed = f"{ms:2.3f} ms ({time_diff:2.3f} s)"
 
@@ -137,20 +543,33 @@ class AnalysisIndicators(BasePandasObject):
 
 
     def _append(self, result=None, **kwargs):
-        """Appends a Pandas Series or DataFrame columns to self._df."""
+        """Appends a Pandas Series or DataFrame columns to self._df, or stages
+        them while a stage() of self._df is active."""
         if 'append' in kwargs and kwargs['append']:
             df = self._df
             if df is None or result is None: return
-            else:                
-                if isinstance(result, pd.DataFrame):
-                    for i, column in enumerate(result.columns):
-                        df[column] = result.iloc[:,i]
-                else:
-                    df[result.name] = result
+            else:
+                for stage in reversed(_APPEND_STAGES):
+                    if stage.df is df:
+                        stage.results.append(result)
+                        return
+                _commit(df, [result], consolidate=False)
+
+
+    def _compute(self, indicator, **kwargs):
+        """Runs the indicator, through the IndicatorCache when enabled.  For a
+        DataFrame with a MultiIndex, it is run in panel mode."""
+        if isinstance(self._df.index, pd.MultiIndex):
+            indicator, kwargs = panel, dict(kwargs, indicator=indicator)
+        if indicator_cache.enabled:
+            indicator, kwargs = indicator_cache, dict(kwargs, indicator=indicator)
+        return indicator(**kwargs)
 
 
     def _get_column(self, series, default):
-        """Attempts to get the correct series or 'column' and return it."""
+        """Attempts to get the correct series or 'column' and return it.  An
+        exact name is returned as df[name], the other names are resolved once
+        until the columns change (see _ColumnCache)."""
         df = self._df
         if df is None: return
 
@@ -159,20 +578,91 @@ class AnalysisIndicators(BasePandasObject):
             return series
         # Apply default if no series nor a default.
         elif series is None or default is None:
-            return df[default]
+            name = default
         # Ok.  So it's a str.
         elif isinstance(series, str):
-            # Return the df column since it's in there.
-            if series in df.columns:
-                return df[series]
-            else:
-                # Attempt to match the 'series' because it was likely misspelled.
-                matches = df.columns.str.match(series, case=False)
-                match = [i for i, x in enumerate(matches) if x]
-                # If found, awesome.  Return it or return the 'series'.
-                NOT_FOUND = f"[X] Ooops!!!: It's {series not in df.columns}, the series '{series}' not in {', '.join(list(df.columns))}"
-                return df.iloc[:,match[0]] if len(match) else print(NOT_FOUND)
+            name = series
+        else:
+            return
+
+        if name in df.columns:
+            column, cache = name, None
+        else:
+            cache, key = _column_cache(df), (name, name is series)
+            if key not in cache.resolved:
+                cache.resolved[key] = self._resolve_column(name, cache.aliases, match=name is series)
+            column = cache.resolved[key]
+        if column is None:
+            if series is None or default is None:
+                return df[default] # Raises the KeyError
+            NOT_FOUND = f"[X] Ooops!!!: It's {series not in df.columns}, the series '{series}' not in {', '.join(list(df.columns))}"
+            return print(NOT_FOUND)
+
+        result = df[column]
+        values = result.values
+        if not isinstance(values, np.ndarray) or values.flags.c_contiguous:
+            return result
+
+        # A strided column is copied once per backing array.  The cached
+        # values keep that array alive, so its address is not reused.
+        if cache is None:
+            cache = _column_cache(df)
+        cached = cache.series.get(column)
+        if cached is not None and _same_buffer(cached[1], values):
+            return cached[0]
+        result = pd.Series(np.ascontiguousarray(values), index=result.index, name=result.name)
+        cache.series[column] = (result, values)
+        return result
+
+
+    def _resolve_column(self, name, aliases, match=False):
+        """The column 'name' refers to: itself, its case insensitive alias,
+        e.g. 'Close' for 'close', or if 'match', the first column it matches
+        case insensitively, since it was likely misspelled.  None if there is
+        none."""
+        df = self._df
+        if name in df.columns:
+            return name
+        if isinstance(name, str) and name.lower() in aliases:
+            return aliases[name.lower()]
+        if not match or not isinstance(name, str):
+            return None
+
+        # Attempt to match the 'series' because it was likely misspelled.
+        matches = df.columns.str.match(name, case=False)
+        match = [i for i, x in enumerate(matches) if x]
+        return df.columns[match[0]] if len(match) else None
+        
+
+    def cache(self, enabled=None, max_bytes=None):
+        """Cache
+
+        Enables or disables the IndicatorCache of the 'ta' extension or
+        changes its memory budget.  The cache is shared by all DataFrames.
         
+        >>> df.ta.cache(True)
+        >>> df.ta.cache(max_bytes=64 * 2**20)
+        >>> df.ta.cache().stats()
+        >>> df.ta.cache(False)
+
+        Args:
+            enabled (bool): Default: None.  If True, indicator results are
+                cached.  If False, caching stops and the cache is cleared.
+                If None, it is left as is.
+            max_bytes (int): Default: None.  Memory budget for the cached
+                results.  The initial budget is 256 MB.
+
+        Returns:
+            The IndicatorCache, for its stats() or clear().
+        """
+        if max_bytes is not None:
+            indicator_cache.resize(max_bytes)
+        if enabled is not None:
+            indicator_cache.enabled = bool(enabled)
+            if not indicator_cache.enabled:
+                indicator_cache.clear()
+        return indicator_cache
+
 
     def constants(self, apply, min_range=-100, max_range=100, every=10):
         """Constants
@@ -207,7 +697,7 @@ class AnalysisIndicators(BasePandasObject):
 
     def indicators(self):
         """Indicator list"""
-        helper_methods = ['indicators', 'constants'] # Public non-indicator methods
+        helper_methods = ['indicators', 'cache', 'constants', 'preallocate', 'stage', 'strategy'] # Public non-indicator methods
         ta_indicators = list((x for x in dir(pd.DataFrame().ta) if not x.startswith('_') and not x.endswith('_')))
         [ta_indicators.remove(x) for x in helper_methods]  # Removes helper methods
         abbr_list = ', '.join(ta_indicators)
@@ -215,18 +705,117 @@ class AnalysisIndicators(BasePandasObject):
         print(f"{header}Total Indicators: {len(ta_indicators)}\nAbbreviations:\n    {abbr_list}")
 
 
+    def preallocate(self, columns, dtype=None):
+        """Preallocate
+
+        Adds the output columns of a known feature set, filled with NaN, as
+        one contiguous block.  Indicators called later with append=True then
+        write their results into the existing memory.
+
+        >>> df.ta.preallocate(['RSI_14', 'MACD_12_26_9', 'MACDH_12_26_9', 'MACDS_12_26_9'])
+        >>> df.ta.rsi(append=True)
+
+        Args:
+            columns (list): The column names.  Those already in the DataFrame
+                are left as they are.
+            dtype (str): Default: None.  float32 or float64, the current dtype
+                if None (see ta.set_dtype).
+
+        Returns:
+            Returns nothing to the user.
+        """
+        df = self._df
+        columns = [x for x in dict.fromkeys(columns) if x not in df.columns]
+        if len(columns) == 0: return
+
+        dtype = dtype if dtype is not None else get_dtype()
+        block = pd.DataFrame(np.full((df.shape[0], len(columns)), np.nan, dtype=dtype), index=df.index, columns=columns)
+        _join(df, block)
+
+
+    def stage(self):
+        """Stage
+
+        Stages the results of the indicators called with append=True inside
+        the context and appends them all at once when it exits, instead of
+        one column at a time.
+
+        >>> with df.ta.stage():
+        ...     df.ta.rsi(append=True)
+        ...     df.ta.bbands(append=True)
+
+        Returns:
+            An AppendStage context manager.
+        """
+        return AppendStage(self._df)
+
+
+    def strategy(self, ta=None, append=True, **kwargs):
+        """Strategy
+
+        Runs a list of indicators as one batch.  The building blocks they have
+        in common, like hlc3 in cci, mfi and kc, true_range in atr, adx, natr
+        and vortex or the fast and slow EMAs in macd and apo, are computed only
+        once for the whole batch (see IntermediateCache).  All the results are
+        then appended onto the DataFrame in one step.
+
+        >>> df.ta.strategy(['rsi', 'cci', 'atr', {'kind': 'macd', 'fast': 8}])
+        >>> df.ta.strategy([{'kind': 'sma', 'length': 50}, {'kind': 'sma', 'length': 200}], close='Close')
+
+        Args:
+            ta (list): Default: None.  The indicators to run.  Either the name
+                of the indicator or a dict with the name under 'kind' and its
+                arguments.
+            append (bool): Default: True.  When True, it appends the result
+                columns of all the indicators onto the DataFrame.
+            kwargs: Arguments passed to every indicator, for example column
+                names like close='Close'.  A spec's own arguments take
+                precedence.
+
+        Returns:
+            A Pandas DataFrame with the result columns of all the indicators.
+            For Ichimoku, only the Ichimoku DataFrame is included.
+        """
+        helper_methods = ['indicators', 'cache', 'constants', 'preallocate', 'stage', 'strategy']
+        specs = []
+        for spec in ta if ta is not None else []:
+            spec = {'kind': spec} if isinstance(spec, str) else dict(spec)
+            kind = f"{spec.pop('kind', '')}".lower()
+            if kind.startswith('_') or kind in helper_methods or not hasattr(self, kind):
+                raise AttributeError(f"[X] Oops!!!: '{kind}' is not an indicator")
+            params = {**kwargs, **spec}
+            params.pop('append', None)
+            specs.append((getattr(self, kind), params))
+
+        results = []
+        with IntermediateCache():
+            for fn, params in specs:
+                result = fn(**params)
+                if isinstance(result, tuple):
+                    result = result[0]
+                results.append(result)
+
+        if len(results) == 0: return
+        result = pd.concat(results, axis=1)
+        result = result.loc[:, ~result.columns.duplicated(keep='last')]
+
+        if append:
+            _commit(self._df, [result])
+        return result
+
+
 
     def ao(self, high=None, low=None, fast=None, slow=None, offset=None, **kwargs):
         high = self._get_column(high, 'high')
         low = self._get_column(low, 'low')
-        result = ao(high=high, low=low, fast=fast, slow=slow, offset=offset, **kwargs)
+        result = self._compute(ao, high=high, low=low, fast=fast, slow=slow, offset=offset, **kwargs)
         self._append(result, **kwargs)
         return result
 
 
     def apo(self, close=None, fast=None, slow=None, offset=None, **kwargs):
         close = self._get_column(close, 'close')
-        result = apo(close=close, fast=fast, slow=slow, offset=offset, **kwargs)
+        result = self._compute(apo, close=close, fast=fast, slow=slow, offset=offset, **kwargs)
         self._append(result, **kwargs)
         return result
 
@@ -236,7 +825,7 @@ class AnalysisIndicators(BasePandasObject):
         high = self._get_column(high, 'high')
         low = self._get_column(low, 'low')
         close = self._get_column(close, 'close')
-        result = bop(open_=open_, high=high, low=low, close=close, percentage=percentage, offset=offset, **kwargs)
+        result = self._compute(bop, open_=open_, high=high, low=low, close=close, percentage=percentage, offset=offset, **kwargs)
         self._append(result, **kwargs)
         return result
 
@@ -245,35 +834,35 @@ class AnalysisIndicators(BasePandasObject):
         high = self._get_column(high, 'high')
         low = self._get_column(low, 'low')
         close = self._get_column(close, 'close')
-        result = cci(high=high, low=low, close=close, length=length, c=c, offset=offset, **kwargs)
+        result = self._compute(cci, high=high, low=low, close=close, length=length, c=c, offset=offset, **kwargs)
         self._append(result, **kwargs)
         return result
 
 
     def cmo(self, close=None, length=None, drift=None, offset=None, **kwargs):
         close = self._get_column(close, 'close')
-        result = cmo(close=close, length=length, drift=drift, offset=offset, **kwargs)
+        result = self._compute(cmo, close=close, length=length, drift=drift, offset=offset, **kwargs)
         self._append(result, **kwargs)
         return result
 
 
     def coppock(self, close=None, length=None, fast=None, slow=None, offset=None, **kwargs):
         close = self._get_column(close, 'close')
-        result = coppock(close=close, length=length, fast=fast, slow=slow, offset=offset, **kwargs)
+        result = self._compute(coppock, close=close, length=length, fast=fast, slow=slow, offset=offset, **kwargs)
         self._append(result, **kwargs)
         return result
 
 
     def kst(self, close=None, roc1=None, roc2=None, roc3=None, roc4=None, sma1=None, sma2=None, sma3=None, sma4=None, signal=None, offset=None, **kwargs):
         close = self._get_column(close, 'close')
-        result = kst(close=close, roc1=roc1, roc2=roc2, roc3=roc3, roc4=roc4, sma1=sma1, sma2=sma2, sma3=sma3, sma4=sma4, signal=signal, offset=offset, **kwargs)
+        result = self._compute(kst, close=close, roc1=roc1, roc2=roc2, roc3=roc3, roc4=roc4, sma1=sma1, sma2=sma2, sma3=sma3, sma4=sma4, signal=signal, offset=offset, **kwargs)
         self._append(result, **kwargs)
         return result
 
 
     def macd(self, close=None, fast=None, slow=None, signal=None, offset=None, **kwargs):
         close = self._get_column(close, 'close')
-        result = macd(close=close, fast=fast, slow=slow, signal=signal, offset=offset, **kwargs)
+        result = self._compute(macd, close=close, fast=fast, slow=slow, signal=signal, offset=offset, **kwargs)
         self._append(result, **kwargs)
         return result
 
@@ -281,35 +870,35 @@ class AnalysisIndicators(BasePandasObject):
     def massi(self, high=None, low=None, fast=None, slow=None, offset=None, **kwargs):
         high = self._get_column(high, 'high')
         low = self._get_column(low, 'low')
-        result = massi(high=high, low=low, fast=fast, slow=slow, offset=offset, **kwargs)
+        result = self._compute(massi, high=high, low=low, fast=fast, slow=slow, offset=offset, **kwargs)
         self._append(result, **kwargs)
         return result
 
 
     def mom(self, close=None, length=None, offset=None, **kwargs):
         close = self._get_column(close, 'close')
-        result = mom(close=close, length=length, offset=offset, **kwargs)
+        result = self._compute(mom, close=close, length=length, offset=offset, **kwargs)
         self._append(result, **kwargs)
         return result
 
 
     def ppo(self, close=None, fast=None, slow=None, percentage=True, offset=None, **kwargs):
         close = self._get_column(close, 'close')
-        result = ppo(close=close, fast=fast, slow=slow, percentage=percentage, offset=offset, **kwargs)
+        result = self._compute(ppo, close=close, fast=fast, slow=slow, percentage=percentage, offset=offset, **kwargs)
         self._append(result, **kwargs)
         return result
 
 
     def roc(self, close=None, length=None, offset=None, **kwargs):
         close = self._get_column(close, 'close')
-        result = roc(close=close, length=length, offset=offset, **kwargs)
+        result = self._compute(roc, close=close, length=length, offset=offset, **kwargs)
         self._append(result, **kwargs)
         return result
 
 
     def rsi(self, close=None, length=None, drift=None, offset=None, **kwargs):
         close = self._get_column(close, 'close')
-        result = rsi(close=close, length=length, drift=drift, offset=offset, **kwargs)
+        result = self._compute(rsi, close=close, length=length, drift=drift, offset=offset, **kwargs)
         self._append(result, **kwargs)
         return result
 
@@ -318,21 +907,21 @@ class AnalysisIndicators(BasePandasObject):
         high = self._get_column(high, 'high')
         low = self._get_column(low, 'low')
         close = self._get_column(close, 'close')
-        result = stoch(high=high, low=low, close=close, fast_k=fast_k, slow_k=slow_k, slow_d=slow_d, offset=offset, **kwargs)
+        result = self._compute(stoch, high=high, low=low, close=close, fast_k=fast_k, slow_k=slow_k, slow_d=slow_d, offset=offset, **kwargs)
         self._append(result, **kwargs)
         return result
 
 
     def trix(self, close=None, length=None, drift=None, offset=None, **kwargs):
         close = self._get_column(close, 'close')
-        result = trix(close=close, length=length, drift=drift, offset=offset, **kwargs)
+        result = self._compute(trix, close=close, length=length, drift=drift, offset=offset, **kwargs)
         self._append(result, **kwargs)
         return result
 
 
     def tsi(self, close=None, fast=None, slow=None, drift=None, offset=None, **kwargs):
         close = self._get_column(close, 'close')
-        result = tsi(close=close, fast=fast, slow=slow, drift=drift, offset=offset, **kwargs)
+        result = self._compute(tsi, close=close, fast=fast, slow=slow, drift=drift, offset=offset, **kwargs)
         self._append(result, **kwargs)
         return result
 
@@ -341,7 +930,7 @@ class AnalysisIndicators(BasePandasObject):
         high = self._get_column(high, 'high')
         low = self._get_column(low, 'low')
         close = self._get_column(close, 'close')
-        result = uo(high=high, low=low, close=close, fast=fast, medium=medium, slow=slow, fast_w=fast_w, medium_w=medium_w, slow_w=slow_w, drift=drift, offset=offset, **kwargs)
+        result = self._compute(uo, high=high, low=low, close=close, fast=fast, medium=medium, slow=slow, fast_w=fast_w, medium_w=medium_w, slow_w=slow_w, drift=drift, offset=offset, **kwargs)
         self._append(result, **kwargs)
         return result
 
@@ -350,7 +939,7 @@ class AnalysisIndicators(BasePandasObject):
         high = self._get_column(high, 'high')
         low = self._get_column(low, 'low')
         close = self._get_column(close, 'close')
-        result = willr(high=high, low=low, close=close, length=length, percentage=percentage, offset=offset, **kwargs)
+        result = self._compute(willr, high=high, low=low, close=close, length=length, percentage=percentage, offset=offset, **kwargs)
         self._append(result, **kwargs)
         return result
 
@@ -358,21 +947,21 @@ class AnalysisIndicators(BasePandasObject):
 
     def dema(self, close=None, length=None, offset=None, **kwargs):
         close = self._get_column(close, 'close')
-        result = dema(close=close, length=length, offset=offset, **kwargs)
+        result = self._compute(dema, close=close, length=length, offset=offset, **kwargs)
         self._append(result, **kwargs)
         return result
 
 
     def ema(self, close=None, length=None, offset=None, adjust=None, **kwargs):
         close = self._get_column(close, 'close')
-        result = ema(close=close, length=length, offset=offset, adjust=adjust, **kwargs)
+        result = self._compute(ema, close=close, length=length, offset=offset, adjust=adjust, **kwargs)
         self._append(result, **kwargs)
         return result
 
 
     def fwma(self, close=None, length=None, offset=None, **kwargs):
         close = self._get_column(close, 'close')
-        result = fwma(close=close, length=length, offset=offset, **kwargs)
+        result = self._compute(fwma, close=close, length=length, offset=offset, **kwargs)
         self._append(result, **kwargs)
         return result
 
@@ -380,7 +969,7 @@ class AnalysisIndicators(BasePandasObject):
     def hl2(self, high=None, low=None, offset=None, **kwargs):
         high = self._get_column(high, 'high')
         low = self._get_column(low, 'low')
-        result = hl2(high=high, low=low, offset=offset, **kwargs)
+        result = self._compute(hl2, high=high, low=low, offset=offset, **kwargs)
         self._append(result, **kwargs)
         return result
 
@@ -389,14 +978,14 @@ class AnalysisIndicators(BasePandasObject):
         high = self._get_column(high, 'high')
         low = self._get_column(low, 'low')
         close = self._get_column(close, 'close')
-        result = hlc3(high=high, low=low, close=close, offset=offset, **kwargs)
+        result = self._compute(hlc3, high=high, low=low, close=close, offset=offset, **kwargs)
         self._append(result, **kwargs)
         return result
 
 
     def hma(self, close=None, length=None, offset=None, **kwargs):
         close = self._get_column(close, 'close')
-        result = hma(close=close, length=length, offset=offset, **kwargs)
+        result = self._compute(hma, close=close, length=length, offset=offset, **kwargs)
         self._append(result, **kwargs)
         return result
 
@@ -405,14 +994,14 @@ class AnalysisIndicators(BasePandasObject):
         high = self._get_column(high, 'high')
         low = self._get_column(low, 'low')
         close = self._get_column(close, 'close')
-        result, span = ichimoku(high=high, low=low, close=close, tenkan=tenkan, kijun=kijun, senkou=senkou, offset=offset, **kwargs)
+        result, span = self._compute(ichimoku, high=high, low=low, close=close, tenkan=tenkan, kijun=kijun, senkou=senkou, offset=offset, **kwargs)
         self._append(result, **kwargs)
         return result, span
 
 
     def midpoint(self, close=None, length=None, offset=None, **kwargs):
         close = self._get_column(close, 'close')
-        result = midpoint(close=close, length=length, offset=offset, **kwargs)
+        result = self._compute(midpoint, close=close, length=length, offset=offset, **kwargs)
         self._append(result, **kwargs)        
         return result
 
@@ -420,7 +1009,7 @@ class AnalysisIndicators(BasePandasObject):
     def midprice(self, high=None, low=None, length=None, offset=None, **kwargs):
         high = self._get_column(high, 'high')
         low = self._get_column(low, 'low')
-        result = midprice(high=high, low=low, length=length, offset=offset, **kwargs)
+        result = self._compute(midprice, high=high, low=low, length=length, offset=offset, **kwargs)
         self._append(result, **kwargs)        
         return result
 
@@ -430,49 +1019,49 @@ class AnalysisIndicators(BasePandasObject):
         high = self._get_column(high, 'high')
         low = self._get_column(low, 'low')
         close = self._get_column(close, 'close')
-        result = ohlc4(open_=open_, high=high, low=low, close=close, offset=offset, **kwargs)
+        result = self._compute(ohlc4, open_=open_, high=high, low=low, close=close, offset=offset, **kwargs)
         self._append(result, **kwargs)
         return result
 
 
     def pwma(self, close=None, length=None, offset=None, **kwargs):
         close = self._get_column(close, 'close')
-        result = pwma(close=close, length=length, offset=offset, **kwargs)
+        result = self._compute(pwma, close=close, length=length, offset=offset, **kwargs)
         self._append(result, **kwargs)
         return result
 
 
     def rma(self, close=None, length=None, offset=None, **kwargs):
         close = self._get_column(close, 'close')
-        result = rma(close=close, length=length, offset=offset, **kwargs)
+        result = self._compute(rma, close=close, length=length, offset=offset, **kwargs)
         self._append(result, **kwargs)
         return result
 
 
     def sma(self, close=None, length=None, offset=None, **kwargs):
         close = self._get_column(close, 'close')
-        result = sma(close=close, length=length, offset=offset, **kwargs)
+        result = self._compute(sma, close=close, length=length, offset=offset, **kwargs)
         self._append(result, **kwargs)
         return result
 
 
     def t3(self, close=None, length=None, a=None, offset=None, **kwargs):
         close = self._get_column(close, 'close')
-        result = t3(close=close, length=length, a=a, offset=offset, **kwargs)
+        result = self._compute(t3, close=close, length=length, a=a, offset=offset, **kwargs)
         self._append(result, **kwargs)
         return result
 
 
     def tema(self, close=None, length=None, offset=None, **kwargs):
         close = self._get_column(close, 'close')
-        result = tema(close=close, length=length, offset=offset, **kwargs)
+        result = self._compute(tema, close=close, length=length, offset=offset, **kwargs)
         self._append(result, **kwargs)
         return result
 
 
     def trima(self, close=None, length=None, offset=None, **kwargs):
         close = self._get_column(close, 'close')
-        result = trima(close=close, length=length, offset=offset, **kwargs)
+        result = self._compute(trima, close=close, length=length, offset=offset, **kwargs)
         self._append(result, **kwargs)
         return result
 
@@ -482,7 +1071,7 @@ class AnalysisIndicators(BasePandasObject):
         low = self._get_column(low, 'low')
         close = self._get_column(close, 'close')
         volume = self._get_column(volume, 'volume')
-        result = vwap(high=high, low=low, close=close, volume=volume, offset=offset, **kwargs)
+        result = self._compute(vwap, high=high, low=low, close=close, volume=volume, offset=offset, **kwargs)
         self._append(result, **kwargs)        
         return result
 
@@ -490,14 +1079,14 @@ class AnalysisIndicators(BasePandasObject):
     def vwma(self, close=None, volume=None, length=None, offset=None, **kwargs):
         close = self._get_column(close, 'close')
         volume = self._get_column(volume, 'volume')
-        result = vwma(close=close, volume=close, length=length, offset=offset, **kwargs)
+        result = self._compute(vwma, close=close, volume=close, length=length, offset=offset, **kwargs)
         self._append(result, **kwargs)
         return result
 
 
     def wma(self, close=None, length=None, offset=None, **kwargs):
         close = self._get_column(close, 'close')
-        result = wma(close=close, length=length, offset=offset, **kwargs)
+        result = self._compute(wma, close=close, length=length, offset=offset, **kwargs)
         self._append(result, **kwargs)
         return result
 
@@ -505,14 +1094,14 @@ class AnalysisIndicators(BasePandasObject):
 
     def log_return(self, close=None, length=None, cumulative=False, percent=False, offset=None, **kwargs):
         close = self._get_column(close, 'close')
-        result = log_return(close=close, length=length, cumulative=cumulative, percent=percent, offset=offset, **kwargs)
+        result = self._compute(log_return, close=close, length=length, cumulative=cumulative, percent=percent, offset=offset, **kwargs)
         self._append(result, **kwargs)
         return result
 
 
     def percent_return(self, close=None, length=None, cumulative=False, percent=False, offset=None, **kwargs):
         close = self._get_column(close, 'close')
-        result = percent_return(close=close, length=length, cumulative=cumulative, percent=percent, offset=offset, **kwargs)
+        result = self._compute(percent_return, close=close, length=length, cumulative=cumulative, percent=percent, offset=offset, **kwargs)
         self._append(result, **kwargs)
         return result
 
@@ -520,14 +1109,14 @@ class AnalysisIndicators(BasePandasObject):
 
     def kurtosis(self, close=None, length=None, offset=None, **kwargs):
         close = self._get_column(close, 'close')
-        result = kurtosis(close=close, length=length, offset=offset, **kwargs)
+        result = self._compute(kurtosis, close=close, length=length, offset=offset, **kwargs)
         self._append(result, **kwargs)
         return result
 
 
     def mad(self, close=None, length=None, offset=None, **kwargs):
         close = self._get_column(close, 'close')
-        result = mad(close=close, length=length, offset=offset, **kwargs)
+        result = self._compute(mad, close=close, length=length, offset=offset, **kwargs)
         self._append(result, **kwargs)
         return result
 
@@ -537,42 +1126,42 @@ class AnalysisIndicators(BasePandasObject):
 
     def median(self, close=None, length=None, offset=None, **kwargs):
         close = self._get_column(close, 'close')
-        result = median(close=close, length=length, offset=offset, **kwargs)
+        result = self._compute(median, close=close, length=length, offset=offset, **kwargs)
         self._append(result, **kwargs)
         return result
 
 
     def quantile(self, close=None, length=None, q=None, offset=None, **kwargs):
         close = self._get_column(close, 'close')
-        result = quantile(close=close, length=length, q=q, offset=offset, **kwargs)
+        result = self._compute(quantile, close=close, length=length, q=q, offset=offset, **kwargs)
         self._append(result, **kwargs)
         return result
 
 
     def skew(self, close=None, length=None, offset=None, **kwargs):
         close = self._get_column(close, 'close')
-        result = skew(close=close, length=length, offset=offset, **kwargs)
+        result = self._compute(skew, close=close, length=length, offset=offset, **kwargs)
         self._append(result, **kwargs)
         return result
 
 
     def stdev(self, close=None, length=None, offset=None, **kwargs):
         close = self._get_column(close, 'close')
-        result = stdev(close=close, length=length, offset=offset, **kwargs)
+        result = self._compute(stdev, close=close, length=length, offset=offset, **kwargs)
         self._append(result, **kwargs)
         return result
 
 
     def variance(self, close=None, length=None, offset=None, **kwargs):
         close = self._get_column(close, 'close')
-        result = variance(close=close, length=length, offset=offset, **kwargs)
+        result = self._compute(variance, close=close, length=length, offset=offset, **kwargs)
         self._append(result, **kwargs)
         return result
 
 
     def zscore(self, close=None, length=None, std=None, offset=None, **kwargs):
         close = self._get_column(close, 'close')
-        result = zscore(close=close, length=length, std=std, offset=offset, **kwargs)
+        result = self._compute(zscore, close=close, length=length, std=std, offset=offset, **kwargs)
         self._append(result, **kwargs)
         return result
 
@@ -582,35 +1171,35 @@ class AnalysisIndicators(BasePandasObject):
         high = self._get_column(high, 'high')
         low = self._get_column(low, 'low')
         close = self._get_column(close, 'close')
-        result = adx(high=high, low=low, close=close, drift=drift, offset=offset, **kwargs)
+        result = self._compute(adx, high=high, low=low, close=close, drift=drift, offset=offset, **kwargs)
         self._append(result, **kwargs)
         return result
 
 
     def aroon(self, close=None, length=None, offset=None, **kwargs):
         close = self._get_column(close, 'close')
-        result = aroon(close=close, length=length, offset=offset, **kwargs)
+        result = self._compute(aroon, close=close, length=length, offset=offset, **kwargs)
         self._append(result, **kwargs)
         return result
 
 
     def decreasing(self, close=None, length=None, asint=True, offset=None, **kwargs):
         close = self._get_column(close, 'close')
-        result = decreasing(close=close, length=length, asint=asint, offset=offset, **kwargs)
+        result = self._compute(decreasing, close=close, length=length, asint=asint, offset=offset, **kwargs)
         self._append(result, **kwargs)
         return result
 
 
     def dpo(self, close=None, length=None, centered=True, offset=None, **kwargs):
         close = self._get_column(close, 'close')
-        result = dpo(close=close, length=length, centered=centered, offset=offset, **kwargs)
+        result = self._compute(dpo, close=close, length=length, centered=centered, offset=offset, **kwargs)
         self._append(result, **kwargs)
         return result
 
 
     def increasing(self, close=None, length=None, asint=True, offset=None, **kwargs):
         close = self._get_column(close, 'close')
-        result = increasing(close=close, length=length, asint=asint, offset=offset, **kwargs)
+        result = self._compute(increasing, close=close, length=length, asint=asint, offset=offset, **kwargs)
         self._append(result, **kwargs)
         return result
 
@@ -619,7 +1208,7 @@ class AnalysisIndicators(BasePandasObject):
         high = self._get_column(high, 'high')
         low = self._get_column(low, 'low')
         close = self._get_column(close, 'close')
-        result = vortex(high=high, low=low, close=close, drift=drift, offset=offset, **kwargs)
+        result = self._compute(vortex, high=high, low=low, close=close, drift=drift, offset=offset, **kwargs)
         self._append(result, **kwargs)
         return result
 
@@ -629,7 +1218,7 @@ class AnalysisIndicators(BasePandasObject):
         high = self._get_column(high, 'high')
         low = self._get_column(low, 'low')
         close = self._get_column(close, 'close')
-        result = accbands(high=high, low=low, close=close, length=length, c=c, mamode=mamode, offset=offset, **kwargs)
+        result = self._compute(accbands, high=high, low=low, close=close, length=length, c=c, mamode=mamode, offset=offset, **kwargs)
         self._append(result, **kwargs)
         return result
 
@@ -638,21 +1227,21 @@ class AnalysisIndicators(BasePandasObject):
         high = self._get_column(high, 'high')
         low = self._get_column(low, 'low')
         close = self._get_column(close, 'close')
-        result = atr(high=high, low=low, close=close, length=length, mamode=mamode, offset=offset, **kwargs)
+        result = self._compute(atr, high=high, low=low, close=close, length=length, mamode=mamode, offset=offset, **kwargs)
         self._append(result, **kwargs)
         return result
 
 
     def bbands(self, close=None, length=None, stdev=None, mamode=None, offset=None, **kwargs):
         close = self._get_column(close, 'close')
-        result = bbands(close=close, length=length, stdev=stdev, mamode=mamode, offset=offset, **kwargs)
+        result = self._compute(bbands, close=close, length=length, stdev=stdev, mamode=mamode, offset=offset, **kwargs)
         self._append(result, **kwargs)
         return result
 
 
     def donchian(self, close=None, length=None, offset=None, **kwargs):
         close = self._get_column(close, 'close')
-        result = donchian(close=close, length=length, offset=offset, **kwargs)
+        result = self._compute(donchian, close=close, length=length, offset=offset, **kwargs)
         self._append(result, **kwargs)
         return result
 
@@ -661,7 +1250,7 @@ class AnalysisIndicators(BasePandasObject):
         high = self._get_column(high, 'high')
         low = self._get_column(low, 'low')
         close = self._get_column(close, 'close')
-        result = kc(high=high, low=low, close=close, length=length, scalar=scalar, mamode=mamode, offset=offset, **kwargs)
+        result = self._compute(kc, high=high, low=low, close=close, length=length, scalar=scalar, mamode=mamode, offset=offset, **kwargs)
         self._append(result, **kwargs)
         return result
 
@@ -670,7 +1259,7 @@ class AnalysisIndicators(BasePandasObject):
         high = self._get_column(high, 'high')
         low = self._get_column(low, 'low')
         close = self._get_column(close, 'close')
-        result = natr(high=high, low=low, close=close, length=length, mamode=mamode, offset=offset, **kwargs)
+        result = self._compute(natr, high=high, low=low, close=close, length=length, mamode=mamode, offset=offset, **kwargs)
         self._append(result, **kwargs)
         return result
 
@@ -679,7 +1268,7 @@ class AnalysisIndicators(BasePandasObject):
         high = self._get_column(high, 'high')
         low = self._get_column(low, 'low')
         close = self._get_column(close, 'close')
-        result = true_range(high=high, low=low, close=close, drift=drift, offset=offset, **kwargs)
+        result = self._compute(true_range, high=high, low=low, close=close, drift=drift, offset=offset, **kwargs)
         self._append(result, **kwargs)
         return result
 
@@ -692,7 +1281,7 @@ class AnalysisIndicators(BasePandasObject):
         low = self._get_column(low, 'low')
         close = self._get_column(close, 'close')
         volume = self._get_column(volume, 'volume')
-        result = ad(high=high, low=low, close=close, volume=volume, open_=open_, signed=signed, offset=offset, **kwargs)
+        result = self._compute(ad, high=high, low=low, close=close, volume=volume, open_=open_, signed=signed, offset=offset, **kwargs)
         self._append(result, **kwargs)
         return result
 
@@ -704,7 +1293,7 @@ class AnalysisIndicators(BasePandasObject):
         low = self._get_column(low, 'low')
         close = self._get_column(close, 'close')
         volume = self._get_column(volume, 'volume')
-        result = adosc(high=high, low=low, close=close, volume=volume, open_=open_, fast=fast, slow=slow, signed=signed, offset=offset, **kwargs)
+        result = self._compute(adosc, high=high, low=low, close=close, volume=volume, open_=open_, fast=fast, slow=slow, signed=signed, offset=offset, **kwargs)
         self._append(result, **kwargs)
         return result
 
@@ -716,7 +1305,7 @@ class AnalysisIndicators(BasePandasObject):
         low = self._get_column(low, 'low')
         close = self._get_column(close, 'close')
         volume = self._get_column(volume, 'volume')
-        result = cmf(high=high, low=low, close=close, volume=volume, open_=open_, length=length, offset=offset, **kwargs)
+        result = self._compute(cmf, high=high, low=low, close=close, volume=volume, open_=open_, length=length, offset=offset, **kwargs)
         self._append(result, **kwargs)
         return result
 
@@ -724,7 +1313,7 @@ class AnalysisIndicators(BasePandasObject):
     def efi(self, close=None, volume=None, length=None, mamode=None, offset=None, drift=None, **kwargs):
         close = self._get_column(close, 'close')
         volume = self._get_column(volume, 'volume')
-        result = efi(close=close, volume=volume, length=length, offset=offset, mamode=mamode, drift=drift, **kwargs)
+        result = self._compute(efi, close=close, volume=volume, length=length, offset=offset, mamode=mamode, drift=drift, **kwargs)
         self._append(result, **kwargs)
         return result
 
@@ -734,7 +1323,7 @@ class AnalysisIndicators(BasePandasObject):
         low = self._get_column(low, 'low')
         close = self._get_column(close, 'close')
         volume = self._get_column(volume, 'volume')
-        result = eom(high=high, low=low, close=close, volume=volume, length=length, divisor=divisor, offset=offset, drift=drift, **kwargs)
+        result = self._compute(eom, high=high, low=low, close=close, volume=volume, length=length, divisor=divisor, offset=offset, drift=drift, **kwargs)
         self._append(result, **kwargs)
         return result
 
@@ -744,7 +1333,7 @@ class AnalysisIndicators(BasePandasObject):
         low = self._get_column(low, 'low')
         close = self._get_column(close, 'close')
         volume = self._get_column(volume, 'volume')
-        result = mfi(high=high, low=low, close=close, volume=volume, length=length, drift=drift, offset=offset, **kwargs)
+        result = self._compute(mfi, high=high, low=low, close=close, volume=volume, length=length, drift=drift, offset=offset, **kwargs)
         self._append(result, **kwargs)
         return result
 
@@ -752,7 +1341,7 @@ class AnalysisIndicators(BasePandasObject):
     def nvi(self, close=None, volume=None, length=None, initial=None, signed=True, offset=None, **kwargs):
         close = self._get_column(close, 'close')
         volume = self._get_column(volume, 'volume')
-        result = nvi(close=close, volume=volume, length=length, initial=initial, signed=signed, offset=offset, **kwargs)
+        result = self._compute(nvi, close=close, volume=volume, length=length, initial=initial, signed=signed, offset=offset, **kwargs)
         self._append(result, **kwargs)
         return result
 
@@ -760,7 +1349,15 @@ class AnalysisIndicators(BasePandasObject):
     def obv(self, close=None, volume=None, offset=None, **kwargs):
         close = self._get_column(close, 'close')
         volume = self._get_column(volume, 'volume')
-        result = obv(close=close, volume=volume, offset=offset, **kwargs)
+        result = self._compute(obv, close=close, volume=volume, offset=offset, **kwargs)
+        self._append(result, **kwargs)
+        return result
+
+
+    def pvi(self, close=None, volume=None, length=None, initial=None, offset=None, **kwargs):
+        close = self._get_column(close, 'close')
+        volume = self._get_column(volume, 'volume')
+        result = self._compute(pvi, close=close, volume=volume, length=length, initial=initial, offset=offset, **kwargs)
         self._append(result, **kwargs)
         return result
 
@@ -768,7 +1365,7 @@ class AnalysisIndicators(BasePandasObject):
     def pvol(self, close=None, volume=None, signed=True, offset=None, **kwargs):
         close = self._get_column(close, 'close')
         volume = self._get_column(volume, 'volume')
-        result = pvol(close=close, volume=volume, signed=signed, offset=offset, **kwargs)
+        result = self._compute(pvol, close=close, volume=volume, signed=signed, offset=offset, **kwargs)
         self._append(result, **kwargs)
         return result
 
@@ -776,6 +1373,6 @@ class AnalysisIndicators(BasePandasObject):
     def pvt(self, close=None, volume=None, offset=None, **kwargs):
         close = self._get_column(close, 'close')
         volume = self._get_column(volume, 'volume')
-        result = pvt(close=close, volume=volume, offset=offset, **kwargs)
+        result = self._compute(pvt, close=close, volume=volume, offset=offset, **kwargs)
         self._append(result, **kwargs)
         return result
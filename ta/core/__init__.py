@@ -0,0 +1,25 @@
+# -*- coding: utf-8 -*-
+"""Core Kernels
+
+Array in, array out kernels of every indicator.  They take NumPy arrays,
+time along axis 0, and return arrays (a tuple of them for indicators with
+several outputs, in the order of the indicator's DataFrame columns).  There
+is no index alignment, validation, offset, fill or naming: the indicators
+in ta.overlap, ta.momentum, ... are thin wrappers that pass their Series'
+.values to these kernels once and wrap the result once.
+
+>>> from ta import core
+>>> rsi = core.rsi(close, length=14) # close: ndarray
+>>> macd, histogram, signal = core.macd(close)
+
+Kernels also accept 2D (bars, series) arrays, one column per series, except
+those documented for 1D inputs.  Rolling and exponentially weighted windows
+use Pandas' compiled window routines over the bare arrays.
+"""
+from .momentum import *
+from .overlap import *
+from .performance import *
+from .statistics import *
+from .trend import *
+from .volatility import *
+from .volume import *
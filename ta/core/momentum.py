@@ -0,0 +1,207 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+
+from .overlap import ema, ema_cascade, hlc3, sma, wma
+from .statistics import rolling_mad
+from .utils import as_float, diff, ewm, highest, lowest, pct_change, rolling, rolling_sums, shift
+
+
+
+def ao(high, low, fast=5, slow=34, min_periods=None):
+    """Awesome Oscillator (AO), see help(ta.ao)"""
+    min_periods = min_periods if min_periods is not None else fast
+    median_price = 0.5 * (as_float(high) + as_float(low))
+    fast_sma = rolling(median_price, fast, min_periods=min_periods).mean()
+    slow_sma = rolling(median_price, slow, min_periods=min_periods).mean()
+    return fast_sma - slow_sma
+
+
+def apo(close, fast=12, slow=26, min_periods=None):
+    """Absolute Price Oscillator (APO), see help(ta.apo)"""
+    min_periods = min_periods if min_periods is not None else fast
+    fastma = ema(close, length=fast, min_periods=min_periods)
+    slowma = ema(close, length=slow, min_periods=min_periods)
+    return fastma - slowma
+
+
+def bop(open_, high, low, close):
+    """Balance of Power (BOP), see help(ta.bop)"""
+    close_open_range = as_float(close) - as_float(open_)
+    high_log_range = as_float(high) - as_float(low)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return close_open_range / high_log_range
+
+
+def cci(high, low, close, length=20, c=0.015, min_periods=None):
+    """Commodity Channel Index (CCI), see help(ta.cci)"""
+    min_periods = min_periods if min_periods is not None else length
+    typical_price = hlc3(high, low, close)
+    mean_typical_price = rolling(typical_price, length, min_periods=min_periods).mean()
+    mad_typical_price = rolling_mad(typical_price, length, mean=mean_typical_price)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return (typical_price - mean_typical_price) / (c * mad_typical_price)
+
+
+def cmo(close, length=10, drift=1):
+    """Chande Momentum Oscillator (CMO), see help(ta.cmo)"""
+    negative = diff(as_float(close), drift)
+    positive = negative.copy()
+
+    positive[positive < 0] = 0  # Make negatives 0 for the postive series
+    negative[negative > 0] = 0  # Make postives 0 for the negative series
+
+    pos_sum = rolling(positive, length).sum()
+    neg_sum = rolling(np.fabs(negative), length).sum()
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return 100 * (pos_sum - neg_sum) / (pos_sum + neg_sum)
+
+
+def coppock(close, length=10, fast=11, slow=14):
+    """Coppock Curve (COPC), see help(ta.coppock)"""
+    total_roc = roc(close, fast) + roc(close, slow)
+    return wma(total_roc, length)
+
+
+def kst(close, roc1=10, roc2=15, roc3=20, roc4=30, sma1=10, sma2=10, sma3=10, sma4=15, signal=9):
+    """'Know Sure Thing' (KST), see help(ta.kst)
+
+    Returns kst and kst_signal.
+    """
+    rocma1 = rolling(roc(close, roc1), sma1).mean()
+    rocma2 = rolling(roc(close, roc2), sma2).mean()
+    rocma3 = rolling(roc(close, roc3), sma3).mean()
+    rocma4 = rolling(roc(close, roc4), sma4).mean()
+
+    kst = 100 * (rocma1 + 2 * rocma2 + 3 * rocma3 + 4 * rocma4)
+    kst_signal = rolling(kst, signal).mean()
+    return kst, kst_signal
+
+
+def macd(close, fast=12, slow=26, signal=9, min_periods=None):
+    """Moving Average, Convergence/Divergence (MACD), see help(ta.macd)
+
+    Returns macd, histogram and signal.
+    """
+    min_periods = min_periods if min_periods is not None else fast
+    fastma = ema(close, length=fast, min_periods=min_periods)
+    slowma = ema(close, length=slow, min_periods=min_periods)
+
+    macd = fastma - slowma
+    signalma = ewm(macd, span=signal, min_periods=min_periods).mean()
+    histogram = macd - signalma
+    return macd, histogram, signalma
+
+
+def mom(close, length=1):
+    """Momentum (MOM), see help(ta.mom)"""
+    return diff(as_float(close), length)
+
+
+def ppo(close, fast=12, slow=26, signal=9, min_periods=None):
+    """Percentage Price Oscillator (PPO), see help(ta.ppo)
+
+    Returns ppo, histogram and signal.
+    """
+    min_periods = min_periods if min_periods is not None else fast
+    fastma = sma(close, length=fast, min_periods=min_periods)
+    slowma = sma(close, length=slow, min_periods=min_periods)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ppo = 100 * (fastma - slowma) / slowma
+    signalma = ewm(ppo, span=signal, min_periods=min_periods).mean()
+    histogram = ppo - signalma
+    return ppo, histogram, signalma
+
+
+def roc(close, length=1):
+    """Rate of Change (ROC), see help(ta.roc)"""
+    close = as_float(close)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return 100 * mom(close, length=length) / shift(close, length)
+
+
+def rsi(close, length=14, drift=1):
+    """Relative Strength Index (RSI), see help(ta.rsi)"""
+    negative = diff(as_float(close), drift)
+    positive = negative.copy()
+
+    positive[positive < 0] = 0  # Make negatives 0 for the postive series
+    negative[negative > 0] = 0  # Make postives 0 for the negative series
+
+    positive_avg = ewm(positive, com=length, adjust=False).mean()
+    negative_avg = np.abs(ewm(negative, com=length, adjust=False).mean())
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return 100 * positive_avg / (positive_avg + negative_avg)
+
+
+def stoch(high, low, close, fast_k=14, slow_k=5, slow_d=3):
+    """Stochastic Oscillator (STOCH), see help(ta.stoch)
+
+    Returns fastk, fastd, slowk and slowd.
+    """
+    lowest_low   = lowest(low, fast_k, min_periods=fast_k - 1)
+    highest_high = highest(high, fast_k, min_periods=fast_k - 1)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        fastk = 100 * (as_float(close) - lowest_low) / (highest_high - lowest_low)
+    fastd = rolling(fastk, slow_d, min_periods=slow_d - 1).mean()
+
+    slowk = rolling(fastk, slow_k, min_periods=slow_k).mean()
+    slowd = rolling(slowk, slow_d, min_periods=slow_d).mean()
+    return fastk, fastd, slowk, slowd
+
+
+def trix(close, length=18, drift=1, min_periods=None):
+    """Trix (TRIX) of the 1D close, see help(ta.trix)"""
+    ema3 = ema_cascade(close, length=length, levels=3, min_periods=min_periods)[:, 2]
+    return 100 * pct_change(ema3, drift)
+
+
+def tsi(close, fast=13, slow=25, drift=1):
+    """True Strength Index (TSI), see help(ta.tsi)"""
+    diff_ = diff(as_float(close), drift)
+
+    slow_ema = ewm(diff_, span=slow).mean()
+    fast_slow_ema = ewm(slow_ema, span=fast).mean()
+
+    _ma = ewm(np.abs(diff_), span=slow).mean()
+    ma = ewm(_ma, span=fast).mean()
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return 100 * fast_slow_ema / ma
+
+
+def uo(high, low, close, fast=7, medium=14, slow=28, fast_w=4.0, medium_w=2.0, slow_w=1.0, drift=1):
+    """Ultimate Oscillator (UO), see help(ta.uo)"""
+    high, low, close = as_float(high), as_float(low), as_float(close)
+    prev_close = shift(close, drift)
+
+    # min(prev_close, low) and max(prev_close, high) as Python's builtins
+    # take them: prev_close unless the other one is strictly beyond it
+    min_l_or_pc = np.where(low < prev_close, low, prev_close)
+    max_h_or_pc = np.where(high > prev_close, high, prev_close)
+
+    bp = close - min_l_or_pc
+    tr = max_h_or_pc - min_l_or_pc
+
+    # The sums of bp and tr over the three windows share one prefix sum
+    sums = rolling_sums(np.stack([bp, tr], axis=-1), [fast, medium, slow])
+    with np.errstate(divide='ignore', invalid='ignore'):
+        fast_avg, medium_avg, slow_avg = (x[..., 0] / x[..., 1] for x in sums)
+
+    total_weight =  fast_w + medium_w + slow_w
+    weights = (fast_w * fast_avg) + (medium_w * medium_avg) + (slow_w * slow_avg)
+    return 100 * weights / total_weight
+
+
+def willr(high, low, close, length=14, min_periods=None):
+    """William's Percent R (WILLR), see help(ta.willr)"""
+    min_periods = min_periods if min_periods is not None else length
+    lowest_low = lowest(low, length, min_periods=min_periods)
+    highest_high = highest(high, length, min_periods=min_periods)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return 100 * ((as_float(close) - lowest_low) / (highest_high - lowest_low) - 1)
@@ -0,0 +1,254 @@
+# -*- coding: utf-8 -*-
+import math
+import numpy as np
+
+# scipy is imported on first use, see _scipy().  None until then.
+_SCIPY_ = None
+lfilter = None
+
+from ..utils import fibonacci, intermediate, pascals_triangle
+from ..utils import linear_weighted_window, weighted_window
+from .utils import _pandas, as_float, cumsum, ewm, highest, lowest, rolling, shift
+
+
+
+def dema(close, length=10, min_periods=None):
+    """Double Exponential Moving Average (DEMA), see help(ta.dema)"""
+    emas = ema_cascade(close, length=length, levels=2, min_periods=min_periods)
+    return 2 * emas[:, 0] - emas[:, 1]
+
+
+@intermediate
+def ema(close, length=10, min_periods=None, adjust=True, presma=False):
+    """Exponential Moving Average (EMA), see help(ta.ema)"""
+    close = as_float(close)
+    min_periods = min_periods if min_periods is not None else length
+
+    if presma:
+        initial_sma = sma(close, length=length)
+        close = close.copy()
+        close[:length] = initial_sma[:length]
+
+    return ewm(close, span=length, min_periods=min_periods, adjust=adjust).mean()
+
+
+def ema_cascade(close, length=10, levels=1, min_periods=None, adjust=True, presma=False):
+    """EMA levels 1 through 'levels' of the same length of the 1D close, as
+    the columns of one (n, levels) array, see help(ta.ema_cascade).  The
+    levels are chained in float64 whatever the current dtype."""
+    min_periods = min_periods if min_periods is not None else length
+    alpha = 2 / (length + 1)
+
+    n = close.size
+    cascade = np.empty((n, levels), order='F')
+    x = np.asarray(close, dtype=np.float64)
+    for level in range(levels):
+        if presma:
+            x = x.copy()
+            x[length - 1:length] = x[:length].mean() if n >= length else np.nan
+            x[:length - 1] = np.nan
+        _ewma(x, alpha, min_periods, adjust, out=cascade[:, level])
+        x = cascade[:, level]
+
+    return as_float(cascade)
+
+
+def _scipy():
+    """Imports scipy's lfilter on first use rather than with ta, as importing
+    scipy.signal takes longer than importing ta.  Returns whether scipy is
+    available."""
+    global _SCIPY_, lfilter
+    if _SCIPY_ is None:
+        try:
+            from scipy.signal import lfilter
+            _SCIPY_ = True
+        except ImportError:
+            _SCIPY_ = False
+    return _SCIPY_
+
+
+def _ewma(x, alpha, min_periods, adjust, out):
+    """Exponentially Weighted Mean of the ndarray x written into out.  Matches
+    pd.Series(x).ewm(alpha=alpha, min_periods=min_periods, adjust=adjust).mean()
+    in the dtype of out.
+    """
+    scipy = _scipy()
+    if scipy:
+        nans = np.isnan(x)
+        first = nans.argmin() if not nans.all() else x.size
+        leading = not nans[first:].any()
+
+    if not scipy or (not adjust and not leading):
+        out[:] = _pandas(x).ewm(alpha=alpha, min_periods=min_periods, adjust=adjust).mean()
+        return out
+
+    decay = 1 - alpha
+    out[:first] = np.nan
+    if first == x.size:
+        return out
+
+    if leading:
+        if adjust:
+            # The weights sum to (1 - decay^(k + 1)) / alpha, which is 1 / alpha
+            # once decay^(k + 1) underflows.
+            out[first:] = alpha * lfilter([1], [1, -decay], x[first:])
+            warmup = min(x.size - first, int(np.log(np.finfo(float).eps) / np.log(decay)) + 1 if 0 < decay < 1 else 1)
+            out[first:first + warmup] /= 1 - decay ** np.arange(1, warmup + 1)
+        else:
+            out[first] = x[first]
+            out[first + 1:] = lfilter([alpha], [1, -decay], x[first + 1:], zi=[decay * x[first]])[0]
+        out[first:first + max(min_periods, 1) - 1] = np.nan
+    else:
+        # Weighted sums of the observations over the sums of their weights,
+        # carrying the last average over the NaNs
+        valid = ~nans[first:]
+        weighted = lfilter([1], [1, -decay], np.where(valid, x[first:], 0))
+        weights = lfilter([1], [1, -decay], valid.astype(float))
+        observed = np.cumsum(valid)
+        out[first:] = (weighted[valid] / weights[valid])[observed - 1]
+        out[first:][observed < max(min_periods, 1)] = np.nan
+
+    return out
+
+
+def fwma(close, length=10):
+    """Fibonacci's Weighted Moving Average (FWMA), see help(ta.fwma)"""
+    return as_float(weighted_window(close, fibonacci(length - 1)))
+
+
+@intermediate
+def hl2(high, low):
+    """HL2, see help(ta.hl2)"""
+    return 0.5 * (as_float(high) + as_float(low))
+
+
+@intermediate
+def hlc3(high, low, close):
+    """HLC3, see help(ta.hlc3)"""
+    return (as_float(high) + as_float(low) + as_float(close)) / 3
+
+
+def hma(close, length=10):
+    """Hull Moving Average (HMA), see help(ta.hma)"""
+    half_length = int(length / 2)
+    sqrt_length = int(math.sqrt(length))
+
+    wmaf = wma(close, length=half_length)
+    wmas = wma(close, length=length)
+    return wma(2 * wmaf - wmas, length=sqrt_length)
+
+
+def ichimoku(high, low, close, tenkan=9, kijun=26, senkou=52):
+    """Ichimoku Kinkō Hyō (Ichimoku), see help(ta.ichimoku)
+
+    Returns span_a, span_b, tenkan_sen, kijun_sen and chikou_span followed by
+    the last 'kijun' values of span_a and span_b, before their shift, which
+    are the spans of the next 'kijun' bars.
+    """
+    tenkan_sen = midprice(high, low, length=tenkan)
+    kijun_sen = midprice(high, low, length=kijun)
+    span_a = 0.5 * (tenkan_sen + kijun_sen)
+    span_b = midprice(high, low, length=senkou)
+
+    forward_a, forward_b = span_a[-kijun:].copy(), span_b[-kijun:].copy()
+
+    span_a = shift(span_a, kijun)
+    span_b = shift(span_b, kijun)
+    chikou_span = shift(as_float(close), -kijun)
+
+    return span_a, span_b, tenkan_sen, kijun_sen, chikou_span, forward_a, forward_b
+
+
+def midpoint(close, length=1, min_periods=None):
+    """Midpoint, see help(ta.midpoint)"""
+    min_periods = min_periods if min_periods is not None else length
+    lowest_close = lowest(close, length, min_periods=min_periods)
+    highest_close = highest(close, length, min_periods=min_periods)
+    return 0.5 * (lowest_close + highest_close)
+
+
+def midprice(high, low, length=1, min_periods=None):
+    """Midprice, see help(ta.midprice)"""
+    min_periods = min_periods if min_periods is not None else length
+    lowest_low = lowest(low, length, min_periods=min_periods)
+    highest_high = highest(high, length, min_periods=min_periods)
+    return 0.5 * (lowest_low + highest_high)
+
+
+@intermediate
+def ohlc4(open_, high, low, close):
+    """OHLC4, see help(ta.ohlc4)"""
+    return 0.25 * (as_float(open_) + as_float(high) + as_float(low) + as_float(close))
+
+
+def pwma(close, length=10):
+    """Pascals Weighted Moving Average (PWMA), see help(ta.pwma)"""
+    return as_float(weighted_window(close, pascals_triangle(length - 1)))
+
+
+@intermediate
+def rma(close, length=10, min_periods=None):
+    """wildeR's Moving Average (RMA), see help(ta.rma)"""
+    min_periods = min_periods if min_periods is not None else length
+    alpha = (1.0 / length) if length > 0 else 1
+    return ewm(as_float(close), alpha=alpha, min_periods=min_periods).mean()
+
+
+@intermediate
+def sma(close, length=10, min_periods=None):
+    """Simple Moving Average (SMA), see help(ta.sma)"""
+    min_periods = min_periods if min_periods is not None else length
+    return rolling(as_float(close), length, min_periods=min_periods).mean()
+
+
+def t3(close, length=10, a=0.7, min_periods=None, adjust=True, presma=False):
+    """T3 of the 1D close, see help(ta.t3)"""
+    c1 = -a * a ** 2
+    c2 = 3 * a ** 2 + 3 * a ** 3
+    c3 = -6 * a ** 2 - 3 * a - 3 * a ** 3
+    c4 = a ** 3 + 3 * a ** 2 + 3 * a + 1
+
+    emas = ema_cascade(close, length=length, levels=6, min_periods=min_periods, adjust=adjust, presma=presma)
+    e3, e4, e5, e6 = emas[:, 2], emas[:, 3], emas[:, 4], emas[:, 5]
+    return c1 * e6 + c2 * e5 + c3 * e4 + c4 * e3
+
+
+def tema(close, length=10, min_periods=None):
+    """Triple Exponential Moving Average (TEMA) of the 1D close, see help(ta.tema)"""
+    emas = ema_cascade(close, length=length, levels=3, min_periods=min_periods)
+    ema1, ema2, ema3 = emas[:, 0], emas[:, 1], emas[:, 2]
+    return 3 * (ema1 - ema2) + ema3
+
+
+def trima(close, length=10):
+    """Triangular Moving Average (TRIMA), see help(ta.trima)"""
+    half_length = round(0.5 * (length + 1))
+    sma1 = rolling(as_float(close), half_length, min_periods=half_length).mean()
+    return rolling(sma1, half_length, min_periods=half_length).mean()
+
+
+def vwap(high, low, close, volume):
+    """Volume Weighted Average Price (VWAP), see help(ta.vwap)"""
+    volume = as_float(volume)
+    tpv = hlc3(high, low, close) * volume
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return as_float(cumsum(tpv, np.float64) / cumsum(volume, np.float64))
+
+
+def vwma(close, volume, length=10):
+    """Volume Weighted Moving Average (VWMA), see help(ta.vwma)"""
+    volume = as_float(volume)
+    pv = as_float(close) * volume
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return sma(pv, length=length) / sma(volume, length=length)
+
+
+def wma(close, length=10, asc=True, recursive=True, resum=None):
+    """Weighted Moving Average (WMA), see help(ta.wma)"""
+    if recursive:
+        return as_float(linear_weighted_window(close, length, asc=asc, resum=resum))
+
+    total_weight = 0.5 * length * (length + 1)
+    weights_ = np.arange(1, length + 1) / total_weight
+    weights = weights_ if asc else weights_[::-1]
+    return as_float(weighted_window(close, weights))
@@ -0,0 +1,22 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+
+from .utils import as_float, cumsum, diff, ffill, pct_change
+
+
+
+def log_return(close, length=1, cumulative=False):
+    """Log Return, see help(ta.log_return)"""
+    with np.errstate(divide='ignore', invalid='ignore'):
+        log_return = diff(np.log(as_float(close)), length)
+    return cumsum(log_return) if cumulative else log_return
+
+
+def percent_return(close, length=1, cumulative=False):
+    """Percent Return, see help(ta.percent_return)"""
+    close = as_float(close)
+    # As Series.pct_change did before pandas 1.0: NaNs are padded before
+    # taking the change, and the change is NaN where close is
+    pct_return = pct_change(ffill(close), length)
+    pct_return[np.isnan(close)] = np.nan
+    return cumsum(pct_return) if cumulative else pct_return
@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+
+from .overlap import sma
+from .utils import as_float, rolling
+
+
+
+def kurtosis(close, length=30, min_periods=None):
+    """Kurtosis, see help(ta.kurtosis)"""
+    min_periods = min_periods if min_periods is not None else length
+    return rolling(as_float(close), length, min_periods=min_periods).kurt()
+
+
+def mad(close, length=30, min_periods=None):
+    """Mean Absolute Deviation, see help(ta.mad)"""
+    return rolling_mad(close, length, min_periods=min_periods)
+
+
+def median(close, length=30, min_periods=None):
+    """Median, see help(ta.median)"""
+    min_periods = min_periods if min_periods is not None else length
+    return rolling(as_float(close), length, min_periods=min_periods).median()
+
+
+def quantile(close, length=30, q=0.5, min_periods=None):
+    """Quantile, see help(ta.quantile)"""
+    min_periods = min_periods if min_periods is not None else length
+    return rolling(as_float(close), length, min_periods=min_periods).quantile(q)
+
+
+def rolling_mad(close, length, mean=None, min_periods=None):
+    """Rolling Mean Absolute Deviation, see help(ta.rolling_mad)"""
+    min_periods = int(min_periods) if min_periods is not None else length
+
+    values = as_float(close)
+    n = values.shape[0]
+    if mean is None:
+        mean = rolling(values, length, min_periods=min(min_periods, length)).mean()
+    mean = as_float(mean)
+
+    mad = np.full(values.shape, np.nan, dtype=values.dtype)
+    # Leading partial windows, when min_periods < length
+    for i in range(max(min_periods, 1) - 1, min(length - 1, n)):
+        mad[i] = np.fabs(values[:i + 1] - mean[i]).mean(axis=0)
+
+    if n >= length:
+        shape = (n - length + 1, length) + values.shape[1:]
+        strides = (values.strides[0],) + values.strides
+        windows = np.lib.stride_tricks.as_strided(values, shape=shape, strides=strides, writeable=False)
+        chunk = max(1, 2 ** 20 // (length * max(values[:1].size, 1)))
+        for start in range(0, windows.shape[0], chunk):
+            stop = min(start + chunk, windows.shape[0])
+            deviation = windows[start:stop] - mean[start + length - 1:stop + length - 1, None]
+            mad[start + length - 1:stop + length - 1] = np.fabs(deviation).mean(axis=1)
+
+    return mad
+
+
+def rolling_quantiles(close, length, q, min_periods=None):
+    """Rolling Quantiles, see help(ta.rolling_quantiles)
+
+    Returns an array with the quantiles of q along its last axis.
+    """
+    q = np.atleast_1d(np.asarray(q, dtype=float))
+    min_periods = int(min_periods) if min_periods is not None else length
+
+    # One separate pass of Pandas' compiled skiplist per quantile, each
+    # O(n log length).  A shared sorted window in Python is slower than that.
+    window = rolling(as_float(close), length, min_periods=min_periods)
+    return np.stack([window.quantile(x) for x in q], axis=-1)
+
+
+def skew(close, length=30, min_periods=None):
+    """Skew, see help(ta.skew)"""
+    min_periods = min_periods if min_periods is not None else length
+    return rolling(as_float(close), length, min_periods=min_periods).skew()
+
+
+def stdev(close, length=30):
+    """Standard Deviation, see help(ta.stdev)"""
+    with np.errstate(invalid='ignore'):
+        return np.sqrt(variance(close, length=length))
+
+
+def variance(close, length=30, min_periods=None):
+    """Variance, see help(ta.variance)"""
+    min_periods = min_periods if min_periods is not None else length
+    return rolling(as_float(close), length, min_periods=min_periods).var()
+
+
+def zscore(close, length=30, std=1.0, min_periods=None):
+    """Z Score, see help(ta.zscore)"""
+    std *= stdev(close, length=length)
+    mean = sma(close, length=length, min_periods=min_periods)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return (as_float(close) - mean) / std
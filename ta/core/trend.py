@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+
+from ..utils import rolling_argextrema
+from .overlap import rma
+from .utils import as_float, diff, rolling, shift, zero
+from .volatility import atr, true_range
+
+
+
+def adx(high, low, close, length=14, drift=1):
+    """ADX, see help(ta.adx)
+
+    Returns adx, dmp and dmn.
+    """
+    high, low = as_float(high), as_float(low)
+    _atr = atr(high, low, close, length=length)
+
+    up = high - shift(high, drift)
+    dn = shift(low, drift) - low
+
+    pos = zero(((up > dn) & (up > 0)) * up)
+    neg = zero(((dn > up) & (dn > 0)) * dn)
+
+    # +DM and -DM are smoothed side by side in one pass.  ATR (a span=length
+    # EMA) and ADX (of DX, which needs the smoothed DMs) stay separate passes:
+    # one shared lfilter recursion over TR, +DM and -DM measured slower than
+    # Pandas' compiled ewm, and a single loop would need a JIT compiler.
+    n = pos.shape[0]
+    dm = rma(np.stack([pos, neg], axis=1).reshape(n, -1), length=length)
+    dm = dm.reshape((n, 2) + pos.shape[1:])
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        dmp = (100 / _atr) * dm[:, 0]
+        dmn = (100 / _atr) * dm[:, 1]
+
+        dx = 100 * np.abs(dmp - dmn) / (dmp + dmn)
+    adx = rma(dx, length=length)
+    return adx, dmp, dmn
+
+
+def aroon(close, length=14, min_periods=None):
+    """Aroon Oscillator, see help(ta.aroon)
+
+    Returns aroon_up and aroon_down.
+    """
+    min_periods = min_periods if min_periods is not None else length
+    since_high, since_low = rolling_argextrema(close, length, min_periods=min_periods)
+    n = since_high.shape[0]
+    window = np.minimum(np.arange(1, n + 1), length).reshape((n,) + (1,) * (since_high.ndim - 1))
+
+    aroon_up = 100 * (window - since_high) / length
+    aroon_down = 100 * (window - since_low) / length
+    return as_float(aroon_up), as_float(aroon_down)
+
+
+def decreasing(close, length=1, asint=True):
+    """Decreasing, see help(ta.decreasing)"""
+    decreasing = diff(as_float(close), length) < 0
+    return decreasing.astype(int) if asint else decreasing
+
+
+def dpo(close, length=1, centered=True, min_periods=None):
+    """Detrend Price Oscillator (DPO), see help(ta.dpo)"""
+    close = as_float(close)
+    min_periods = min_periods if min_periods is not None else length
+
+    drift = int(0.5 * length) + 1  # int((0.5 * length) + 1)
+    dpo = shift(close, drift) - rolling(close, length, min_periods=min_periods).mean()
+    return shift(dpo, -drift) if centered else dpo
+
+
+def increasing(close, length=1, asint=True):
+    """Increasing, see help(ta.increasing)"""
+    increasing = diff(as_float(close), length) > 0
+    return increasing.astype(int) if asint else increasing
+
+
+def vortex(high, low, close, length=14, drift=1, min_periods=None):
+    """Vortex, see help(ta.vortex)
+
+    Returns vip and vim.
+    """
+    high, low = as_float(high), as_float(low)
+    min_periods = min_periods if min_periods is not None else length
+
+    tr = true_range(high, low, close)
+    tr_sum = rolling(tr, length, min_periods=min_periods).sum()
+
+    vmp = np.abs(high - shift(low, drift))
+    vmm = np.abs(low - shift(high, drift))
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        vip = rolling(vmp, length, min_periods=min_periods).sum() / tr_sum
+        vim = rolling(vmm, length, min_periods=min_periods).sum() / tr_sum
+    return vip, vim
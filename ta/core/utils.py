@@ -0,0 +1,202 @@
+# -*- coding: utf-8 -*-
+"""Array helpers of the core kernels.  Everything works along axis 0 of 1D
+(bars,) and 2D (bars, series) ndarrays."""
+import numpy as np
+import pandas as pd
+
+from functools import wraps
+from sys import float_info as sflt
+
+from ..utils import _INTERMEDIATE_CACHES, get_dtype, intermediate
+
+
+
+class _Window(object):
+    """A Pandas window over a bare ndarray whose aggregations return ndarrays
+    in the current dtype.  Pandas aggregates in float64 either way."""
+    def __init__(self, window):
+        self.window = window
+
+    def __getattr__(self, name):
+        aggregation = getattr(self.window, name)
+
+        @wraps(aggregation)
+        def _aggregation(*args, **kwargs):
+            # Pandas' own result buffer, copied only to change its dtype
+            values = aggregation(*args, **kwargs).values
+            return values.astype(get_dtype(), copy=False)
+
+        return _aggregation
+
+
+def _pandas(x:np.ndarray):
+    """x as an unindexed Series or DataFrame, without a copy."""
+    return pd.DataFrame(x, copy=False) if x.ndim == 2 else pd.Series(x, copy=False)
+
+
+def as_float(x):
+    """x as an ndarray of the current dtype (float64 unless set otherwise,
+    see ta.set_dtype), without a copy if it already is one."""
+    return np.asarray(x, dtype=get_dtype())
+
+
+def cumsum(x:np.ndarray, dtype=None):
+    """Cumulative sum that skips NaNs like Series.cumsum: NaNs stay NaN and
+    do not stop the sum.  It always accumulates in float64, the result is
+    stored in 'dtype', default: the current dtype."""
+    nans = np.isnan(x)
+    result = np.cumsum(np.where(nans, 0.0, x), axis=0, dtype=np.float64)
+    result[nans] = np.nan
+    return result.astype(dtype or get_dtype(), copy=False)
+
+
+def diff(x:np.ndarray, periods:int = 1):
+    """x[t] - x[t - periods], NaN where there is no x[t - periods]."""
+    return _lagged(x, periods, np.subtract)
+
+
+def ewm(x:np.ndarray, **kwargs):
+    """Pandas' compiled exponentially weighted window over x.
+
+    >>> ewm(x, span=10, min_periods=10).mean() # ndarray
+    """
+    return _Window(_pandas(x).ewm(**kwargs))
+
+
+def ffill(x:np.ndarray):
+    """x with every NaN replaced by the last value before it, like
+    Series.ffill.  Leading NaNs stay NaN."""
+    position = np.arange(x.shape[0]).reshape((-1,) + (1,) * (x.ndim - 1))
+    index = np.where(np.isnan(x), 0, position)
+    np.maximum.accumulate(index, axis=0, out=index)
+    return np.take_along_axis(x, index, axis=0)
+
+
+@intermediate
+def _window_extremum(x:np.ndarray, length:int, extremum:str):
+    """rolling(x, length, min_periods=1).min() or .max(), for 'min' or 'max',
+    and the number of values in every window, None if x has no NaNs."""
+    x = as_float(x)
+    result = getattr(rolling(x, length, min_periods=1), extremum)()
+    nans = np.isnan(x)
+    if not nans.any():
+        return result, None
+    count = np.cumsum(~nans, axis=0)
+    if x.shape[0] > length:
+        count[length:] -= count[:-length]
+    return result, count
+
+
+def _extremum(x:np.ndarray, length:int, extremum:str, min_periods:int = None):
+    """The window extremum, NaN where a window has fewer than min_periods
+    values.  It is shared through the IntermediateCache when one is active,
+    otherwise it is Pandas' rolling extremum."""
+    min_periods = min_periods if min_periods is not None else length
+    if not _INTERMEDIATE_CACHES:
+        return getattr(rolling(as_float(x), length, min_periods=min_periods), extremum)()
+
+    result, count = _window_extremum(x, length, extremum)
+    if count is None:
+        # Without NaNs, only the first windows can be short
+        result = result.copy()
+        result[:max(min_periods, 1) - 1] = np.nan
+        return result
+    return np.where(count >= max(min_periods, 1), result, np.nan)
+
+
+def highest(x:np.ndarray, length:int, min_periods:int = None):
+    """Highest value of every window of x, rolling(x, length, min_periods)
+    .max().  Inside an IntermediateCache, it is computed once per (x, length)
+    whatever the min_periods, so indicators sharing a high or a close and a
+    length, like donchian, midpoint, willr, stoch and ichimoku, scan each
+    window once.  Pandas' rolling max is the O(n) monotonic deque algorithm."""
+    return _extremum(x, length, 'max', min_periods=min_periods)
+
+
+def lowest(x:np.ndarray, length:int, min_periods:int = None):
+    """Lowest value of every window of x, rolling(x, length, min_periods)
+    .min(), see highest."""
+    return _extremum(x, length, 'min', min_periods=min_periods)
+
+
+def pct_change(x:np.ndarray, periods:int = 1):
+    """x[t] / x[t - periods] - 1, NaN where there is no x[t - periods]."""
+    with np.errstate(divide='ignore', invalid='ignore'):
+        result = _lagged(x, periods, np.divide)
+    result -= 1
+    return result
+
+
+def rolling(x:np.ndarray, length:int, min_periods:int = None):
+    """Pandas' compiled rolling window aggregations over x.
+
+    >>> rolling(x, 10, min_periods=5).mean() # ndarray
+    """
+    return _Window(_pandas(x).rolling(length, min_periods=min_periods))
+
+
+def rolling_sums(x:np.ndarray, lengths:list):
+    """Rolling sums of x for every length in 'lengths' from one shared prefix
+    sum, as a list of arrays in the current dtype.  Like rolling(x, length)
+    .sum(), windows that are not full or that hold a NaN are NaN.
+
+    The prefix sum is taken in float64 about the mean of x, so long series
+    lose little precision, and windows of zeros sum to exactly zero.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    n = x.shape[0]
+    nans = np.isnan(x)
+    values = np.where(nans, 0.0, x)
+    base = values.sum(axis=0) / np.maximum((~nans).sum(axis=0), 1)
+
+    csum = np.zeros((n + 1,) + x.shape[1:])
+    np.cumsum(np.where(nans, 0.0, values - base), axis=0, out=csum[1:])
+    nan_count = np.zeros(csum.shape, dtype=np.intp)
+    np.cumsum(nans, axis=0, out=nan_count[1:])
+    nonzero_count = np.zeros(csum.shape, dtype=np.intp)
+    np.cumsum(values != 0, axis=0, out=nonzero_count[1:])
+
+    sums = []
+    for length in lengths:
+        result = np.full(x.shape, np.nan)
+        if 0 < length <= n:
+            window = csum[length:] - csum[:-length] + length * base
+            window[nonzero_count[length:] == nonzero_count[:-length]] = 0.0
+            window[nan_count[length:] > nan_count[:-length]] = np.nan
+            result[length - 1:] = window
+        sums.append(result.astype(get_dtype(), copy=False))
+    return sums
+
+
+def shift(x:np.ndarray, periods:int = 1):
+    """x shifted by periods, like Series.shift, as a new float array of x's
+    float dtype (float64 for other dtypes)."""
+    return _lagged(x, periods)
+
+
+def _lagged(x:np.ndarray, periods:int, ufunc=None):
+    """ufunc(x[t], x[t - periods]), or x[t - periods] without a ufunc, written
+    into one new float array with only its NaN edge filled separately."""
+    result = np.empty(x.shape, dtype=np.result_type(x.dtype, np.float32))
+    n = x.shape[0]
+    periods = max(-n, min(periods, n))
+    if periods > 0:
+        result[:periods] = np.nan
+        current, lagged, out = x[periods:], x[:n - periods], result[periods:]
+    elif periods < 0:
+        result[n + periods:] = np.nan
+        current, lagged, out = x[:n + periods], x[-periods:], result[:n + periods]
+    else:
+        current, lagged, out = x, x, result
+
+    if ufunc is None:
+        out[...] = lagged
+    else:
+        ufunc(current, lagged, out=out)
+    return result
+
+
+def zero(x:np.ndarray):
+    """x with the values within epsilon of zero set to zero, utils.zero
+    applied element-wise."""
+    return np.where(np.abs(x) < sflt.epsilon, 0, x)
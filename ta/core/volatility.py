@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+
+from ..utils import intermediate
+from .overlap import ema_cascade, hlc3
+from .statistics import stdev
+from .utils import as_float, ewm, highest, lowest, rolling, shift
+
+
+
+def accbands(high, low, close, length=10, c=4, mamode='sma', min_periods=None):
+    """Acceleration Bands (ACCBANDS), see help(ta.accbands)
+
+    Returns lower, mid and upper.
+    """
+    high, low = as_float(high), as_float(low)
+    min_periods = min_periods if min_periods is not None else length
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        hl_ratio  = (high - low) / (high + low)
+    hl_ratio *= c
+    _lower = low * (1 - hl_ratio)
+    _upper = high * (1 + hl_ratio)
+
+    if mamode == 'ema':
+        lower = ewm(_lower, span=length, min_periods=min_periods).mean()
+        mid   = ewm(as_float(close), span=length, min_periods=min_periods).mean()
+        upper = ewm(_upper, span=length, min_periods=min_periods).mean()
+    else:
+        lower = rolling(_lower, length, min_periods=min_periods).mean()
+        mid   = rolling(as_float(close), length, min_periods=min_periods).mean()
+        upper = rolling(_upper, length, min_periods=min_periods).mean()
+    return lower, mid, upper
+
+
+@intermediate
+def atr(high, low, close, length=14, mamode='ema', drift=1, min_periods=None):
+    """Average True Range (ATR), see help(ta.atr)"""
+    min_periods = min_periods if min_periods is not None else length
+    tr = true_range(high, low, close, drift=drift)
+    if mamode == 'ema':
+        return ewm(tr, span=length, min_periods=min_periods).mean()
+    return rolling(tr, length, min_periods=min_periods).mean()
+
+
+def bbands(close, length=20, std=2, mamode='ema', min_periods=None):
+    """Bollinger Bands (BBANDS), see help(ta.bbands)
+
+    Returns lower, mid and upper.
+    """
+    close = as_float(close)
+    min_periods = min_periods if min_periods is not None else length
+    standard_deviation = stdev(close, length=length)
+
+    if mamode == 'sma':
+        mid = rolling(close, length, min_periods=min_periods).mean()
+    else:
+        mid = ewm(close, span=length, min_periods=min_periods).mean()
+
+    lower = mid - std * standard_deviation
+    upper = mid + std * standard_deviation
+    return lower, mid, upper
+
+
+def donchian(close, length=20, min_periods=None):
+    """Donchian Channels (DC), see help(ta.donchian)
+
+    Returns lower, mid and upper.
+    """
+    min_periods = min_periods if min_periods is not None else length
+    lower = lowest(close, length, min_periods=min_periods)
+    upper = highest(close, length, min_periods=min_periods)
+    mid = 0.5 * (lower + upper)
+    return lower, mid, upper
+
+
+def kc(high, low, close, length=20, scalar=2, mamode=None, min_periods=None):
+    """Keltner Channels (KC), see help(ta.kc)
+
+    Returns lower, basis and upper.
+    """
+    min_periods = min_periods if min_periods is not None else length
+
+    if mamode == 'ema':
+        basis = ewm(as_float(close), span=length, min_periods=min_periods).mean()
+        band = atr(high, low, close)
+    else:
+        hl_range = as_float(high) - as_float(low)
+        typical_price = hlc3(high, low, close)
+        basis = rolling(typical_price, length, min_periods=min_periods).mean()
+        band = rolling(hl_range, length, min_periods=min_periods).mean()
+
+    lower = basis - scalar * band
+    upper = basis + scalar * band
+    return lower, basis, upper
+
+
+def massi(high, low, fast=9, slow=25):
+    """Mass Index (MASSI) of 1D inputs, see help(ta.massi)"""
+    hl_range = as_float(high) - as_float(low)
+    hl_emas = ema_cascade(hl_range, length=fast, levels=2)
+    hl_ema1, hl_ema2 = hl_emas[:, 0], hl_emas[:, 1]
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        hl_ratio = hl_ema1 / hl_ema2
+    return rolling(hl_ratio, slow, min_periods=slow).sum()
+
+
+def natr(high, low, close, length=14, mamode='ema', drift=1, min_periods=None):
+    """Normalized Average True Range (NATR), see help(ta.natr)"""
+    _atr = atr(high, low, close, length=length, mamode=mamode, drift=drift, min_periods=min_periods)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return (100 / as_float(close)) * _atr
+
+
+@intermediate
+def true_range(high, low, close, drift=1):
+    """True Range, see help(ta.true_range)"""
+    high, low = as_float(high), as_float(low)
+    prev_close = shift(as_float(close), drift)
+
+    # The element-wise largest of the three absolute ranges, in one output
+    # buffer and one scratch buffer rather than an (n, 3) frame.  np.fmax
+    # skips NaNs like DataFrame.max(axis=1), so a bar without a previous
+    # close is high - low.
+    true_range = np.abs(high - low)
+    gap = np.abs(high - prev_close)
+    np.fmax(true_range, gap, out=true_range)
+    np.subtract(low, prev_close, out=gap)
+    np.fmax(true_range, np.abs(gap, out=gap), out=true_range)
+    return true_range
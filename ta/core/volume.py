@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+
+from ..utils import intermediate, signed_series
+from .momentum import roc
+from .overlap import ema, hl2, hlc3
+from .utils import as_float, cumsum, diff, ewm, pct_change, rolling, rolling_sums, shift
+
+
+
+def _money_flow(high, low, close, volume, open_=None):
+    """Close location value times volume, the money flow of AD and CMF."""
+    high, low, close = as_float(high), as_float(low), as_float(close)
+    if open_ is not None:
+        ad = close - as_float(open_)  # AD with Open
+    else:
+        ad = 2 * close - high - low  # AD with High, Low, Close
+
+    hl_range = high - low
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ad *= as_float(volume) / hl_range
+    return ad
+
+
+def _volume_index(close, volume, initial, negative, multiplicative):
+    """Volume index that changes with the close on the bars whose volume fell
+    (NVI, negative=True) or rose (PVI) from the previous bar."""
+    close, volume = as_float(close), as_float(volume)
+    prev_volume = shift(volume, 1)
+    active = volume < prev_volume if negative else volume > prev_volume
+
+    if multiplicative:
+        # index[t] = index[t - 1] * (1 + pct_change(close)[t]) on the active
+        # bars, a cumulative product in float64.  A NaN change carries on.
+        factor = np.where(active, 1 + pct_change(close), 1.0).astype(np.float64)
+        factor[0] = initial
+        return as_float(np.cumprod(factor, axis=0))
+
+    change = np.where(active, roc(close), 0)
+    change[np.isnan(change)] = 0
+    change[0] = initial
+    return cumsum(change)
+
+
+def ad(high, low, close, volume, open_=None):
+    """Accumulation/Distribution (AD), see help(ta.ad)"""
+    return cumsum(_money_flow(high, low, close, volume, open_=open_))
+
+
+def adosc(high, low, close, volume, open_=None, fast=12, slow=26):
+    """Accumulation/Distribution Oscillator, see help(ta.adosc)"""
+    ad_ = ad(high, low, close, volume, open_=open_)
+    fast_ad = ema(ad_, length=fast)
+    slow_ad = ema(ad_, length=slow)
+    return fast_ad - slow_ad
+
+
+def cmf(high, low, close, volume, open_=None, length=20, min_periods=None):
+    """Chaikin Money Flow (CMF), see help(ta.cmf)"""
+    min_periods = min_periods if min_periods is not None else length
+    ad = _money_flow(high, low, close, volume, open_=open_)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return rolling(ad, length, min_periods=min_periods).sum() / rolling(as_float(volume), length, min_periods=min_periods).sum()
+
+
+def efi(close, volume, length=13, drift=1, mamode=None, min_periods=None):
+    """Elder's Force Index (EFI), see help(ta.efi)"""
+    min_periods = min_periods if min_periods is not None else length
+    pv_diff = diff(as_float(close), drift) * as_float(volume)
+
+    if mamode == 'sma':
+        return rolling(pv_diff, length, min_periods=min_periods).mean()
+    return ewm(pv_diff, span=length, min_periods=min_periods).mean()
+
+
+def eom(high, low, close, volume, length=14, divisor=100000000, drift=1, min_periods=None):
+    """Ease of Movement (EOM), see help(ta.eom)"""
+    high, low = as_float(high), as_float(low)
+    min_periods = min_periods if min_periods is not None else length
+
+    hl_range = high - low
+    distance = hl2(high, low) - hl2(shift(high, drift), shift(low, drift))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        box_ratio = (as_float(volume) / divisor) / hl_range
+        eom = distance / box_ratio
+    return rolling(eom, length, min_periods=min_periods).mean()
+
+
+def mfi(high, low, close, volume, length=14, drift=1):
+    """Money Flow Index (MFI), see help(ta.mfi)"""
+    flows = np.stack(money_flows(high, low, close, volume, drift=drift), axis=-1)
+    sums, = rolling_sums(flows, [length])
+    psum, nsum = sums[..., 0], sums[..., 1]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return 100 * psum / (psum + nsum)
+
+
+@intermediate
+def money_flows(high, low, close, volume, drift=1):
+    """Positive and negative money flow of MFI.  The raw money flow, typical
+    price times volume, is positive when the typical price rose over 'drift'
+    bars and negative when it fell, the other flow is zero.
+
+    Returns positive_flow and negative_flow.
+    """
+    typical_price = hlc3(high, low, close)
+    raw_money_flow = typical_price * as_float(volume)
+
+    change = diff(typical_price, drift)
+    positive_flow = np.where(change > 0, raw_money_flow, 0)
+    negative_flow = np.where(change < 0, raw_money_flow, 0)
+    return positive_flow, negative_flow
+
+
+def nvi(close, volume, initial=1000, multiplicative=False):
+    """Negative Volume Index (NVI), see help(ta.nvi)"""
+    return _volume_index(close, volume, initial, True, multiplicative)
+
+
+def obv(close, volume):
+    """On Balance Volume (OBV), see help(ta.obv)"""
+    signed_volume = signed_series(close, initial=1) * as_float(volume)
+    return cumsum(signed_volume)
+
+
+def pvi(close, volume, initial=1000, multiplicative=False):
+    """Positive Volume Index (PVI), see help(ta.pvi)"""
+    return _volume_index(close, volume, initial, False, multiplicative)
+
+
+def pvol(close, volume, signed=True):
+    """Price-Volume (PVOL), see help(ta.pvol)"""
+    close = as_float(close)
+    if signed:
+        return as_float(signed_series(close, 1)) * close * as_float(volume)
+    return close * as_float(volume)
+
+
+def pvt(close, volume, drift=1):
+    """Price-Volume Trend (PVT), see help(ta.pvt)"""
+    pv = roc(close, length=drift) * as_float(volume)
+    return cumsum(pv)
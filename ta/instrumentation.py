@@ -0,0 +1,240 @@
+# -*- coding: utf-8 -*-
+"""Instrumentation
+
+A process wide registry of per indicator metrics, for every call of an
+indicator, whether made directly (ta.rsi) or through the 'ta' DataFrame
+extension: call and error counts, input sizes, wall and CPU time (both with
+time.perf_counter precision, CPU time per thread) as histograms, and the
+bytes of the results.  With memory=True it also records the bytes each call
+allocates, traced with tracemalloc, which slows down every allocation of
+the process while it is on.  The allocated bytes are the peak of each call
+on Python 3.9+; before 3.9, which cannot reset the traced peak, they are
+the bytes still allocated when the call returns.
+
+>>> ta.instrumentation.enable()
+>>> df.ta.rsi(); ta.macd(df['close'])
+>>> ta.instrumentation.to_dict()['rsi']['calls']
+>>> print(ta.instrumentation.to_prometheus()) # For a metrics scraper
+>>> ta.instrumentation.disable()
+
+Disabled, which is the default, it costs one attribute check per indicator.
+"""
+import threading
+import time
+import tracemalloc
+
+from bisect import bisect_left
+from functools import wraps
+from math import inf
+
+import numpy as np
+import pandas as pd
+
+# Upper bounds of the histogram buckets, the last one is +Inf
+SECONDS_BUCKETS = (1e-5, 2.5e-5, 5e-5, 1e-4, 2.5e-4, 5e-4, 1e-3, 2.5e-3, 5e-3,
+    1e-2, 2.5e-2, 5e-2, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, inf)
+BARS_BUCKETS = (1e2, 1e3, 1e4, 1e5, 1e6, 1e7, 1e8, inf)
+
+# tracemalloc.reset_peak is new in Python 3.9
+_RESET_PEAK = hasattr(tracemalloc, 'reset_peak')
+
+
+
+class Histogram(object):
+    """Counts of observations per bucket, with their sum and count.  The
+    counts are per bucket, not cumulative."""
+    __slots__ = ('buckets', 'counts', 'sum', 'count')
+
+    def __init__(self, buckets:tuple):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value:float):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def to_dict(self):
+        return {
+            'buckets': list(self.buckets),
+            'counts': list(self.counts),
+            'sum': self.sum,
+            'count': self.count,
+        }
+
+
+class IndicatorMetrics(object):
+    """The metrics of one indicator."""
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.bars = Histogram(BARS_BUCKETS)
+        self.wall = Histogram(SECONDS_BUCKETS)
+        self.cpu = Histogram(SECONDS_BUCKETS)
+        self.result_bytes = 0
+        self.allocated_bytes = 0
+
+    def to_dict(self):
+        return {
+            'calls': self.calls,
+            'errors': self.errors,
+            'bars': self.bars.to_dict(),
+            'wall_seconds': self.wall.to_dict(),
+            'cpu_seconds': self.cpu.to_dict(),
+            'result_bytes': self.result_bytes,
+            'allocated_bytes': self.allocated_bytes,
+        }
+
+
+def _nbytes(result):
+    """Bytes of the values of a Series, DataFrame or a tuple of them."""
+    if isinstance(result, tuple):
+        return sum(_nbytes(x) for x in result)
+    if isinstance(result, pd.Series):
+        return result.nbytes
+    if isinstance(result, pd.DataFrame):
+        return result.shape[0] * sum(dtype.itemsize for dtype in result.dtypes)
+    if isinstance(result, np.ndarray):
+        return result.nbytes
+    return 0
+
+
+class Registry(object):
+    """Instrumentation Registry
+
+    Records the metrics of the calls made through record() while enabled.
+    The indicators, see instrumented, record every call under their name.
+    """
+    def __init__(self):
+        self.enabled = False
+        self.memory = False
+        self.metrics = {}
+        self._lock = threading.Lock()
+        self._tracing = False # Whether enable() started tracemalloc
+
+    def enable(self, memory:bool = False):
+        """Starts recording.  With memory=True, the bytes allocated by every
+        call are traced with tracemalloc."""
+        self.memory = bool(memory)
+        if self.memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._tracing = True
+        self.enabled = True
+
+    def disable(self):
+        """Stops recording, the metrics are kept."""
+        self.enabled = False
+        if self._tracing:
+            tracemalloc.stop()
+            self._tracing = False
+        self.memory = False
+
+    def reset(self):
+        """Removes all the metrics."""
+        with self._lock:
+            self.metrics = {}
+
+    def record(self, name:str, bars:int, fn, *args, **kwargs):
+        """Returns fn(*args, **kwargs), recorded as a call of the indicator
+        'name' on 'bars' bars."""
+        memory = self.memory and tracemalloc.is_tracing()
+        if memory:
+            if _RESET_PEAK:
+                tracemalloc.reset_peak()
+            start_bytes = tracemalloc.get_traced_memory()[0]
+
+        start_wall, start_cpu = time.perf_counter(), time.thread_time()
+        try:
+            result = fn(*args, **kwargs)
+        except Exception:
+            with self._lock:
+                self._metrics(name).errors += 1
+            raise
+        wall, cpu = time.perf_counter() - start_wall, time.thread_time() - start_cpu
+        allocated = 0
+        if memory:
+            current, peak = tracemalloc.get_traced_memory()
+            allocated = (peak if _RESET_PEAK else current) - start_bytes
+
+        with self._lock:
+            metrics = self._metrics(name)
+            metrics.calls += 1
+            metrics.bars.observe(bars)
+            metrics.wall.observe(wall)
+            metrics.cpu.observe(cpu)
+            metrics.result_bytes += _nbytes(result)
+            metrics.allocated_bytes += allocated
+        return result
+
+    def _metrics(self, name:str):
+        if name not in self.metrics:
+            self.metrics[name] = IndicatorMetrics()
+        return self.metrics[name]
+
+    def to_dict(self):
+        """The metrics as {indicator: {metric: value}}."""
+        with self._lock:
+            return {name: metrics.to_dict() for name, metrics in self.metrics.items()}
+
+    def to_prometheus(self, prefix:str = 'ta'):
+        """The metrics in the Prometheus text exposition format."""
+        with self._lock:
+            metrics = sorted(self.metrics.items())
+
+        lines = []
+        def counter(metric, help_, attr):
+            lines.append(f"# HELP {prefix}_{metric} {help_}")
+            lines.append(f"# TYPE {prefix}_{metric} counter")
+            for name, m in metrics:
+                lines.append(f'{prefix}_{metric}{{indicator="{name}"}} {getattr(m, attr)}')
+
+        def histogram(metric, help_, attr):
+            lines.append(f"# HELP {prefix}_{metric} {help_}")
+            lines.append(f"# TYPE {prefix}_{metric} histogram")
+            for name, m in metrics:
+                h, cumulative = getattr(m, attr), 0
+                for bound, count in zip(h.buckets, h.counts):
+                    cumulative += count
+                    le = '+Inf' if bound == inf else f"{bound:g}"
+                    lines.append(f'{prefix}_{metric}_bucket{{indicator="{name}",le="{le}"}} {cumulative}')
+                lines.append(f'{prefix}_{metric}_sum{{indicator="{name}"}} {h.sum:.9g}')
+                lines.append(f'{prefix}_{metric}_count{{indicator="{name}"}} {h.count}')
+
+        counter('indicator_calls_total', "Indicator calls.", 'calls')
+        counter('indicator_errors_total', "Indicator calls that raised.", 'errors')
+        histogram('indicator_input_bars', "Bars of the indicator inputs.", 'bars')
+        histogram('indicator_wall_seconds', "Wall time of the indicator calls.", 'wall')
+        histogram('indicator_cpu_seconds', "CPU time of the indicator calls.", 'cpu')
+        counter('indicator_result_bytes_total', "Bytes of the indicator results.", 'result_bytes')
+        counter('indicator_allocated_bytes_total', "Bytes allocated by the indicator calls, when memory is traced.", 'allocated_bytes')
+        return '\n'.join(lines) + '\n'
+
+
+registry = Registry()
+
+
+def _bars(args, kwargs):
+    """Rows of the first Series or DataFrame argument, 0 if there is none."""
+    for value in list(args) + list(kwargs.values()):
+        if isinstance(value, (pd.Series, pd.DataFrame)):
+            return value.shape[0]
+    return 0
+
+
+def instrumented(indicator):
+    """Indicator decorator that records its calls in the registry while it is
+    enabled."""
+    @wraps(indicator)
+    def wrapper(*args, **kwargs):
+        if not registry.enabled:
+            return indicator(*args, **kwargs)
+        return registry.record(indicator.__name__, _bars(args, kwargs), indicator, *args, **kwargs)
+    return wrapper
+
+enable = registry.enable
+disable = registry.disable
+reset = registry.reset
+to_dict = registry.to_dict
+to_prometheus = registry.to_prometheus
@@ -9,11 +9,14 @@
 import numpy as np
 import pandas as pd
 
-from .utils import get_drift, get_offset, verify_series
-from .overlap import hlc3, ema, wma
+from . import core
+from .instrumentation import instrumented
+from .overlap import ema
+from .utils import as_pandas, get_drift, get_offset, precision, verify_series
 
 
 
+@instrumented
 def ao(high, low, fast=None, slow=None, offset=None, **kwargs):
     """Indicator: Awesome Oscillator (AO)"""
     # Validate Arguments
@@ -27,10 +30,9 @@ def ao(high, low, fast=None, slow=None, offset=None, **kwargs):
     offset = get_offset(offset)
 
     # Calculate Result
-    median_price = 0.5 * (high + low)
-    fast_sma = median_price.rolling(fast, min_periods=min_periods).mean()
-    slow_sma = median_price.rolling(slow, min_periods=min_periods).mean()
-    ao = fast_sma - slow_sma
+    with precision(kwargs.get('dtype')):
+        ao = core.ao(high.values, low.values, fast=fast, slow=slow, min_periods=min_periods)
+    ao = as_pandas(ao, high)
 
     # Offset
     if offset != 0:
@@ -49,6 +51,7 @@ def ao(high, low, fast=None, slow=None, offset=None, **kwargs):
     return ao
 
 
+@instrumented
 def apo(close, fast=None, slow=None, offset=None, **kwargs):
     """Indicator: Absolute Price Oscillator (APO)"""
     # Validate Arguments
@@ -61,9 +64,9 @@ def apo(close, fast=None, slow=None, offset=None, **kwargs):
     offset = get_offset(offset)
 
     # Calculate Result
-    fastma = close.ewm(span=fast, min_periods=min_periods).mean()
-    slowma = close.ewm(span=slow, min_periods=min_periods).mean()
-    apo = fastma - slowma
+    with precision(kwargs.get('dtype')):
+        apo = core.apo(close.values, fast=fast, slow=slow, min_periods=min_periods)
+    apo = as_pandas(apo, close)
 
     # Offset
     if offset != 0:
@@ -82,6 +85,7 @@ def apo(close, fast=None, slow=None, offset=None, **kwargs):
     return apo
 
 
+@instrumented
 def bop(open_, high, low, close, offset=None, **kwargs):
     """Indicator: Balance of Power (BOP)"""
     # Validate Arguments
@@ -92,9 +96,9 @@ def bop(open_, high, low, close, offset=None, **kwargs):
     offset = get_offset(offset)
 
     # Calculate Result
-    close_open_range = close - open_
-    high_log_range = high - low
-    bop = close_open_range / high_log_range
+    with precision(kwargs.get('dtype')):
+        bop = core.bop(open_.values, high.values, low.values, close.values)
+    bop = as_pandas(bop, close)
 
     # Offset
     if offset != 0:
@@ -113,6 +117,7 @@ def bop(open_, high, low, close, offset=None, **kwargs):
     return bop
 
 
+@instrumented
 def cci(high, low, close, length=None, c=None, offset=None, **kwargs):
     """Indicator: Commodity Channel Index (CCI)"""
     # Validate Arguments
@@ -125,15 +130,9 @@ def cci(high, low, close, length=None, c=None, offset=None, **kwargs):
     offset = get_offset(offset)
 
     # Calculate Result
-    def mad(series):
-        """Mean Absolute Deviation"""
-        return np.fabs(series - series.mean()).mean()
-
-    typical_price = hlc3(high=high, low=low, close=close)
-    mean_typical_price = typical_price.rolling(length, min_periods=min_periods).mean()
-    mad_typical_price = typical_price.rolling(length).apply(mad, raw=True)
-
-    cci = (typical_price - mean_typical_price) / (c * mad_typical_price)
+    with precision(kwargs.get('dtype')):
+        cci = core.cci(high.values, low.values, close.values, length=length, c=c, min_periods=min_periods)
+    cci = as_pandas(cci, close)
 
     # Offset
     if offset != 0:
@@ -152,6 +151,7 @@ def cci(high, low, close, length=None, c=None, offset=None, **kwargs):
     return cci
 
 
+@instrumented
 def cmo(close, length=None, drift=None, offset=None, **kwargs):
     """Indicator: Chande Momentum Oscillator (CMO)"""
     # Validate Arguments
@@ -161,16 +161,8 @@ def cmo(close, length=None, drift=None, offset=None, **kwargs):
     offset = get_offset(offset)
 
     # Calculate Result
-    negative = close.diff(drift)
-    positive = negative.copy()
-
-    positive[positive < 0] = 0  # Make negatives 0 for the postive series
-    negative[negative > 0] = 0  # Make postives 0 for the negative series
-
-    pos_sum = positive.rolling(length).sum()
-    neg_sum = np.fabs(negative).rolling(length).sum()
-    
-    cmo = 100 * (pos_sum - neg_sum) / (pos_sum + neg_sum)
+    with precision(kwargs.get('dtype')):
+        cmo = as_pandas(core.cmo(close.values, length=length, drift=drift), close)
 
     # Offset
     if offset != 0:
@@ -189,6 +181,7 @@ def cmo(close, length=None, drift=None, offset=None, **kwargs):
     return cmo
 
 
+@instrumented
 def coppock(close, length=None, fast=None, slow=None, offset=None, **kwargs):
     """Indicator: Coppock Curve (COPC)"""
     # Validate Arguments
@@ -200,8 +193,9 @@ def coppock(close, length=None, fast=None, slow=None, offset=None, **kwargs):
     offset = get_offset(offset)
 
     # Calculate Result
-    total_roc = roc(close, fast) + roc(close, slow)
-    coppock = wma(total_roc, length)
+    with precision(kwargs.get('dtype')):
+        coppock = core.coppock(close.values, length=length, fast=fast, slow=slow)
+    coppock = as_pandas(coppock, close)
 
     # Offset
     if offset != 0:
@@ -221,6 +215,7 @@ def coppock(close, length=None, fast=None, slow=None, offset=None, **kwargs):
 
 
 
+@instrumented
 def kst(close, roc1=None, roc2=None, roc3=None, roc4=None, sma1=None, sma2=None, sma3=None, sma4=None, signal=None, drift=None, offset=None, **kwargs):
     """Indicator: 'Know Sure Thing'"""
     # Validate arguments
@@ -240,13 +235,9 @@ def kst(close, roc1=None, roc2=None, roc3=None, roc4=None, sma1=None, sma2=None,
     offset = get_offset(offset)
 
     # Calculate Result
-    rocma1 = roc(close, roc1).rolling(sma1).mean()
-    rocma2 = roc(close, roc2).rolling(sma2).mean()
-    rocma3 = roc(close, roc3).rolling(sma3).mean()
-    rocma4 = roc(close, roc4).rolling(sma4).mean()
-
-    kst = 100 * (rocma1 + 2 * rocma2 + 3 * rocma3 + 4 * rocma4)
-    kst_signal = kst.rolling(signal).mean()
+    with precision(kwargs.get('dtype')):
+        kst, kst_signal = core.kst(close.values, roc1=roc1, roc2=roc2, roc3=roc3, roc4=roc4, sma1=sma1, sma2=sma2, sma3=sma3, sma4=sma4, signal=signal)
+    kst, kst_signal = as_pandas(kst, close), as_pandas(kst_signal, close)
 
     # Offset
     if offset != 0:
@@ -268,13 +259,14 @@ def kst(close, roc1=None, roc2=None, roc3=None, roc4=None, sma1=None, sma2=None,
 
     # Prepare DataFrame to return
     data = {kst.name: kst, kst_signal.name: kst_signal}
-    kstdf = pd.DataFrame(data)
+    kstdf = pd.concat(data, axis=1)
     kstdf.name = f"KST_{roc1}_{roc2}_{roc3}_{roc4}_{sma1}_{sma2}_{sma3}_{sma4}_{signal}"
     kstdf.category = 'momentum'
 
     return kstdf
 
 
+@instrumented
 def macd(close, fast=None, slow=None, signal=None, offset=None, **kwargs):
     """Indicator: Moving Average, Convergence/Divergence (MACD)"""
     # Validate arguments
@@ -288,12 +280,9 @@ def macd(close, fast=None, slow=None, signal=None, offset=None, **kwargs):
     offset = get_offset(offset)
 
     # Calculate Result
-    fastma = close.ewm(span=fast, min_periods=min_periods).mean()
-    slowma = close.ewm(span=slow, min_periods=min_periods).mean()
-
-    macd = fastma - slowma
-    signalma = macd.ewm(span=signal, min_periods=min_periods).mean()
-    histogram = macd - signalma
+    with precision(kwargs.get('dtype')):
+        macd, histogram, signalma = core.macd(close.values, fast=fast, slow=slow, signal=signal, min_periods=min_periods)
+    macd, histogram, signalma = [as_pandas(x, close) for x in (macd, histogram, signalma)]
 
     # Offset
     if offset != 0:
@@ -319,13 +308,14 @@ def macd(close, fast=None, slow=None, signal=None, offset=None, **kwargs):
 
     # Prepare DataFrame to return
     data = {macd.name: macd, histogram.name: histogram, signalma.name: signalma}
-    macddf = pd.DataFrame(data)
+    macddf = pd.concat(data, axis=1)
     macddf.name = f"MACD_{fast}_{slow}_{signal}"
     macddf.category = 'momentum'
 
     return macddf
 
 
+@instrumented
 def mom(close, length=None, offset=None, **kwargs):
     """Indicator: Momentum (MOM)"""
     # Validate Arguments
@@ -334,7 +324,8 @@ def mom(close, length=None, offset=None, **kwargs):
     offset = get_offset(offset)
 
     # Calculate Result
-    mom = close.diff(length)
+    with precision(kwargs.get('dtype')):
+        mom = as_pandas(core.mom(close.values, length=length), close)
 
     # Offset
     if offset != 0:
@@ -353,6 +344,7 @@ def mom(close, length=None, offset=None, **kwargs):
     return mom
 
 
+@instrumented
 def ppo(close, fast=None, slow=None, signal=None, offset=None, **kwargs):
     """Indicator: Percentage Price Oscillator (PPO)"""
     # Validate Arguments
@@ -366,12 +358,9 @@ def ppo(close, fast=None, slow=None, signal=None, offset=None, **kwargs):
     offset = get_offset(offset)
 
     # Calculate Result
-    fastma = close.rolling(fast, min_periods=min_periods).mean()
-    slowma = close.rolling(slow, min_periods=min_periods).mean()
-
-    ppo = 100 * (fastma - slowma) / slowma
-    signalma = ppo.ewm(span=signal, min_periods=min_periods).mean()
-    histogram = ppo - signalma
+    with precision(kwargs.get('dtype')):
+        ppo, histogram, signalma = core.ppo(close.values, fast=fast, slow=slow, signal=signal, min_periods=min_periods)
+    ppo, histogram, signalma = [as_pandas(x, close) for x in (ppo, histogram, signalma)]
 
     # Offset
     if offset != 0:
@@ -397,13 +386,14 @@ def ppo(close, fast=None, slow=None, signal=None, offset=None, **kwargs):
 
     # Prepare DataFrame to return
     data = {ppo.name: ppo, histogram.name: histogram, signalma.name: signalma}
-    ppodf = pd.DataFrame(data)
+    ppodf = pd.concat(data, axis=1)
     ppodf.name = f"PPO_{fast}_{slow}_{signal}"
     ppodf.category = 'momentum'
 
     return ppodf
 
 
+@instrumented
 def roc(close, length=None, offset=None, **kwargs):
     """Indicator: Rate of Change (ROC)"""
     # Validate Arguments
@@ -413,7 +403,8 @@ def roc(close, length=None, offset=None, **kwargs):
     offset = get_offset(offset)
 
     # Calculate Result
-    roc = 100 * mom(close=close, length=length) / close.shift(length)
+    with precision(kwargs.get('dtype')):
+        roc = as_pandas(core.roc(close.values, length=length), close)
 
     # Offset
     if offset != 0:
@@ -432,6 +423,7 @@ def roc(close, length=None, offset=None, **kwargs):
     return roc
 
 
+@instrumented
 def rsi(close, length=None, drift=None, offset=None, **kwargs):
     """Indicator: Relative Strength Index (RSI)"""
     # Validate arguments
@@ -441,16 +433,8 @@ def rsi(close, length=None, drift=None, offset=None, **kwargs):
     offset = get_offset(offset)
 
     # Calculate Result
-    negative = close.diff(drift)
-    positive = negative.copy()
-
-    positive[positive < 0] = 0  # Make negatives 0 for the postive series
-    negative[negative > 0] = 0  # Make postives 0 for the negative series
-
-    positive_avg = positive.ewm(com=length, adjust=False).mean()
-    negative_avg = negative.ewm(com=length, adjust=False).mean().abs()
-
-    rsi = 100 * positive_avg / (positive_avg + negative_avg)
+    with precision(kwargs.get('dtype')):
+        rsi = as_pandas(core.rsi(close.values, length=length, drift=drift), close)
 
     # Offset
     if offset != 0:
@@ -469,6 +453,7 @@ def rsi(close, length=None, drift=None, offset=None, **kwargs):
     return rsi
 
 
+@instrumented
 def stoch(high, low, close, fast_k=None, slow_k=None, slow_d=None, offset=None, **kwargs):
     """Indicator: Stochastic Oscillator (STOCH)"""
     # Validate arguments
@@ -481,14 +466,9 @@ def stoch(high, low, close, fast_k=None, slow_k=None, slow_d=None, offset=None,
     offset = get_offset(offset)
 
     # Calculate Result
-    lowest_low   =  low.rolling(fast_k, min_periods=fast_k - 1).min()
-    highest_high = high.rolling(fast_k, min_periods=fast_k - 1).max()
-
-    fastk = 100 * (close - lowest_low) / (highest_high - lowest_low)
-    fastd = fastk.rolling(slow_d, min_periods=slow_d - 1).mean()
-
-    slowk = fastk.rolling(slow_k, min_periods=slow_k).mean()
-    slowd = slowk.rolling(slow_d, min_periods=slow_d).mean()
+    with precision(kwargs.get('dtype')):
+        stoch = core.stoch(high.values, low.values, close.values, fast_k=fast_k, slow_k=slow_k, slow_d=slow_d)
+    fastk, fastd, slowk, slowd = [as_pandas(x, close) for x in stoch]
 
     # Offset
     if offset != 0:
@@ -518,13 +498,14 @@ def stoch(high, low, close, fast_k=None, slow_k=None, slow_d=None, offset=None,
 
     # Prepare DataFrame to return
     data = {fastk.name: fastk, fastd.name: fastd, slowk.name: slowk, slowd.name: slowd}
-    stochdf = pd.DataFrame(data)
+    stochdf = pd.concat(data, axis=1)
     stochdf.name = f"STOCH_{fast_k}_{slow_k}_{slow_d}"
     stochdf.category = 'momentum'
 
     return stochdf
 
 
+@instrumented
 def trix(close, length=None, drift=None, offset=None, **kwargs):
     """Indicator: Trix (TRIX)"""
     # Validate Arguments
@@ -535,10 +516,9 @@ def trix(close, length=None, drift=None, offset=None, **kwargs):
     offset = get_offset(offset)
 
     # Calculate Result
-    ema1 = ema(close=close, length=length, min_periods=min_periods)
-    ema2 = ema(close=ema1, length=length, min_periods=min_periods)
-    ema3 = ema(close=ema2, length=length, min_periods=min_periods)
-    trix = 100 * ema3.pct_change(drift)
+    with precision(kwargs.get('dtype')):
+        trix = core.trix(close.values, length=length, drift=drift, min_periods=min_periods)
+    trix = as_pandas(trix, close)
 
     # Offset
     if offset != 0:
@@ -551,6 +531,7 @@ def trix(close, length=None, drift=None, offset=None, **kwargs):
     return trix
 
 
+@instrumented
 def tsi(close, fast=None, slow=None, drift=None, offset=None, **kwargs):
     """Indicator: True Strength Index (TSI)"""
     # Validate Arguments
@@ -563,15 +544,8 @@ def tsi(close, fast=None, slow=None, drift=None, offset=None, **kwargs):
     offset = get_offset(offset)
 
     # Calculate Result
-    diff = close.diff(drift)
-
-    slow_ema = diff.ewm(span=slow).mean()
-    fast_slow_ema = slow_ema.ewm(span=fast).mean()
-
-    _ma = abs(diff).ewm(span=slow).mean()
-    ma = _ma.ewm(span=fast).mean()
-
-    tsi = 100 * fast_slow_ema / ma
+    with precision(kwargs.get('dtype')):
+        tsi = as_pandas(core.tsi(close.values, fast=fast, slow=slow, drift=drift), close)
 
     # Offset
     if offset != 0:
@@ -590,6 +564,7 @@ def tsi(close, fast=None, slow=None, drift=None, offset=None, **kwargs):
     return tsi
 
 
+@instrumented
 def uo(high, low, close, fast=None, medium=None, slow=None, fast_w=None, medium_w=None, slow_w=None, drift=None, offset=None, **kwargs):
     """Indicator: Ultimate Oscillator (UO)"""
     # Validate arguments
@@ -609,19 +584,9 @@ def uo(high, low, close, fast=None, medium=None, slow=None, fast_w=None, medium_
     slow_w = float(slow_w) if slow_w and slow_w > 0 else 1.0
 
     # Calculate Result
-    min_l_or_pc = close.shift(drift).combine(low, min)
-    max_h_or_pc = close.shift(drift).combine(high, max)
-
-    bp = close - min_l_or_pc
-    tr = max_h_or_pc - min_l_or_pc
-
-    fast_avg = bp.rolling(fast).sum() / tr.rolling(fast).sum()
-    medium_avg = bp.rolling(medium).sum() / tr.rolling(medium).sum()
-    slow_avg = bp.rolling(slow).sum() / tr.rolling(slow).sum()
-
-    total_weight =  fast_w + medium_w + slow_w
-    weights = (fast_w * fast_avg) + (medium_w * medium_avg) + (slow_w * slow_avg)
-    uo = 100 * weights / total_weight
+    with precision(kwargs.get('dtype')):
+        uo = core.uo(high.values, low.values, close.values, fast=fast, medium=medium, slow=slow, fast_w=fast_w, medium_w=medium_w, slow_w=slow_w, drift=drift)
+    uo = as_pandas(uo, close)
 
     # Offset
     if offset != 0:
@@ -640,6 +605,7 @@ def uo(high, low, close, fast=None, medium=None, slow=None, fast_w=None, medium_
     return uo
 
 
+@instrumented
 def willr(high, low, close, length=None, offset=None, **kwargs):
     """Indicator: William's Percent R (WILLR)"""
     # Validate arguments
@@ -651,10 +617,9 @@ def willr(high, low, close, length=None, offset=None, **kwargs):
     offset = get_offset(offset)
 
     # Calculate Result
-    lowest_low = low.rolling(length, min_periods=min_periods).min()
-    highest_high = high.rolling(length, min_periods=min_periods).max()
-
-    willr = 100 * ((close - lowest_low) / (highest_high - lowest_low) - 1)
+    with precision(kwargs.get('dtype')):
+        willr = core.willr(high.values, low.values, close.values, length=length, min_periods=min_periods)
+    willr = as_pandas(willr, close)
 
     # Offset
     if offset != 0:
@@ -1139,6 +1104,8 @@ Calculation:
     ema3 = EMA(ema2, length)
     TRIX = 100 * ROC(ema3, drift)
 
+    ema1 through ema3 are computed in a single ema_cascade(close, length, 3) call.
+
 Args:
     close (pd.Series): Series of 'close's
     length (int): It's period.  Default: 18
@@ -1207,8 +1174,8 @@ Calculation:
     Default Inputs:
         fast=7, medium=14, slow=28,
         fast_w=4.0, medium_w=2.0, slow_w=1.0, drift=1
-    min_low_or_pc  = close.shift(drift).combine(low, min)
-    max_high_or_pc = close.shift(drift).combine(high, max)
+    min_low_or_pc  = MIN(close.shift(drift), low)
+    max_high_or_pc = MAX(close.shift(drift), high)
 
     bp = buying pressure = close - min_low_or_pc
     tr = true range = max_high_or_pc - min_low_or_pc
@@ -1334,27 +1301,16 @@ def money_flow_index_depreciated(high, low, close, volume, n=14, fillna=False):
         pandas.Series: New feature generated.
 
     """
-    # 0 Prepare dataframe to work
-    df = pd.DataFrame([high, low, close, volume]).T
-    df.columns = ['High', 'Low', 'Close', 'Volume']
-    df['Up_or_Down'] = 0
-    df.loc[(df['Close'] > df['Close'].shift(1)), 'Up_or_Down'] = 1
-    df.loc[(df['Close'] < df['Close'].shift(1)), 'Up_or_Down'] = 2
-
     # 1 typical price
-    tp = (df['High'] + df['Low'] + df['Close']) / 3.0
+    tp = (high + low + close) / 3.0
 
     # 2 money flow
-    mf = tp * df['Volume']
-
-    # 3 positive and negative money flow with n periods
-    df['1p_Positive_Money_Flow'] = 0.0
-    df.loc[df['Up_or_Down'] == 1, '1p_Positive_Money_Flow'] = mf
-    n_positive_mf = df['1p_Positive_Money_Flow'].rolling(n).sum()
+    mf = tp * volume
 
-    df['1p_Negative_Money_Flow'] = 0.0
-    df.loc[df['Up_or_Down'] == 2, '1p_Negative_Money_Flow'] = mf
-    n_negative_mf = df['1p_Negative_Money_Flow'].rolling(n).sum()
+    # 3 positive and negative money flow with n periods, by the close's change
+    prev_close = close.shift(1)
+    n_positive_mf = mf.where(close > prev_close, 0.0).rolling(n).sum()
+    n_negative_mf = mf.where(close < prev_close, 0.0).rolling(n).sum()
 
     # 4 money flow index
     mr = n_positive_mf / n_negative_mf
@@ -1421,17 +1377,8 @@ def uo_depreciated(high, low, close, s=7, m=14, l=28, ws=4.0, wm=2.0, wl=1.0, fi
         pandas.Series: New feature generated.
 
     """
-    min_l_or_pc = close.shift(1).combine(low, min)
-    max_h_or_pc = close.shift(1).combine(high, max)
-
-    bp = close - min_l_or_pc
-    tr = max_h_or_pc - min_l_or_pc
-
-    avg_s = bp.rolling(s).sum() / tr.rolling(s).sum()
-    avg_m = bp.rolling(m).sum() / tr.rolling(m).sum()
-    avg_l = bp.rolling(l).sum() / tr.rolling(l).sum()
-
-    uo = 100.0 * ((ws * avg_s) + (wm * avg_m) + (wl * avg_l)) / (ws + wm + wl)
+    uo = core.uo(high.values, low.values, close.values, fast=s, medium=m, slow=l, fast_w=ws, medium_w=wm, slow_w=wl)
+    uo = as_pandas(uo, close)
     if fillna:
         uo = uo.replace([np.inf, -np.inf], np.nan).fillna(50)
     return pd.Series(uo, name='uo')
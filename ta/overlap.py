@@ -1,25 +1,14 @@
 # -*- coding: utf-8 -*-
-import math
 import numpy as np
 import pandas as pd
 
-try:
-    import scipy
-    _SCIPY_ = True
-except ImportError:
-    _SCIPY_ = False
+from . import core
+from .instrumentation import instrumented
+from .utils import as_pandas, get_drift, get_offset, precision, verify_series
 
-from .utils import fibonacci, pascals_triangle
-from .utils import get_drift, get_offset, verify_series
-
-
-
-def weights(w):
-    def _compute(x):
-        return np.dot(w, x)
-    return _compute
 
 
+@instrumented
 def dema(close, length=None, offset=None, **kwargs):
     """Indicator: Double Exponential Moving Average (DEMA)"""
     # Validate Arguments
@@ -29,9 +18,9 @@ def dema(close, length=None, offset=None, **kwargs):
     offset = get_offset(offset)
 
     # Calculate Result
-    ema1 = ema(close=close, length=length, min_periods=min_periods)
-    ema2 = ema(close=ema1, length=length, min_periods=min_periods)
-    dema = 2 * ema1 - ema2
+    with precision(kwargs.get('dtype')):
+        dema = core.dema(close.values, length=length, min_periods=min_periods)
+    dema = as_pandas(dema, close)
 
     # Offset
     if offset != 0:
@@ -44,6 +33,7 @@ def dema(close, length=None, offset=None, **kwargs):
     return dema
 
 
+@instrumented
 def ema(close, length=None, offset=None, **kwargs):
     """Indicator: Exponential Moving Average (EMA)"""
     # Validate Arguments
@@ -51,15 +41,13 @@ def ema(close, length=None, offset=None, **kwargs):
     length = int(length) if length and length > 0 else 10
     min_periods = int(kwargs['min_periods']) if 'min_periods' in kwargs and kwargs['min_periods'] is not None else length#int(0.25 * length)
     adjust = bool(kwargs['adjust']) if 'adjust' in kwargs and kwargs['adjust'] is not None else True
+    presma = bool(kwargs['presma']) if 'presma' in kwargs and kwargs['presma'] is not None else False
     offset = get_offset(offset)
 
     # Calculate Result
-    if 'presma' in kwargs and kwargs['presma']:
-        initial_sma = sma(close=close, length=length)[:length]
-        rest = close[length:]
-        close = pd.concat([initial_sma, rest])
-
-    ema = close.ewm(span=length, min_periods=min_periods, adjust=adjust).mean()
+    with precision(kwargs.get('dtype')):
+        ema = core.ema(close.values, length=length, min_periods=min_periods, adjust=adjust, presma=presma)
+    ema = as_pandas(ema, close)
 
     # Offset
     if offset != 0:
@@ -72,6 +60,38 @@ def ema(close, length=None, offset=None, **kwargs):
     return ema
 
 
+@instrumented
+def ema_cascade(close, length=None, levels=None, **kwargs):
+    """EMA Cascade: EMA levels 1 through 'levels' of the same length
+
+    Level 1 is EMA(close), level 2 is EMA(level 1), and so on.  All levels are
+    computed on raw arrays into one preallocated (n, levels) buffer, so DEMA,
+    TEMA, T3 and TRIX can all take what they need from a single call.  With
+    scipy, each level is one compiled lfilter pass, otherwise each level is
+    one ewm pass over the previous buffer column.
+    """
+    # Validate Arguments
+    close = verify_series(close)
+    length = int(length) if length and length > 0 else 10
+    levels = int(levels) if levels and levels > 0 else 1
+    min_periods = int(kwargs['min_periods']) if 'min_periods' in kwargs and kwargs['min_periods'] is not None else length
+    adjust = bool(kwargs['adjust']) if 'adjust' in kwargs and kwargs['adjust'] is not None else True
+    presma = bool(kwargs['presma']) if 'presma' in kwargs and kwargs['presma'] is not None else False
+
+    # Calculate Result
+    with precision(kwargs.get('dtype')):
+        cascade = core.ema_cascade(close.values, length=length, levels=levels, min_periods=min_periods, adjust=adjust, presma=presma)
+
+    # Name & Category
+    columns = [f"EMA{level + 1}_{length}" for level in range(levels)]
+    cascadedf = pd.DataFrame(cascade, index=close.index, columns=columns, copy=False)
+    cascadedf.name = f"EMAC_{length}_{levels}"
+    cascadedf.category = 'overlap'
+
+    return cascadedf
+
+
+@instrumented
 def fwma(close, length=None, asc=None, offset=None, **kwargs):
     """Indicator: Fibonacci's Weighted Moving Average (FWMA)"""
     # Validate Arguments
@@ -81,9 +101,9 @@ def fwma(close, length=None, asc=None, offset=None, **kwargs):
     asc = asc if asc else True
     offset = get_offset(offset)
 
-    # Calculate Result    
-    fibs = fibonacci(length - 1)
-    fwma = close.rolling(length, min_periods=length).apply(weights(fibs), raw=True)
+    # Calculate Result
+    with precision(kwargs.get('dtype')):
+        fwma = as_pandas(core.fwma(close.values, length=length), close)
 
     # Offset
     if offset != 0:
@@ -96,6 +116,7 @@ def fwma(close, length=None, asc=None, offset=None, **kwargs):
     return fwma
 
 
+@instrumented
 def hl2(high, low, offset=None, **kwargs):
     """Indicator: HL2 """
     # Validate Arguments
@@ -104,7 +125,8 @@ def hl2(high, low, offset=None, **kwargs):
     offset = get_offset(offset)
 
     # Calculate Result
-    hl2 = 0.5 * (high + low)
+    with precision(kwargs.get('dtype')):
+        hl2 = as_pandas(core.hl2(high.values, low.values), high)
 
     # Offset
     if offset != 0:
@@ -117,6 +139,7 @@ def hl2(high, low, offset=None, **kwargs):
     return hl2
 
 
+@instrumented
 def hlc3(high, low, close, offset=None, **kwargs):
     """Indicator: HLC3"""
     # Validate Arguments
@@ -126,7 +149,8 @@ def hlc3(high, low, close, offset=None, **kwargs):
     offset = get_offset(offset)
 
     # Calculate Result
-    hlc3 = (high + low + close) / 3
+    with precision(kwargs.get('dtype')):
+        hlc3 = as_pandas(core.hlc3(high.values, low.values, close.values), close)
 
     # Offset
     if offset != 0:
@@ -139,6 +163,7 @@ def hlc3(high, low, close, offset=None, **kwargs):
     return hlc3
 
 
+@instrumented
 def hma(close, length=None, offset=None, **kwargs):
     """Indicator: Hull Moving Average (HMA)
     
@@ -152,12 +177,8 @@ def hma(close, length=None, offset=None, **kwargs):
     offset = get_offset(offset)
 
     # Calculate Result
-    half_length = int(length / 2)
-    sqrt_length = int(math.sqrt(length))
-
-    wmaf = wma(close=close, length=half_length)
-    wmas = wma(close=close, length=length)
-    hma = wma(close=2 * wmaf - wmas, length=sqrt_length)
+    with precision(kwargs.get('dtype')):
+        hma = as_pandas(core.hma(close.values, length=length), close)
 
     # Offset
     if offset != 0:
@@ -170,6 +191,35 @@ def hma(close, length=None, offset=None, **kwargs):
     return hma
 
 
+def _forward_index(index:pd.Index, periods:int, freq=None, calendar=None):
+    """The index of the 'periods' bars after the end of 'index'.
+
+    The bars are the first of 'calendar', a DatetimeIndex of future bars (a
+    trading calendar), after the last bar, or those of 'freq' (str or
+    DateOffset, e.g. '1min' or a CustomBusinessDay with holidays).  Else the
+    spacing is the smallest step between the last four bars: business days
+    for daily bars, or that step for intraday and weekly bars.  A numeric
+    index continues with its last step.
+    """
+    if calendar is not None:
+        calendar = pd.DatetimeIndex(calendar)
+        return calendar[calendar > index[-1]][:periods]
+
+    if not isinstance(index, pd.DatetimeIndex):
+        step = index[-1] - index[-2] if len(index) > 1 else 1
+        return pd.Index(index[-1] + step * np.arange(1, periods + 1))
+
+    last = index[-1]
+    if freq is None:
+        steps = index[-4:][1:] - index[-4:][:-1]
+        steps = steps[steps > pd.Timedelta(0)]
+        step = steps.min() if len(steps) else pd.Timedelta(1, unit='d')
+        freq = 'B' if step == pd.Timedelta(1, unit='d') else step
+    offset = pd.tseries.frequencies.to_offset(freq)
+    return pd.date_range(start=last + offset, periods=periods, freq=offset)
+
+
+@instrumented
 def ichimoku(high, low, close, tenkan=None, kijun=None, senkou=None, offset=None, **kwargs):
     """Indicator: Ichimoku Kinkō Hyō (Ichimoku)"""
     high = verify_series(high)
@@ -181,18 +231,12 @@ def ichimoku(high, low, close, tenkan=None, kijun=None, senkou=None, offset=None
     offset = get_offset(offset)
 
     # Calculate Result
-    tenkan_sen = midprice(high=high, low=low, length=tenkan)
-    kijun_sen = midprice(high=high, low=low, length=kijun)
-    span_a = 0.5 * (tenkan_sen + kijun_sen)
-    span_b = midprice(high=high, low=low, length=senkou)
+    with precision(kwargs.get('dtype')):
+        ichimoku = core.ichimoku(high.values, low.values, close.values, tenkan=tenkan, kijun=kijun, senkou=senkou)
+    span_a, span_b, tenkan_sen, kijun_sen, chikou_span = [as_pandas(x, close) for x in ichimoku[:5]]
 
-    # Copy Span A and B values before their shift
-    _span_a = span_a[-kijun:].copy()
-    _span_b = span_b[-kijun:].copy()
-
-    span_a = span_a.shift(kijun)
-    span_b = span_b.shift(kijun)
-    chikou_span = close.shift(-kijun)
+    # Span A and B values before their shift
+    _span_a, _span_b = ichimoku[5:]
 
     # Offset
     if offset != 0:
@@ -228,19 +272,14 @@ def ichimoku(high, low, close, tenkan=None, kijun=None, senkou=None, offset=None
     ichimokudf.name = f"ICHIMOKU_{tenkan}_{kijun}_{senkou}"
     ichimokudf.category = 'overlap'
 
-    # Prepare Span DataFrame, assuming it is a 'Daily' content
-    last_date = close.index[-1]
-    df_freq = close.index.value_counts().mode()[0]
-    tdelta = pd.Timedelta(df_freq, unit='d')
-    new_dt = pd.date_range(start=last_date + tdelta, periods=kijun, freq='B')
-    spandf = pd.DataFrame(index=new_dt, columns=[span_a.name, span_b.name])
-    _span_a.index = _span_b.index = new_dt
-    spandf[span_a.name] = _span_a
-    spandf[span_b.name] = _span_b
+    # Prepare Span DataFrame on the index of the next bars
+    forward = _forward_index(close.index, len(_span_a), freq=kwargs.get('freq'), calendar=kwargs.get('calendar'))
+    spandf = pd.DataFrame({span_a.name: _span_a[:len(forward)], span_b.name: _span_b[:len(forward)]}, index=forward)
 
     return ichimokudf, spandf
 
 
+@instrumented
 def midpoint(close, length=None, offset=None, **kwargs):
     """Indicator: Midpoint"""
     # Validate arguments
@@ -250,9 +289,9 @@ def midpoint(close, length=None, offset=None, **kwargs):
     offset = get_offset(offset)
 
     # Calculate Result
-    lowest = close.rolling(length, min_periods=min_periods).min()
-    highest = close.rolling(length, min_periods=min_periods).max()
-    midpoint = 0.5 * (lowest + highest)
+    with precision(kwargs.get('dtype')):
+        midpoint = core.midpoint(close.values, length=length, min_periods=min_periods)
+    midpoint = as_pandas(midpoint, close)
 
     # Offset
     if offset != 0:
@@ -271,6 +310,7 @@ def midpoint(close, length=None, offset=None, **kwargs):
     return midpoint
 
 
+@instrumented
 def midprice(high, low, length=None, offset=None, **kwargs):
     """Indicator: Midprice"""
     # Validate arguments
@@ -281,9 +321,9 @@ def midprice(high, low, length=None, offset=None, **kwargs):
     offset = get_offset(offset)
 
     # Calculate Result
-    lowest_low = low.rolling(length, min_periods=min_periods).min()
-    highest_high = high.rolling(length, min_periods=min_periods).max()
-    midprice = 0.5 * (lowest_low + highest_high)
+    with precision(kwargs.get('dtype')):
+        midprice = core.midprice(high.values, low.values, length=length, min_periods=min_periods)
+    midprice = as_pandas(midprice, high)
 
     # Offset
     if offset != 0:
@@ -302,6 +342,7 @@ def midprice(high, low, length=None, offset=None, **kwargs):
     return midprice
 
 
+@instrumented
 def ohlc4(open_, high, low, close, offset=None, **kwargs):
     """Indicator: OHLC4"""
     # Validate Arguments
@@ -312,7 +353,8 @@ def ohlc4(open_, high, low, close, offset=None, **kwargs):
     offset = get_offset(offset)
 
     # Calculate Result
-    ohlc4 = 0.25 * (open_ + high + low + close)
+    with precision(kwargs.get('dtype')):
+        ohlc4 = as_pandas(core.ohlc4(open_.values, high.values, low.values, close.values), close)
 
     # Offset
     if offset != 0:
@@ -325,6 +367,7 @@ def ohlc4(open_, high, low, close, offset=None, **kwargs):
     return ohlc4
 
 
+@instrumented
 def pwma(close, length=None, asc=None, offset=None, **kwargs):
     """Indicator: Pascals Weighted Moving Average (PWMA)"""
     # Validate Arguments
@@ -335,8 +378,8 @@ def pwma(close, length=None, asc=None, offset=None, **kwargs):
     offset = get_offset(offset)
 
     # Calculate Result
-    triangle = pascals_triangle(length - 1)
-    pwma = close.rolling(length, min_periods=length).apply(weights(triangle), raw=True)
+    with precision(kwargs.get('dtype')):
+        pwma = as_pandas(core.pwma(close.values, length=length), close)
 
     # Offset
     if offset != 0:
@@ -349,6 +392,7 @@ def pwma(close, length=None, asc=None, offset=None, **kwargs):
     return pwma
 
 
+@instrumented
 def rma(close, length=None, offset=None, **kwargs):
     """Indicator: wildeR's Moving Average (RMA)"""
     # Validate Arguments
@@ -359,7 +403,8 @@ def rma(close, length=None, offset=None, **kwargs):
     alpha = (1.0 / length) if length > 0 else 1
 
     # Calculate Result
-    rma = close.ewm(alpha=alpha, min_periods=min_periods).mean()
+    with precision(kwargs.get('dtype')):
+        rma = as_pandas(core.rma(close.values, length=length, min_periods=min_periods), close)
 
     # Offset
     if offset != 0:
@@ -372,6 +417,7 @@ def rma(close, length=None, offset=None, **kwargs):
     return rma
 
 
+@instrumented
 def sma(close, length=None, offset=None, **kwargs):
     """Indicator: Simple Moving Average (SMA)"""
     # Validate Arguments
@@ -381,7 +427,8 @@ def sma(close, length=None, offset=None, **kwargs):
     offset = get_offset(offset)
 
     # Calculate Result
-    sma = close.rolling(length, min_periods=min_periods).mean()
+    with precision(kwargs.get('dtype')):
+        sma = as_pandas(core.sma(close.values, length=length, min_periods=min_periods), close)
 
     # Offset
     if offset != 0:
@@ -394,6 +441,7 @@ def sma(close, length=None, offset=None, **kwargs):
     return sma
 
 
+@instrumented
 def t3(close, length=None, a=None, offset=None, **kwargs):
     """Indicator: T3"""
     # Validate Arguments
@@ -401,21 +449,14 @@ def t3(close, length=None, a=None, offset=None, **kwargs):
     length = int(length) if length and length > 0 else 10
     min_periods = int(kwargs['min_periods']) if 'min_periods' in kwargs and kwargs['min_periods'] is not None else length
     a = float(a) if a and a > 0 and a < 1 else 0.7
+    adjust = bool(kwargs['adjust']) if 'adjust' in kwargs and kwargs['adjust'] is not None else True
+    presma = bool(kwargs['presma']) if 'presma' in kwargs and kwargs['presma'] is not None else False
     offset = get_offset(offset)
 
     # Calculate Result
-    c1 = -a * a ** 2
-    c2 = 3 * a ** 2 + 3 * a ** 3
-    c3 = -6 * a ** 2 - 3 * a - 3 * a ** 3
-    c4 = a ** 3 + 3 * a ** 2 + 3 * a + 1
-
-    e1 = ema(close=close, length=length, min_periods=min_periods, **kwargs)
-    e2 = ema(close=e1, length=length, min_periods=min_periods, **kwargs)
-    e3 = ema(close=e2, length=length, min_periods=min_periods, **kwargs)
-    e4 = ema(close=e3, length=length, min_periods=min_periods, **kwargs)
-    e5 = ema(close=e4, length=length, min_periods=min_periods, **kwargs)
-    e6 = ema(close=e5, length=length, min_periods=min_periods, **kwargs)
-    t3 = c1 * e6 + c2 * e5 + c3 * e4 + c4 * e3
+    with precision(kwargs.get('dtype')):
+        t3 = core.t3(close.values, length=length, a=a, min_periods=min_periods, adjust=adjust, presma=presma)
+    t3 = as_pandas(t3, close)
 
     # Offset
     if offset != 0:
@@ -428,6 +469,7 @@ def t3(close, length=None, a=None, offset=None, **kwargs):
     return t3
 
 
+@instrumented
 def tema(close, length=None, offset=None, **kwargs):
     """Indicator: Triple Exponential Moving Average (TEMA)"""
     # Validate Arguments
@@ -437,10 +479,8 @@ def tema(close, length=None, offset=None, **kwargs):
     offset = get_offset(offset)
 
     # Calculate Result
-    ema1 = ema(close=close, length=length, min_periods=min_periods)
-    ema2 = ema(close=ema1, length=length, min_periods=min_periods)
-    ema3 = ema(close=ema2, length=length, min_periods=min_periods)
-    tema = 3 * (ema1 - ema2) + ema3
+    with precision(kwargs.get('dtype')):
+        tema = as_pandas(core.tema(close.values, length=length, min_periods=min_periods), close)
 
     # Offset
     if offset != 0:
@@ -453,6 +493,7 @@ def tema(close, length=None, offset=None, **kwargs):
     return tema
 
 
+@instrumented
 def trima(close, length=None, offset=None, **kwargs):
     """Indicator: Triangular Moving Average (TRIMA)  *requires scipy"""
     # Validate Arguments
@@ -462,9 +503,8 @@ def trima(close, length=None, offset=None, **kwargs):
     offset = get_offset(offset)
 
     # Calculate Result
-    half_length = round(0.5 * (length + 1))
-    sma1 = close.rolling(half_length, min_periods=half_length).mean()
-    trima = sma1.rolling(half_length, min_periods=half_length).mean()
+    with precision(kwargs.get('dtype')):
+        trima = as_pandas(core.trima(close.values, length=length), close)
 
     # Offset
     if offset != 0:
@@ -477,6 +517,7 @@ def trima(close, length=None, offset=None, **kwargs):
     return trima
 
 
+@instrumented
 def vwap(high, low, close, volume, offset=None, **kwargs):
     """Indicator: Volume Weighted Average Price (VWAP)"""
     # Validate Arguments
@@ -487,9 +528,8 @@ def vwap(high, low, close, volume, offset=None, **kwargs):
     offset = get_offset(offset)
 
     # Calculate Result
-    tp = hlc3(high=high, low=low, close=close)
-    tpv = tp * volume
-    vwap = tpv.cumsum() / volume.cumsum()
+    with precision(kwargs.get('dtype')):
+        vwap = as_pandas(core.vwap(high.values, low.values, close.values, volume.values), close)
 
     # Offset
     if offset != 0:
@@ -502,6 +542,7 @@ def vwap(high, low, close, volume, offset=None, **kwargs):
     return vwap
 
 
+@instrumented
 def vwma(close, volume, length=None, offset=None, **kwargs):
     """Indicator: Volume Weighted Moving Average (VWMA)"""
     # Validate Arguments
@@ -511,8 +552,8 @@ def vwma(close, volume, length=None, offset=None, **kwargs):
     offset = get_offset(offset)
 
     # Calculate Result
-    pv = close * volume
-    vwma = sma(close=pv, length=length) / sma(close=volume, length=length)
+    with precision(kwargs.get('dtype')):
+        vwma = as_pandas(core.vwma(close.values, volume.values, length=length), close)
 
     # Offset
     if offset != 0:
@@ -525,6 +566,7 @@ def vwma(close, volume, length=None, offset=None, **kwargs):
     return vwma
 
 
+@instrumented
 def wma(close, length=None, asc=None, offset=None, **kwargs):
     """Indicator: Weighted Moving Average (WMA)"""
     # Validate Arguments
@@ -532,20 +574,13 @@ def wma(close, length=None, asc=None, offset=None, **kwargs):
     length = int(length) if length and length > 0 else 10
     min_periods = int(kwargs['min_periods']) if 'min_periods' in kwargs and kwargs['min_periods'] is not None else length
     asc = asc if asc else True
+    recursive = bool(kwargs['recursive']) if 'recursive' in kwargs and kwargs['recursive'] is not None else True
     offset = get_offset(offset)
 
     # Calculate Result
-    total_weight = 0.5 * length * (length + 1)
-    weights_ = pd.Series(np.arange(1, length + 1))
-    weights = weights_ if asc else weights_[::-1]
-
-    def linear_weights(w):
-        def _compute(x):
-            return (w * x).sum() / total_weight
-        return _compute
-
-    close_ = close.rolling(length, min_periods=length)
-    wma = close_.apply(linear_weights(weights), raw=True)
+    with precision(kwargs.get('dtype')):
+        wma = core.wma(close.values, length=length, asc=asc, recursive=recursive, resum=kwargs.get('resum'))
+    wma = as_pandas(wma, close)
 
     # Offset
     if offset != 0:
@@ -757,6 +792,8 @@ Calculation:
 
     DEMA = 2 * ema1 - ema2
 
+    ema1 and ema2 are computed in a single ema_cascade(close, length, 2) call.
+
 Args:
     close (pd.Series): Series of 'close's
     length (int): It's period.  Default: 10
@@ -823,13 +860,9 @@ Calculation:
     Default Inputs:
         length=10, 
 
-    def weights(w):
-        def _compute(x):
-            return np.dot(w * x)
-        return _compute
-
+    WW = utils.weighted_window
     fibs = utils.fibonacci(length - 1)
-    FWMA = close.rolling(length)_.apply(weights(fibs), raw=True)
+    FWMA = WW(close, fibs)
 
 Args:
     close (pd.Series): Series of 'close's
@@ -912,6 +945,12 @@ Args:
     offset (int): How many periods to offset the result.  Default: 0
 
 Kwargs:
+    freq (str, DateOffset, optional): The bar frequency of the forward
+        looking period, e.g. '1min' or a CustomBusinessDay with holidays.
+        Default: inferred from the last bars, business days for daily bars.
+    calendar (DatetimeIndex, optional): The future bars of a trading
+        calendar.  The forward looking period is the first bars after the
+        last one.  Takes precedence over freq.
     fillna (value, optional): pd.DataFrame.fillna(value)
     fill_method (value, optional): Type of fill method
 
@@ -935,13 +974,9 @@ Calculation:
     Default Inputs:
         length=10, 
 
-    def weights(w):
-        def _compute(x):
-            return np.dot(w * x)
-        return _compute
-
-    triangle = utils.pascals_triangle(length + 1)
-    PWMA = close.rolling(length)_.apply(weights(triangle), raw=True)
+    WW = utils.weighted_window
+    triangle = utils.pascals_triangle(length - 1)
+    PWMA = WW(close, triangle)
 
 Args:
     close (pd.Series): Series of 'close's
@@ -1043,6 +1078,8 @@ Calculation:
     ema6 = EMA(ema5, length)
     T3 = c1 * ema6 + c2 * ema5 + c3 * ema4 + c4 * ema3
 
+    ema1 through ema6 are computed in a single ema_cascade(close, length, 6) call.
+
 Args:
     close (pd.Series): Series of 'close's
     length (int): It's period.  Default: 10
@@ -1077,6 +1114,8 @@ Calculation:
     ema3 = EMA(ema2, length)
     TEMA = 3 * (ema1 - ema2) + ema3
 
+    ema1 through ema3 are computed in a single ema_cascade(close, length, 3) call.
+
 Args:
     close (pd.Series): Series of 'close's
     length (int): It's period.  Default: 10
@@ -1200,15 +1239,16 @@ Calculation:
     Default Inputs:
         length=10, asc=True
     total_weight = 0.5 * length * (length + 1)
-    weights_ = [1, 2, ..., length + 1]  # Ascending
-    weights = weights if asc else weights[::-1]
+    weights_ = [1, 2, ..., length] / total_weight  # Ascending
+    weights = weights_ if asc else weights_[::-1]
 
-    def linear_weights(w):
-        def _compute(x):
-            return (w * x).sum() / total_weight
-        return _compute
+    WMA = SUM(weights * close, length)
 
-    WMA = close.rolling(length)_.apply(linear_weights(weights), raw=True)
+    By default, it is computed in O(n) independent of length from a running
+    sum S and a running weighted sum W:
+        S = S.shift(1) + close - close.shift(length)
+        W = W.shift(1) + length * close - S.shift(1)
+        WMA = W / total_weight
 
 Args:
     close (pd.Series): Series of 'close's
@@ -1217,6 +1257,10 @@ Args:
     offset (int): How many periods to offset the result.  Default: 0
 
 Kwargs:
+    recursive (bool, optional): If False, uses utils.weighted_window instead of
+        the O(n) recursion.  Default: True
+    resum (int, optional): How often the running sums are resummed.  Values
+        below 4 * length are raised to 4 * length.  Default: max(4096, 4 * length)
     fillna (value, optional): pd.DataFrame.fillna(value)
     fill_method (value, optional): Type of fill method
 
@@ -0,0 +1,202 @@
+# -*- coding: utf-8 -*-
+"""Parallel Feature Generation
+
+Computes features for many independent symbols on a process pool.
+
+>>> universe = {'SPY': spy_df, 'QQQ': qqq_df, ...} # or a (symbol, date) panel
+>>> features = ta.parallel.strategy(universe, ['rsi', 'macd', {'kind': 'atr', 'length': 20}])
+>>> features = ta.parallel.strategy(universe, my_features, processes=8) # my_features(df) -> DataFrame
+
+The numeric input columns of all the symbols are copied once into a shared
+memory block, one contiguous row range per symbol.  Workers compute whole
+chunks of symbols from views of that block and write their results straight
+into a second shared block, so no DataFrame is pickled in either direction.
+The parent copies the results out once.  Symbols are independent, so the
+throughput grows with the number of processes until memory bandwidth runs
+out.
+
+Workers see each symbol with its dates when the index is a DatetimeIndex
+(shared as int64 as well), otherwise with a RangeIndex.  The results are put
+back on the original index.
+"""
+import numpy as np
+import pandas as pd
+
+from multiprocessing import get_context
+from os import cpu_count
+
+from ._extension import _PanelLayout
+
+try:
+    from multiprocessing.shared_memory import SharedMemory
+except ImportError: # Python < 3.8
+    _SHARED_MEMORY_ = False
+else:
+    _SHARED_MEMORY_ = True
+
+
+
+def _features(df:pd.DataFrame, ta, kwargs:dict):
+    """The features of one symbol: df.ta.strategy(ta) or ta(df), without the
+    input columns."""
+    columns = list(df.columns)
+    if callable(ta):
+        result = ta(df, **kwargs)
+    else:
+        result = df.ta.strategy(ta, append=False, **kwargs)
+    if isinstance(result, pd.Series):
+        result = result.to_frame()
+    return result.drop(columns=[x for x in columns if x in result.columns])
+
+
+def _attach(name:str, shape:tuple, dtype=np.float64):
+    shm = SharedMemory(name=name)
+    return shm, np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+
+
+def _release(shm):
+    try:
+        shm.close()
+    except BufferError: # A view is still referenced, the mapping goes with the process
+        pass
+
+
+def _restore_dtypes(frame:pd.DataFrame, dtypes:pd.Series):
+    """Casts integer and boolean features back from the float64 block."""
+    for column, dtype in dtypes.items():
+        if dtype.kind in 'biu' and not frame[column].isna().any():
+            frame[column] = frame[column].astype(dtype)
+    return frame
+
+
+def _worker(task:tuple):
+    """Computes the features of a chunk of symbols from and into shared memory."""
+    inputs, input_columns, outputs, output_columns, dates, tz, ranges, ta, kwargs = task
+    input_shm, input_block = _attach(*inputs)
+    output_shm, output_block = _attach(*outputs)
+    dates_shm, dates_block = _attach(*dates, dtype=np.int64) if dates else (None, None)
+    try:
+        for start, stop in ranges:
+            index = _dates(dates_block[start:stop], tz) if dates else None
+            df = pd.DataFrame(input_block[start:stop], index=index, columns=input_columns, copy=False)
+            result = _features(df, ta, kwargs).reindex(columns=output_columns)
+            output_block[start:stop] = result.to_numpy(dtype=np.float64)
+            del df, index, result
+    finally:
+        del input_block, output_block, dates_block
+        for shm in [input_shm, output_shm, dates_shm]:
+            if shm is not None: _release(shm)
+
+
+def _dates(values:np.ndarray, tz):
+    """DatetimeIndex from int64 nanoseconds, UTC ones if there is a tz."""
+    dates = pd.DatetimeIndex(values.astype('datetime64[ns]'))
+    return dates.tz_localize('UTC').tz_convert(tz) if tz else dates
+
+
+def strategy(universe, ta=None, processes:int = None, chunksize:int = None, **kwargs):
+    """Parallel Strategy
+
+    Args:
+        universe (dict, pd.DataFrame): The symbols.  Either a dict of
+            DataFrames by symbol, with the same numeric columns, or a long
+            format DataFrame with a (symbol, date) MultiIndex.
+        ta (list, callable): Indicator specs as in df.ta.strategy(), or a
+            picklable function that takes a symbol's DataFrame and returns
+            a DataFrame of features.  Its input columns are dropped.
+        processes (int): Default: os.cpu_count().  Number of worker
+            processes.  With 1, everything runs in this process.
+        chunksize (int): Default: about 4 chunks per process.  Number of
+            symbols per task.
+        kwargs: Passed to df.ta.strategy() or to the function.
+
+    Returns:
+        The features in the shape of the universe: a dict of DataFrames by
+        symbol or a DataFrame on the panel's index.
+    """
+    if not _SHARED_MEMORY_:
+        raise ImportError("[X] ta.parallel needs multiprocessing.shared_memory (Python 3.8+)")
+    processes = int(processes) if processes and processes > 0 else cpu_count() or 1
+
+    # Lay the symbols out as contiguous row ranges of one block
+    if isinstance(universe, pd.DataFrame):
+        layout = _PanelLayout(universe.index)
+        columns = list(universe.select_dtypes('number').columns)
+        values = universe[columns].to_numpy(dtype=np.float64)
+        symbols, counts = list(layout.symbols), layout.counts
+        first = values[layout.rows(0)]
+        indexes = [universe.index.get_level_values(-1)]
+    else:
+        layout = None
+        symbols = list(universe.keys())
+        columns = list(universe[symbols[0]].select_dtypes('number').columns)
+        counts = np.array([len(universe[x]) for x in symbols], dtype=np.intp)
+        first = universe[symbols[0]][columns].to_numpy(dtype=np.float64)
+        indexes = [universe[x].index for x in symbols]
+
+    stops = np.cumsum(counts)
+    starts = stops - counts
+    rows = int(stops[-1])
+
+    # Dates as int64 nanoseconds, in the order of 'indexes'
+    dated = all(isinstance(x, pd.DatetimeIndex) for x in indexes)
+    tz = indexes[0].tz if dated else None
+    if dated:
+        dates = np.concatenate([x.values.astype('datetime64[ns]').view(np.int64) for x in indexes])
+        dates = dates[layout.order] if layout else dates
+
+    # The first symbol is computed here to learn the feature columns
+    index = _dates(dates[:counts[0]], tz) if dated else None
+    probe = _features(pd.DataFrame(first, index=index, columns=columns), ta, kwargs)
+    output_columns, dtypes = list(probe.columns), probe.dtypes
+
+    input_shm = SharedMemory(create=True, size=max(rows * len(columns), 1) * 8)
+    output_shm = SharedMemory(create=True, size=max(rows * len(output_columns), 1) * 8)
+    dates_shm = SharedMemory(create=True, size=max(rows, 1) * 8) if dated else None
+    try:
+        input_block = np.ndarray((rows, len(columns)), dtype=np.float64, buffer=input_shm.buf)
+        output_block = np.ndarray((rows, len(output_columns)), dtype=np.float64, buffer=output_shm.buf)
+        if layout:
+            input_block[:] = values[layout.order]
+        else:
+            for symbol, start, stop in zip(symbols, starts, stops):
+                input_block[start:stop] = universe[symbol][columns].to_numpy(dtype=np.float64)
+        if dated:
+            np.ndarray((rows,), dtype=np.int64, buffer=dates_shm.buf)[:] = dates
+
+        chunksize = int(chunksize) if chunksize and chunksize > 0 else max(1, -(-len(symbols) // (4 * processes)))
+        ranges = list(zip(starts.tolist(), stops.tolist()))
+        tasks = [(
+            (input_shm.name, input_block.shape), columns,
+            (output_shm.name, output_block.shape), output_columns,
+            (dates_shm.name, (rows,)) if dated else None, tz,
+            ranges[i:i + chunksize], ta, kwargs
+        ) for i in range(0, len(ranges), chunksize)]
+
+        if processes > 1 and len(tasks) > 1:
+            with get_context().Pool(processes) as pool:
+                pool.map(_worker, tasks)
+        else:
+            for task in tasks:
+                _worker(task)
+
+        # Gather: one copy out of shared memory
+        if layout:
+            inverse = np.empty_like(layout.order)
+            inverse[layout.order] = np.arange(rows)
+            result = pd.DataFrame(output_block[inverse], index=universe.index, columns=output_columns)
+            result = _restore_dtypes(result, dtypes)
+        else:
+            values = output_block.copy()
+            result = {}
+            for symbol, start, stop in zip(symbols, starts, stops):
+                frame = pd.DataFrame(values[start:stop], index=universe[symbol].index, columns=output_columns, copy=False)
+                result[symbol] = _restore_dtypes(frame, dtypes)
+        del input_block, output_block
+    finally:
+        for shm in [input_shm, output_shm, dates_shm]:
+            if shm is None: continue
+            _release(shm)
+            shm.unlink()
+
+    return result
@@ -2,9 +2,12 @@
 import numpy as np
 import pandas as pd
 
-from .utils import get_offset, verify_series
+from . import core
+from .instrumentation import instrumented
+from .utils import as_pandas, get_offset, precision, verify_series
 
 
+@instrumented
 def log_return(close, length=None, cumulative=False, offset=None, **kwargs):
     """Indicator: Log Return"""
     # Validate Arguments
@@ -13,10 +16,9 @@ def log_return(close, length=None, cumulative=False, offset=None, **kwargs):
     offset = get_offset(offset)
 
     # Calculate Result
-    log_return = np.log(close).diff(periods=length)
-
-    if cumulative:
-        log_return = log_return.cumsum()
+    with precision(kwargs.get('dtype')):
+        log_return = core.log_return(close.values, length=length, cumulative=cumulative)
+    log_return = as_pandas(log_return, close)
 
     # Offset
     if offset != 0:
@@ -29,6 +31,7 @@ def log_return(close, length=None, cumulative=False, offset=None, **kwargs):
     return log_return
 
 
+@instrumented
 def percent_return(close, length=None, cumulative=False, offset=None, **kwargs):
     """Indicator: Percent Return"""
     # Validate Arguments
@@ -37,10 +40,9 @@ def percent_return(close, length=None, cumulative=False, offset=None, **kwargs):
     offset = get_offset(offset)
 
     # Calculate Result
-    pct_return = close.pct_change(length)
-
-    if cumulative:
-        pct_return = pct_return.cumsum()
+    with precision(kwargs.get('dtype')):
+        pct_return = core.percent_return(close.values, length=length, cumulative=cumulative)
+    pct_return = as_pandas(pct_return, close)
 
     # Offset
     if offset != 0:
@@ -2,11 +2,13 @@
 import numpy as np
 import pandas as pd
 
-from .overlap import ema, sma, vwma
-from .utils import get_offset, verify_series
+from . import core
+from .instrumentation import instrumented
+from .utils import as_pandas, get_offset, precision, verify_series
 
 
 
+@instrumented
 def kurtosis(close, length=None, offset=None, **kwargs):
     """Indicator: Kurtosis"""
     # Validate Arguments
@@ -16,7 +18,9 @@ def kurtosis(close, length=None, offset=None, **kwargs):
     offset = get_offset(offset)
 
     # Calculate Result
-    kurtosis = close.rolling(length, min_periods=min_periods).kurt()
+    with precision(kwargs.get('dtype')):
+        kurtosis = core.kurtosis(close.values, length=length, min_periods=min_periods)
+    kurtosis = as_pandas(kurtosis, close)
 
     # Offset
     if offset != 0:
@@ -29,6 +33,7 @@ def kurtosis(close, length=None, offset=None, **kwargs):
     return kurtosis
 
 
+@instrumented
 def mad(close, length=None, offset=None, **kwargs):
     """Indicator: Mean Absolute Deviation"""
     # Validate Arguments
@@ -38,11 +43,8 @@ def mad(close, length=None, offset=None, **kwargs):
     offset = get_offset(offset)
 
     # Calculate Result
-    def mad(series):
-        """Mean Absolute Deviation"""
-        return np.fabs(series - series.mean()).mean()
-
-    mad = close.rolling(length, min_periods=min_periods).apply(mad, raw=True)
+    with precision(kwargs.get('dtype')):
+        mad = as_pandas(core.mad(close.values, length=length, min_periods=min_periods), close)
 
     # Offset
     if offset != 0:
@@ -55,6 +57,27 @@ def mad(close, length=None, offset=None, **kwargs):
     return mad
 
 
+@instrumented
+def rolling_mad(close, length, mean=None, min_periods=None, **kwargs):
+    """Rolling Mean Absolute Deviation kernel
+
+    Computes MEAN(ABS(x - MEAN(x))) of every window without a Python call per
+    window.  The windows are strided views of the data, evaluated in chunks to
+    bound memory.  If the rolling 'mean' of the windows has already been
+    computed, pass it to avoid recomputing it.  Windows with a NaN are NaN.
+    Like the indicators, it takes a 'dtype' kwarg, see ta.set_dtype.
+    """
+    close = verify_series(close)
+    length = int(length)
+    min_periods = int(min_periods) if min_periods is not None else length
+    mean = mean.values if isinstance(mean, pd.Series) else mean
+
+    with precision(kwargs.get('dtype')):
+        mad = core.rolling_mad(close.values, length, mean=mean, min_periods=min_periods)
+    return as_pandas(mad, close)
+
+
+@instrumented
 def median(close, length=None, offset=None, **kwargs):
     """Indicator: Median"""
     # Validate Arguments
@@ -64,7 +87,8 @@ def median(close, length=None, offset=None, **kwargs):
     offset = get_offset(offset)
 
     # Calculate Result
-    median = close.rolling(length, min_periods=min_periods).median()
+    with precision(kwargs.get('dtype')):
+        median = as_pandas(core.median(close.values, length=length, min_periods=min_periods), close)
 
     # Offset
     if offset != 0:
@@ -77,6 +101,7 @@ def median(close, length=None, offset=None, **kwargs):
     return median
 
 
+@instrumented
 def quantile(close, length=None, q=None, offset=None, **kwargs):
     """Indicator: Quantile"""
     # Validate Arguments
@@ -87,7 +112,9 @@ def quantile(close, length=None, q=None, offset=None, **kwargs):
     offset = get_offset(offset)
 
     # Calculate Result
-    quantile = close.rolling(length, min_periods=min_periods).quantile(q)
+    with precision(kwargs.get('dtype')):
+        quantile = core.quantile(close.values, length=length, q=q, min_periods=min_periods)
+    quantile = as_pandas(quantile, close)
 
     # Offset
     if offset != 0:
@@ -100,6 +127,28 @@ def quantile(close, length=None, q=None, offset=None, **kwargs):
     return quantile
 
 
+@instrumented
+def rolling_quantiles(close, length, q=(0.05, 0.25, 0.5, 0.75, 0.95), min_periods=None, **kwargs):
+    """Rolling Quantiles kernel
+
+    Computes several quantiles of every window as one DataFrame, with
+    close.rolling(length).quantile(q) for each q: one O(n log length) pass
+    of Pandas' compiled skiplist per quantile.  NaNs are skipped.  Like the
+    indicators, it takes a 'dtype' kwarg, see ta.set_dtype.
+
+    Returns a DataFrame with a QTL_{length}_{q} column per quantile.
+    """
+    close = verify_series(close)
+    length = int(length)
+    q = [float(x) for x in np.atleast_1d(q)]
+    min_periods = int(min_periods) if min_periods is not None else length
+
+    with precision(kwargs.get('dtype')):
+        quantiles = core.rolling_quantiles(close.values, length, q, min_periods=min_periods)
+    return pd.DataFrame(quantiles, index=close.index, columns=[f"QTL_{length}_{x}" for x in q], copy=False)
+
+
+@instrumented
 def skew(close, length=None, offset=None, **kwargs):
     """Indicator: Skew"""
     # Validate Arguments
@@ -109,7 +158,8 @@ def skew(close, length=None, offset=None, **kwargs):
     offset = get_offset(offset)
 
     # Calculate Result
-    skew = close.rolling(length, min_periods=min_periods).skew()
+    with precision(kwargs.get('dtype')):
+        skew = as_pandas(core.skew(close.values, length=length, min_periods=min_periods), close)
 
     # Offset
     if offset != 0:
@@ -122,6 +172,7 @@ def skew(close, length=None, offset=None, **kwargs):
     return skew
 
 
+@instrumented
 def stdev(close, length=None, offset=None, **kwargs):
     """Indicator: Standard Deviation"""
     # Validate Arguments
@@ -131,7 +182,8 @@ def stdev(close, length=None, offset=None, **kwargs):
     offset = get_offset(offset)
 
     # Calculate Result
-    stdev = variance(close=close, length=length).apply(np.sqrt)
+    with precision(kwargs.get('dtype')):
+        stdev = as_pandas(core.stdev(close.values, length=length), close)
 
     # Offset
     if offset != 0:
@@ -144,6 +196,7 @@ def stdev(close, length=None, offset=None, **kwargs):
     return stdev
 
 
+@instrumented
 def variance(close, length=None, offset=None, **kwargs):
     """Indicator: Variance"""
     # Validate Arguments
@@ -153,7 +206,9 @@ def variance(close, length=None, offset=None, **kwargs):
     offset = get_offset(offset)
 
     # Calculate Result
-    variance = close.rolling(length, min_periods=min_periods).var()
+    with precision(kwargs.get('dtype')):
+        variance = core.variance(close.values, length=length, min_periods=min_periods)
+    variance = as_pandas(variance, close)
 
     # Offset
     if offset != 0:
@@ -166,18 +221,20 @@ def variance(close, length=None, offset=None, **kwargs):
     return variance
 
 
+@instrumented
 def zscore(close, length=None, std=None, offset=None, **kwargs):
     """Indicator: Z Score"""
     # Validate Arguments
     close = verify_series(close)
     length = int(length) if length and length > 1 else 30
     std = float(std) if std and std > 1 else 1
+    min_periods = int(kwargs['min_periods']) if 'min_periods' in kwargs and kwargs['min_periods'] is not None else length
     offset = get_offset(offset)
 
     # Calculate Result
-    std *= stdev(close=close, length=length, **kwargs)
-    mean = sma(close=close, length=length, **kwargs)
-    zscore = (close - mean) / std
+    with precision(kwargs.get('dtype')):
+        zscore = core.zscore(close.values, length=length, std=std, min_periods=min_periods)
+    zscore = as_pandas(zscore, close)
 
     # Offset
     if offset != 0:
@@ -224,7 +281,8 @@ Sources:
 Calculation:
     Default Inputs:
         length=30
-    mad = close.rolling(length).mad()
+    mean = close.rolling(length).mean()
+    mad = MEAN(ABS(close - mean), length)
 
 Args:
     close (pd.Series): Series of 'close's
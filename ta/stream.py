@@ -0,0 +1,314 @@
+# -*- coding: utf-8 -*-
+"""Streaming Indicators
+
+Stateful, online counterparts of the batch indicators for live data.  Each
+object keeps O(1) state (O(length) for windowed averages) and update() takes
+the newest bar and returns the newest value in O(1).  Replaying a history
+bar by bar returns exactly what the batch indicator returns for it.
+
+>>> rsi = ta.stream.RSI(length=14)
+>>> for price in df['close']:
+...     value = rsi.update(price)
+
+Available: SMA, EMA, RMA, RSI, MACD, APO, TrueRange, ATR, OBV, AD and PVT.
+"""
+import math
+
+from collections import deque
+
+nan = float('nan')
+
+
+
+def _divide(a:float, b:float):
+    """a / b with the float semantics of numpy: x / 0 is +-inf, 0 / 0 is NaN."""
+    if b == 0:
+        if a != a or a == 0:
+            return nan
+        return math.copysign(math.inf, a) * math.copysign(1, b)
+    return a / b
+
+
+class _EWM(object):
+    """Exponentially weighted mean, update by update identical to Pandas'
+    Series.ewm(com=com, min_periods=min_periods, adjust=adjust).mean()"""
+    def __init__(self, com:float, min_periods:int = None, adjust:bool = True):
+        alpha = 1.0 / (1.0 + com)
+        self.old_wt_factor = 1.0 - alpha
+        self.new_wt = 1.0 if adjust else alpha
+        self.adjust = adjust
+        self.min_periods = max(int(min_periods), 1) if min_periods is not None else 1
+        self.weighted = nan
+        self.old_wt = 1.0
+        self.nobs = 0
+
+    def update(self, value:float):
+        value = float(value)
+        is_observation = value == value
+        self.nobs += is_observation
+        if self.weighted == self.weighted:
+            self.old_wt *= self.old_wt_factor
+            if is_observation:
+                if self.weighted != value:
+                    weighted = self.old_wt * self.weighted + self.new_wt * value
+                    self.weighted = weighted / (self.old_wt + self.new_wt)
+                if self.adjust:
+                    self.old_wt += self.new_wt
+                else:
+                    self.old_wt = 1.0
+        elif is_observation:
+            self.weighted = value
+
+        return self.weighted if self.nobs >= self.min_periods else nan
+
+
+class _RollingMean(object):
+    """Rolling mean, update by update identical to Pandas'
+    Series.rolling(length, min_periods=min_periods).mean().  Like Pandas, the
+    window sum is updated with Kahan compensated additions and removals."""
+    def __init__(self, length:int, min_periods:int = None):
+        self.window = deque(maxlen=length)
+        self.min_periods = int(min_periods) if min_periods is not None else length
+        self.nobs = 0
+        self.sum = 0.0
+        self.neg_ct = 0
+        self.compensation_add = 0.0
+        self.compensation_remove = 0.0
+        self.consecutive = 0
+        self.prev_value = nan
+
+    def update(self, value:float):
+        value = float(value)
+        if len(self.window) == self.window.maxlen:
+            old = self.window[0]
+            if old == old:
+                self.nobs -= 1
+                y = -old - self.compensation_remove
+                t = self.sum + y
+                self.compensation_remove = t - self.sum - y
+                self.sum = t
+                if old < 0: self.neg_ct -= 1
+        if len(self.window) == 0:
+            self.prev_value = value
+        self.window.append(value)
+
+        if value == value:
+            self.nobs += 1
+            y = value - self.compensation_add
+            t = self.sum + y
+            self.compensation_add = t - self.sum - y
+            self.sum = t
+            if value < 0: self.neg_ct += 1
+            self.consecutive = self.consecutive + 1 if value == self.prev_value else 1
+            self.prev_value = value
+
+        if self.nobs >= self.min_periods and self.nobs > 0:
+            if self.consecutive >= self.nobs:
+                return self.prev_value
+            result = self.sum / self.nobs
+            if self.neg_ct == 0 and result < 0: return 0.0
+            if self.neg_ct == self.nobs and result > 0: return 0.0
+            return result
+        return nan
+
+
+class _Lag(object):
+    """The value 'length' updates ago, NaN until then."""
+    def __init__(self, length:int):
+        self.values = deque([nan] * length, maxlen=length)
+
+    def update(self, value:float):
+        lagged = self.values[0]
+        self.values.append(float(value))
+        return lagged
+
+
+
+class SMA(object):
+    """Streaming Simple Moving Average (SMA), see help(ta.sma)"""
+    def __init__(self, length:int = None, min_periods:int = None):
+        self.length = int(length) if length and length > 0 else 10
+        self._mean = _RollingMean(self.length, min_periods if min_periods is not None else self.length)
+        self.name = f"SMA_{self.length}"
+
+    def update(self, close:float):
+        return self._mean.update(close)
+
+
+class EMA(object):
+    """Streaming Exponential Moving Average (EMA), see help(ta.ema)"""
+    def __init__(self, length:int = None, min_periods:int = None, adjust:bool = None):
+        self.length = int(length) if length and length > 0 else 10
+        min_periods = int(min_periods) if min_periods is not None else self.length
+        adjust = bool(adjust) if adjust is not None else True
+        self._ewm = _EWM((self.length - 1) / 2, min_periods, adjust)
+        self.name = f"EMA_{self.length}"
+
+    def update(self, close:float):
+        return self._ewm.update(close)
+
+
+class RMA(object):
+    """Streaming wildeR's Moving Average (RMA), see help(ta.rma)"""
+    def __init__(self, length:int = None, min_periods:int = None):
+        self.length = int(length) if length and length > 0 else 10
+        min_periods = int(min_periods) if min_periods is not None else self.length
+        alpha = 1.0 / self.length
+        self._ewm = _EWM((1 - alpha) / alpha, min_periods)
+        self.name = f"RMA_{self.length}"
+
+    def update(self, close:float):
+        return self._ewm.update(close)
+
+
+class RSI(object):
+    """Streaming Relative Strength Index (RSI), see help(ta.rsi)"""
+    def __init__(self, length:int = None, drift:int = None):
+        self.length = int(length) if length and length > 0 else 14
+        drift = int(drift) if drift and drift != 0 else 1
+        self._prev = _Lag(drift)
+        self._positive = _EWM(self.length, adjust=False)
+        self._negative = _EWM(self.length, adjust=False)
+        self.name = f"RSI_{self.length}"
+
+    def update(self, close:float):
+        close = float(close)
+        change = close - self._prev.update(close)
+        positive_avg = self._positive.update(change if not change < 0 else 0.0)
+        negative_avg = abs(self._negative.update(change if not change > 0 else 0.0))
+        return _divide(100 * positive_avg, positive_avg + negative_avg)
+
+
+class APO(object):
+    """Streaming Absolute Price Oscillator (APO), see help(ta.apo)"""
+    def __init__(self, fast:int = None, slow:int = None, min_periods:int = None):
+        fast = int(fast) if fast and fast > 0 else 12
+        slow = int(slow) if slow and slow > 0 else 26
+        if slow < fast:
+            fast, slow = slow, fast
+        min_periods = int(min_periods) if min_periods is not None else fast
+        self._fast = _EWM((fast - 1) / 2, min_periods)
+        self._slow = _EWM((slow - 1) / 2, min_periods)
+        self.name = f"APO_{fast}_{slow}"
+
+    def update(self, close:float):
+        return self._fast.update(close) - self._slow.update(close)
+
+
+class MACD(object):
+    """Streaming Moving Average Convergence Divergence (MACD), see help(ta.macd)
+
+    update() returns the tuple (macd, histogram, signal) in the column order
+    of the batch MACD DataFrame.
+    """
+    def __init__(self, fast:int = None, slow:int = None, signal:int = None, min_periods:int = None):
+        fast = int(fast) if fast and fast > 0 else 12
+        slow = int(slow) if slow and slow > 0 else 26
+        signal = int(signal) if signal and signal > 0 else 9
+        if slow < fast:
+            fast, slow = slow, fast
+        min_periods = int(min_periods) if min_periods is not None else fast
+        self._fast = _EWM((fast - 1) / 2, min_periods)
+        self._slow = _EWM((slow - 1) / 2, min_periods)
+        self._signal = _EWM((signal - 1) / 2, min_periods)
+        self.name = f"MACD_{fast}_{slow}_{signal}"
+
+    def update(self, close:float):
+        macd = self._fast.update(close) - self._slow.update(close)
+        signalma = self._signal.update(macd)
+        return macd, macd - signalma, signalma
+
+
+class TrueRange(object):
+    """Streaming True Range, see help(ta.true_range)"""
+    def __init__(self, drift:int = None):
+        self.drift = int(drift) if drift and drift != 0 else 1
+        self._prev_close = _Lag(self.drift)
+        self.name = f"TRUERANGE_{self.drift}"
+
+    def update(self, high:float, low:float, close:float):
+        high, low = float(high), float(low)
+        prev_close = self._prev_close.update(close)
+        ranges = [abs(x) for x in [high - low, high - prev_close, low - prev_close] if x == x]
+        return max(ranges) if len(ranges) else nan
+
+
+class ATR(object):
+    """Streaming Average True Range (ATR), see help(ta.atr)"""
+    def __init__(self, length:int = None, mamode:str = None, drift:int = None, min_periods:int = None):
+        self.length = int(length) if length and length > 0 else 14
+        min_periods = int(min_periods) if min_periods is not None else self.length
+        mamode = mamode.lower() if mamode else 'ema'
+        self._tr = TrueRange(drift)
+        if mamode == 'ema':
+            self._ma = _EWM((self.length - 1) / 2, min_periods)
+        else:
+            self._ma = _RollingMean(self.length, min_periods)
+        self.name = f"ATR_{self.length}"
+
+    def update(self, high:float, low:float, close:float):
+        return self._ma.update(self._tr.update(high, low, close))
+
+
+class OBV(object):
+    """Streaming On Balance Volume (OBV), see help(ta.obv)"""
+    def __init__(self):
+        self._prev_close = None
+        self._total = 0.0
+        self.name = "OBV"
+
+    def update(self, close:float, volume:float):
+        close = float(close)
+        if self._prev_close is None:
+            sign = 1.0
+        else:
+            change = close - self._prev_close
+            sign = 1.0 if change > 0 else -1.0 if change < 0 else change
+        self._prev_close = close
+        signed_volume = sign * float(volume)
+        if signed_volume != signed_volume:
+            return nan
+        self._total += signed_volume
+        return self._total
+
+
+class AD(object):
+    """Streaming Accumulation/Distribution (AD), see help(ta.ad)
+
+    When 'open_' is True, update() expects the bar's open as well, as the
+    batch AD does when passed an open Series.
+    """
+    def __init__(self, open_:bool = False):
+        self.open_ = bool(open_)
+        self._total = 0.0
+        self.name = "AD"
+
+    def update(self, high:float, low:float, close:float, volume:float, open_:float = None):
+        high, low, close = float(high), float(low), float(close)
+        if self.open_:
+            ad = close - float(open_)
+        else:
+            ad = 2 * close - high - low
+        ad *= _divide(float(volume), high - low)
+        if ad != ad:
+            return nan
+        self._total += ad
+        return self._total
+
+
+class PVT(object):
+    """Streaming Price-Volume Trend (PVT), see help(ta.pvt)"""
+    def __init__(self, drift:int = None):
+        drift = int(drift) if drift and drift != 0 else 1
+        self._prev_close = _Lag(drift)
+        self._total = 0.0
+        self.name = "PVT"
+
+    def update(self, close:float, volume:float):
+        close = float(close)
+        prev_close = self._prev_close.update(close)
+        pv = _divide(100 * (close - prev_close), prev_close) * float(volume)
+        if pv != pv:
+            return nan
+        self._total += pv
+        return self._total
@@ -9,13 +9,14 @@
 import numpy as np
 import pandas as pd
 
-from .overlap import ema, midprice, rma
-from .utils import get_drift, get_offset, verify_series, zero
-from .momentum import roc
-from .volatility import atr, true_range
+from . import core
+from .instrumentation import instrumented
+from .overlap import ema
+from .utils import as_pandas, get_drift, get_offset, precision, verify_series
 
 
 
+@instrumented
 def adx(high, low, close, length=None, drift=None, offset=None, **kwargs):
     """Indicator: ADX"""
     # Validate Arguments
@@ -27,22 +28,9 @@ def adx(high, low, close, length=None, drift=None, offset=None, **kwargs):
     offset = get_offset(offset)
 
     # Calculate Result
-    _atr = atr(high=high, low=low, close=close, length=length)
-
-    up = high - high.shift(drift)
-    dn = low.shift(drift) - low
-
-    pos = ((up > dn) & (up > 0)) * up
-    neg = ((dn > up) & (dn > 0)) * dn
-
-    pos = pos.apply(zero)
-    neg = neg.apply(zero)
-
-    dmp = (100 / _atr) * rma(close=pos, length=length)
-    dmn = (100 / _atr) * rma(close=neg, length=length)
-
-    dx = 100 * (dmp - dmn).abs() / (dmp + dmn)
-    adx = rma(close=dx, length=length)
+    with precision(kwargs.get('dtype')):
+        adx, dmp, dmn = core.adx(high.values, low.values, close.values, length=length, drift=drift)
+    adx, dmp, dmn = [as_pandas(x, close) for x in (adx, dmp, dmn)]
 
     # Offset
     if offset != 0:
@@ -69,13 +57,14 @@ def adx(high, low, close, length=None, drift=None, offset=None, **kwargs):
 
     # Prepare DataFrame to return
     data = {adx.name: adx, dmp.name: dmp, dmn.name: dmn}
-    adxdf = pd.DataFrame(data)
+    adxdf = pd.concat(data, axis=1)
     adxdf.name = f"ADX_{length}"
     adxdf.category = 'trend'
 
     return adxdf
 
 
+@instrumented
 def aroon(close, length=None, offset=None, **kwargs):
     """Indicator: Aroon Oscillator"""
     # Validate Arguments
@@ -85,15 +74,9 @@ def aroon(close, length=None, offset=None, **kwargs):
     offset = get_offset(offset)
 
     # Calculate Result
-    def maxidx(x):
-        return 100 * (int(np.argmax(x)) + 1) / length
-
-    def minidx(x):
-        return 100 * (int(np.argmin(x)) + 1) / length
-
-    _close = close.rolling(length, min_periods=min_periods)
-    aroon_up = _close.apply(maxidx, raw=True)
-    aroon_down = _close.apply(minidx, raw=True)
+    with precision(kwargs.get('dtype')):
+        aroon_up, aroon_down = core.aroon(close.values, length=length, min_periods=min_periods)
+    aroon_up, aroon_down = as_pandas(aroon_up, close), as_pandas(aroon_down, close)
 
     # Handle fills
     if 'fillna' in kwargs:
@@ -116,13 +99,14 @@ def aroon(close, length=None, offset=None, **kwargs):
 
     # Prepare DataFrame to return
     data = {aroon_up.name: aroon_up, aroon_down.name: aroon_down}
-    aroondf = pd.DataFrame(data)
+    aroondf = pd.concat(data, axis=1)
     aroondf.name = f"AROON_{length}"
     aroondf.category = 'trend'
 
     return aroondf
 
 
+@instrumented
 def decreasing(close, length=None, asint=True, offset=None, **kwargs):
     """Indicator: Decreasing"""
     # Validate Arguments
@@ -131,9 +115,8 @@ def decreasing(close, length=None, asint=True, offset=None, **kwargs):
     offset = get_offset(offset)
 
     # Calculate Result
-    decreasing = close.diff(length) < 0
-    if asint:
-        decreasing = decreasing.astype(int)
+    with precision(kwargs.get('dtype')):
+        decreasing = as_pandas(core.decreasing(close.values, length=length, asint=asint), close)
 
     # Offset
     if offset != 0:
@@ -152,6 +135,7 @@ def decreasing(close, length=None, asint=True, offset=None, **kwargs):
     return decreasing
 
 
+@instrumented
 def dpo(close, length=None, centered=True, offset=None, **kwargs):
     """Indicator: Detrend Price Oscillator (DPO)"""
     # Validate Arguments
@@ -161,11 +145,9 @@ def dpo(close, length=None, centered=True, offset=None, **kwargs):
     offset = get_offset(offset)
 
     # Calculate Result
-    drift = int(0.5 * length) + 1  # int((0.5 * length) + 1)
-    dpo = close.shift(drift) - close.rolling(length, min_periods=min_periods).mean()
-    # dpo = close.shift(drift) - close.rolling(length).mean()
-    if centered:
-        dpo = dpo.shift(-drift)
+    with precision(kwargs.get('dtype')):
+        dpo = core.dpo(close.values, length=length, centered=centered, min_periods=min_periods)
+    dpo = as_pandas(dpo, close)
 
     # Offset
     if offset != 0:
@@ -184,6 +166,7 @@ def dpo(close, length=None, centered=True, offset=None, **kwargs):
     return dpo
 
 
+@instrumented
 def increasing(close, length=None, asint=True, offset=None, **kwargs):
     """Indicator: Increasing"""
     # Validate Arguments
@@ -192,9 +175,8 @@ def increasing(close, length=None, asint=True, offset=None, **kwargs):
     offset = get_offset(offset)
 
     # Calculate Result
-    increasing = close.diff(length) > 0
-    if asint:
-        increasing = increasing.astype(int)
+    with precision(kwargs.get('dtype')):
+        increasing = as_pandas(core.increasing(close.values, length=length, asint=asint), close)
 
     # Offset
     if offset != 0:
@@ -213,6 +195,7 @@ def increasing(close, length=None, asint=True, offset=None, **kwargs):
     return increasing
 
 
+@instrumented
 def vortex(high, low, close, length=None, drift=None, offset=None, **kwargs):
     """Indicator: Vortex"""
     # Validate arguments
@@ -225,14 +208,9 @@ def vortex(high, low, close, length=None, drift=None, offset=None, **kwargs):
     offset = get_offset(offset)
 
     # Calculate Result
-    tr = true_range(high=high, low=low, close=close)
-    tr_sum = tr.rolling(length, min_periods=min_periods).sum()
-
-    vmp = (high - low.shift(drift)).abs()
-    vmm = (low - high.shift(drift)).abs()
-
-    vip = vmp.rolling(length, min_periods=min_periods).sum() / tr_sum
-    vim = vmm.rolling(length, min_periods=min_periods).sum() / tr_sum
+    with precision(kwargs.get('dtype')):
+        vip, vim = core.vortex(high.values, low.values, close.values, length=length, drift=drift, min_periods=min_periods)
+    vip, vim = as_pandas(vip, close), as_pandas(vim, close)
 
     # Offset
     if offset != 0:
@@ -254,7 +232,7 @@ def vortex(high, low, close, length=None, drift=None, offset=None, **kwargs):
 
     # Prepare DataFrame to return
     data = {vip.name: vip, vim.name: vim}
-    vtxdf = pd.DataFrame(data)
+    vtxdf = pd.concat(data, axis=1)
     vtxdf.name = f"VTX_{length}"
     vtxdf.category = 'trend'
 
@@ -351,15 +329,10 @@ Sources:
 Calculation:
     Default Inputs:
         length=1
-    def maxidx(x):
-        return 100 * (int(np.argmax(x)) + 1) / length
-
-    def minidx(x):
-        return 100 * (int(np.argmin(x)) + 1) / length
+    since_high, since_low = utils.rolling_argextrema(close, length)
 
-    _close = close.rolling(length, min_periods=min_periods)
-    aroon_up = _close.apply(maxidx, raw=True)
-    aroon_down = _close.apply(minidx, raw=True)
+    aroon_up = 100 * (length - since_high) / length
+    aroon_down = 100 * (length - since_low) / length
 
 Args:
     close (pd.Series): Series of 'close's
@@ -632,9 +605,7 @@ def adx_depreciated(high, low, close, n=14, fillna=False):
     Returns:
         pandas.Series: New feature generated.
     """
-    cs = close.shift(1)
-
-    tr = high.combine(cs, max) - low.combine(cs, min)
+    tr = as_pandas(core.true_range(high.values, low.values, close.values), close)
     trs = tr.rolling(n).sum()
 
     up = high - high.shift(1)
@@ -681,9 +652,7 @@ def adx_pos_depreciated(high, low, close, n=14, fillna=False):
     Returns:
         pandas.Series: New feature generated.
     """
-    cs = close.shift(1)
-
-    tr = high.combine(cs, max) - low.combine(cs, min)
+    tr = as_pandas(core.true_range(high.values, low.values, close.values), close)
     trs = tr.rolling(n).sum()
 
     up = high - high.shift(1)
@@ -726,9 +695,7 @@ def adx_neg_depreciated(high, low, close, n=14, fillna=False):
     Returns:
         pandas.Series: New feature generated.
     """
-    cs = close.shift(1)
-
-    tr = high.combine(cs, max) - low.combine(cs, min)
+    tr = as_pandas(core.true_range(high.values, low.values, close.values), close)
     trs = tr.rolling(n).sum()
 
     up = high - high.shift(1)
@@ -762,9 +729,7 @@ def adx_indicator_depreciated(high, low, close, n=14, fillna=False):
     Returns:
         pandas.Series: New feature generated.
     """
-    cs = close.shift(1)
-
-    tr = high.combine(cs, max) - low.combine(cs, min)
+    tr = as_pandas(core.true_range(high.values, low.values, close.values), close)
     trs = tr.rolling(n).sum()
 
     up = high - high.shift(1)
@@ -809,7 +774,7 @@ def vortex_indicator_pos_depreciated(high, low, close, n=14, fillna=False):
     Returns:
         pandas.Series: New feature generated.
     """
-    tr = high.combine(close.shift(1), max) - low.combine(close.shift(1), min)
+    tr = as_pandas(core.true_range(high.values, low.values, close.values), close)
     trn = tr.rolling(n).sum()
 
     vmp = np.abs(high - low.shift(1))
@@ -840,7 +805,7 @@ def vortex_indicator_neg_depreciated(high, low, close, n=14, fillna=False):
     Returns:
         pandas.Series: New feature generated.
     """
-    tr = high.combine(close.shift(1), max) - low.combine(close.shift(1), min)
+    tr = as_pandas(core.true_range(high.values, low.values, close.values), close)
     trn = tr.rolling(n).sum()
 
     vmp = np.abs(high - low.shift(1))
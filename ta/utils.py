@@ -3,10 +3,126 @@ import math
 import numpy as np
 import pandas as pd
 
-from functools import reduce
+from contextlib import contextmanager
+from functools import reduce, wraps
+from inspect import Parameter, signature
 from operator import mul
 from sys import float_info as sflt
 
+_DTYPES = [np.dtype(np.float64)] # Global dtype, then the active precision stack
+_INTERMEDIATE_CACHES = [] # Active IntermediateCache stack
+
+
+class IntermediateCache(object):
+    """Intermediate Cache
+
+    While active, kernels decorated with @intermediate (hl2, hlc3, ema, sma,
+    rma, true_range, atr, ...) return the result they computed earlier for the
+    same input data and parameters instead of computing it again.  Each cached
+    result is a node of the batch's dependency graph, keyed on the memory of
+    its input arrays and its bound parameters, so every distinct intermediate
+    is computed once no matter how many indicators depend on it.
+
+    >>> with IntermediateCache() as cache:
+    ...     cci_ = cci(high, low, close)
+    ...     mfi_ = mfi(high, low, close, volume) # Reuses cci's hlc3
+    >>> cache.hits, cache.misses
+
+    Cached results are shared by reference, cached ndarrays are made read only.
+    The cache is emptied when the context exits.
+    """
+    def __init__(self):
+        self.results = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __enter__(self):
+        _INTERMEDIATE_CACHES.append(self)
+        return self
+
+    def __exit__(self, *exc):
+        _INTERMEDIATE_CACHES.remove(self)
+        self.results.clear()
+
+
+def _intermediate_key(value):
+    """Hashable stand in for an argument of an @intermediate function.  Series
+    are identified by the buffers of their data and index, so repeated
+    df['close'] lookups share a key.  Returns None if the value can not be
+    keyed."""
+    if isinstance(value, pd.RangeIndex):
+        return ('range', value.start, value.stop, value.step)
+    if isinstance(value, (pd.Series, pd.Index, np.ndarray)):
+        values = value if isinstance(value, np.ndarray) else value.values
+        if not isinstance(values, np.ndarray): return None
+        data = values.__array_interface__['data'][0]
+        index = _intermediate_key(value.index) if isinstance(value, pd.Series) else None
+        if isinstance(value, pd.Series) and index is None: return None
+        return ('array', data, values.shape, values.strides, values.dtype.str, index)
+    try:
+        hash(value)
+    except TypeError:
+        return None
+    return value
+
+
+def intermediate(fn):
+    """Decorator for building blocks that indicators share, e.g. hlc3 or
+    true_range.  Calls are memoized while an IntermediateCache is active and
+    pass straight through otherwise."""
+    fn_signature = signature(fn)
+
+    @wraps(fn)
+    def _intermediate(*args, **kwargs):
+        if not _INTERMEDIATE_CACHES:
+            return fn(*args, **kwargs)
+
+        cache = _INTERMEDIATE_CACHES[-1]
+        bound = fn_signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        params = []
+        for name, value in bound.arguments.items():
+            if fn_signature.parameters[name].kind == Parameter.VAR_KEYWORD:
+                params.extend(sorted(value.items()))
+            else:
+                params.append((name, value))
+
+        key = [fn.__module__, fn.__name__, get_dtype().str]
+        for name, value in params:
+            value_key = _intermediate_key(value)
+            if value_key is None and value is not None:
+                return fn(*args, **kwargs)
+            key.append((name, value_key))
+        key = tuple(key)
+
+        if key in cache.results:
+            cache.hits += 1
+            return cache.results[key][0]
+
+        cache.misses += 1
+        result = fn(*args, **kwargs)
+        for array in (result if isinstance(result, tuple) else (result,)):
+            if isinstance(array, np.ndarray):
+                array.flags.writeable = False
+        # Keep the inputs alive so their buffers are not reused by other data
+        cache.results[key] = (result, args, kwargs)
+        return result
+
+    return _intermediate
+
+
+def as_pandas(values:np.ndarray, like):
+    """Returns the ndarray 'values' as a Series on the index of 'like', or as
+    a DataFrame on its index and columns when 'like' is one.  If 'like' is
+    not a Pandas object, 'values' is returned as is.  Read only arrays, like
+    shared intermediates, are copied."""
+    if not isinstance(like, (pd.Series, pd.DataFrame)):
+        return values
+    if not values.flags.writeable:
+        values = values.copy()
+    if isinstance(like, pd.DataFrame):
+        return pd.DataFrame(values, index=like.index, columns=like.columns, copy=False)
+    return pd.Series(values, index=like.index, copy=False)
 
 
 def combination(n:int, r:int):
@@ -66,11 +182,96 @@ def get_drift(x:int):
     return int(x) if x and x != 0 else 1
 
 
+def get_dtype():
+    """Returns the float dtype indicators are computed and returned in, see
+    set_dtype and precision."""
+    return _DTYPES[-1]
+
+
 def get_offset(x:int):
     """Returns an int, otherwise defaults to zero."""
     return int(x) if x else 0
 
 
+def linear_weighted_window(series:pd.Series, length:int, asc=True, resum:int = None):
+    """Linear Weighted Window
+
+    Returns the linearly weighted average of every rolling window of the Series
+    (or ndarray, 2D for a panel), the weights being
+    [1, 2, ..., length] / (0.5 * length * (length + 1)).  The cost is O(n)
+    regardless of length since the weighted sum W and plain sum S of a window
+    are updated from the previous window in O(1):
+        S[t] = S[t - 1] + x[t] - x[t - length]
+        W[t] = W[t - 1] + length * x[t] - S[t - 1]
+
+    The recursion is evaluated vectorized, block by block.  To keep rounding
+    errors from accumulating over very long Series, each block is resummed
+    from scratch every 'resum' bars, default: 4096.  'resum' is raised to
+    4 * length if smaller.  Windows that are not full or that contain a NaN
+    are NaN.  Windows with an infinite value are summed directly, they are
+    +/-inf (NaN with both signs) and leave the other windows untouched.
+    """
+    length = int(length)
+    resum = max(int(resum) if resum and resum > 0 else 4096, 4 * length)
+
+    values = np.asarray(series, dtype=float)
+    n = values.shape[0]
+    result = np.full(values.shape, np.nan)
+    if length < 1 or n < length:
+        return as_pandas(result, series)
+    # A 2D array is a panel with one column per symbol, see panel
+    columns = values.reshape(n, -1)
+
+    # Windows with a NaN or an inf are flagged with an exact integer prefix
+    # count.  Both are zeroed in the recursion.
+    nonfinite = ~np.isfinite(columns)
+    nonfinite_count = np.zeros((n + 1, columns.shape[1]), dtype=np.intp)
+    np.cumsum(nonfinite, axis=0, out=nonfinite_count[1:])
+    nonfinite_count = nonfinite_count[length:] - nonfinite_count[:-length]
+
+    # Overlapping blocks: each holds 'resum' windows plus the 'length - 1' bars
+    # of history its first window needs.  Blocks are centered on their mean.
+    windows = n - length + 1
+    blocks = -(-windows // resum)
+    width = resum + length - 1
+    padded = np.zeros((blocks * resum + length - 1, columns.shape[1]))
+    padded[:n] = np.where(nonfinite, 0.0, columns)
+    strides = (resum * padded.strides[0],) + padded.strides
+    block = np.lib.stride_tricks.as_strided(padded, shape=(blocks, width, columns.shape[1]), strides=strides)
+    base = block.mean(axis=1, keepdims=True)
+    block = block - base
+
+    # Plain sums of every window in a block
+    csum = np.zeros((blocks, width + 1, columns.shape[1]))
+    np.cumsum(block, axis=1, out=csum[:, 1:])
+    window_sum = csum[:, length:] - csum[:, :-length]
+
+    # Weighted sums: the first window of a block is summed directly, the rest
+    # follow from the recursion as a cumulative sum of its increments.
+    weighted_sum = length * block[:, length - 1:]
+    weighted_sum[:, 1:] -= window_sum[:, :-1]
+    weighted_sum[:, 0] = np.einsum('bwc,w->bc', block[:, :length], np.arange(1, length + 1))
+    np.cumsum(weighted_sum, axis=1, out=weighted_sum)
+
+    if not asc:
+        weighted_sum = (length + 1) * window_sum - weighted_sum
+
+    total_weight = 0.5 * length * (length + 1)
+    wma = (weighted_sum / total_weight + base).reshape(-1, columns.shape[1])[:windows]
+    flagged = nonfinite_count > 0
+    wma[flagged] = np.nan
+
+    # With an inf, the flagged windows are summed directly
+    if np.isinf(columns[nonfinite]).any():
+        window, column = np.nonzero(flagged)
+        weights = np.arange(1, length + 1) if asc else np.arange(length, 0, -1)
+        with np.errstate(invalid='ignore'):
+            wma[window, column] = columns[window[:, None] + np.arange(length), column[:, None]] @ weights / total_weight
+    result[length - 1:] = wma.reshape((windows,) + values.shape[1:])
+
+    return as_pandas(result, series)
+
+
 def multichoose(n:int, r:int):
     """https://en.wikipedia.org/wiki/Binomial_coefficient"""
     return combination(n + r - 1, r)
@@ -104,22 +305,161 @@ def pascals_triangle(n:int, weighted=True, **kwargs):
         return triangle
 
 
+def _float_dtype(dtype):
+    """dtype as a NumPy float32 or float64 dtype."""
+    dtype = np.dtype(dtype)
+    if dtype not in (np.float32, np.float64):
+        raise ValueError(f"[X] dtype must be float32 or float64, not {dtype}")
+    return dtype
+
+
+@contextmanager
+def precision(dtype=None):
+    """Computes the indicators called inside the context in 'dtype', float32
+    or float64, instead of the global dtype.  None keeps the current one.
+    Indicators also accept it per call as the 'dtype' keyword argument.
+
+    >>> with precision('float32'):
+    ...     rsi_ = rsi(close) # float32
+    """
+    _DTYPES.append(_float_dtype(dtype) if dtype is not None else get_dtype())
+    try:
+        yield _DTYPES[-1]
+    finally:
+        _DTYPES.pop()
+
+
+def _block_argmax(values:np.ndarray, length:int):
+    """Van Herk/Gil-Werman rolling argmax in O(n) along axis 0.
+
+    Returns the index of the maximum of every window values[t - length + 1:t + 1]
+    (values[:t + 1] for the first length - 1).  On ties, the oldest index wins
+    like np.argmax.  values must not contain NaN.
+    """
+    n, rest = values.shape[0], values.shape[1:]
+    blocks = -(-n // length)
+    padded = np.full((blocks * length,) + rest, -np.inf)
+    padded[:n] = values
+    block = padded.reshape((blocks, length) + rest)
+    trailing = (1,) * len(rest)
+    col = np.arange(length).reshape((1, length) + trailing)
+    start = (np.arange(blocks) * length).reshape((blocks, 1) + trailing)
+
+    # Prefix maxima: running max from each block's start, first occurrence
+    prefix = np.maximum.accumulate(block, axis=1)
+    new_max = np.ones_like(block, dtype=bool)
+    new_max[:, 1:] = block[:, 1:] > prefix[:, :-1]
+    prefix_idx = start + np.maximum.accumulate(np.where(new_max, col, 0), axis=1)
+
+    # Suffix maxima: running max to each block's end, oldest occurrence
+    reverse = block[:, ::-1]
+    suffix = np.maximum.accumulate(reverse, axis=1)
+    new_max[:, 1:] = reverse[:, 1:] >= suffix[:, :-1]
+    suffix_idx = np.maximum.accumulate(np.where(new_max, col, 0), axis=1)
+    suffix, suffix_idx = suffix[:, ::-1], start + (length - 1 - suffix_idx[:, ::-1])
+
+    shape = (blocks * length,) + rest
+    prefix, prefix_idx = prefix.reshape(shape)[:n], prefix_idx.reshape(shape)[:n]
+    suffix, suffix_idx = suffix.reshape(shape)[:n], suffix_idx.reshape(shape)[:n]
+
+    # A full window is the suffix of the block it starts in joined with the
+    # prefix of the block it ends in.
+    argmax = prefix_idx.copy()
+    if n >= length:
+        left, right = slice(0, n - length + 1), slice(length - 1, n)
+        older = suffix[left] >= prefix[right]
+        argmax[right] = np.where(older, suffix_idx[left], prefix_idx[right])
+
+    return argmax
+
+
+def rolling_argextrema(series:pd.Series, length:int, min_periods:int = None):
+    """Rolling Arg Extrema
+
+    Returns two Series (or DataFrames for a panel DataFrame, ndarrays for an
+    ndarray, 2D along axis 0): the number of bars since the highest and since
+    the lowest value of every rolling window, 0 being the current bar.  Ties
+    are resolved to the oldest bar as np.argmax and np.argmin do.
+
+    Both are computed together in O(n) independent of length, with a block
+    (van Herk/Gil-Werman) decomposition instead of a per window argmax.  NaNs
+    are skipped and windows with fewer than min_periods values, default:
+    length, are NaN.
+    """
+    length = int(length)
+    min_periods = int(min_periods) if min_periods is not None else length
+
+    values = np.asarray(series, dtype=float)
+    n = values.shape[0]
+    nans = np.isnan(values)
+
+    valid = np.cumsum(~nans, axis=0)
+    if n > length:
+        valid[length:] -= valid[:-length]
+
+    bar = np.arange(n).reshape((n,) + (1,) * (values.ndim - 1))
+    since_high = (bar - _block_argmax(np.where(nans, -np.inf, values), length)).astype(float)
+    since_low = (bar - _block_argmax(np.where(nans, -np.inf, -values), length)).astype(float)
+    since_high[valid < max(min_periods, 1)] = np.nan
+    since_low[valid < max(min_periods, 1)] = np.nan
+
+    return as_pandas(since_high, series), as_pandas(since_low, series)
+
+
+def set_dtype(dtype):
+    """Sets the global float dtype, float32 or float64 (default), in which
+    the indicators are computed and returned.  Cumulative sums, like those of
+    ad, obv, pvt and vwap, and exponential recursions still accumulate in
+    float64 and only store their results as float32."""
+    _DTYPES[0] = _float_dtype(dtype)
+
+
 def signed_series(series:pd.Series, initial:int = None):
-    """Returns a Signed Series with or without an initial value"""
-    series = verify_series(series)
-    sign = series.diff(1)
-    sign[sign > 0] = 1
-    sign[sign < 0] = -1
-    sign.iloc[0] = initial
-    return sign
+    """Returns a Signed Series (or ndarray) with or without an initial value"""
+    values = np.asarray(series, dtype=float)
+    sign = np.full(values.shape, np.nan)
+    sign[1:] = np.sign(values[1:] - values[:-1])
+    if sign.size:
+        sign[0] = initial if initial is not None else np.nan
+    return as_pandas(sign, series)
 
 
 def verify_series(series:pd.Series):
-    """If a Pandas Series return it."""
-    if series is not None and isinstance(series, pd.core.series.Series):
+    """If a Pandas Series return it.  A DataFrame is returned as well, it is a
+    panel of Series with one column per symbol (see panel)."""
+    if series is not None and isinstance(series, (pd.Series, pd.DataFrame)):
         return series
 
 
+def weighted_window(series:pd.Series, weights):
+    """Weighted Window
+
+    Returns the dot product of a fixed weight vector with every rolling window
+    of the Series (or ndarray, 2D for a panel).  The oldest value of a window
+    is paired with weights[0] and the most recent with weights[-1].  Evaluated
+    in a single vectorized pass, it is equivalent to:
+        series.rolling(len(weights)).apply(lambda x: np.dot(weights, x), raw=True)
+
+    Windows that are not full or that contain a NaN are NaN.
+    """
+    weights = np.asarray(weights, dtype=float)
+    length = weights.size
+
+    values = np.asarray(series, dtype=float)
+    result = np.full(values.shape, np.nan)
+    if length > 0 and values.shape[0] >= length:
+        if values.ndim == 1:
+            result[length - 1:] = np.convolve(values, weights[::-1], mode='valid')
+        else:
+            # A panel with one column per symbol, see panel
+            shape = (values.shape[0] - length + 1, length) + values.shape[1:]
+            strides = (values.strides[0],) + values.strides
+            windows = np.lib.stride_tricks.as_strided(values, shape=shape, strides=strides, writeable=False)
+            result[length - 1:] = np.tensordot(weights, windows, axes=(0, 1))
+
+    return as_pandas(result, series)
+
+
 def zero(x):
     """If the value is close to zero, then return zero.  Otherwise return the value."""
     return 0 if -sflt.epsilon < x and x < sflt.epsilon else x
\ No newline at end of file
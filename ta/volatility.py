@@ -9,12 +9,14 @@
 import numpy as np
 import pandas as pd
 
+from . import core
+from .instrumentation import instrumented
 from .utils import *
-from .overlap import ema, hlc3, sma
-from .statistics import variance, stdev
+from .overlap import ema
 
 
 
+@instrumented
 def accbands(high, low, close, length=None, c=None, drift=None, mamode=None, offset=None, **kwargs):
     """Indicator: Acceleration Bands (ACCBANDS)
     https://www.tradingtechnologies.com/help/x-study/technical-indicator-definitions/acceleration-bands-abands/
@@ -31,19 +33,9 @@ def accbands(high, low, close, length=None, c=None, drift=None, mamode=None, off
     offset = get_offset(offset)
 
     # Calculate Result
-    hl_ratio  = (high - low) / (high + low)
-    hl_ratio *= c
-    _lower = low * (1 - hl_ratio)
-    _upper = high * (1 + hl_ratio)
-
-    if mamode is None or mamode == 'sma':
-        lower = _lower.rolling(length, min_periods=min_periods).mean()
-        mid   = close.rolling(length, min_periods=min_periods).mean()
-        upper = _upper.rolling(length, min_periods=min_periods).mean()
-    elif mamode == 'ema':
-        lower = _lower.ewm(span=length, min_periods=min_periods).mean()
-        mid   = close.ewm(span=length, min_periods=min_periods).mean()
-        upper = _upper.ewm(span=length, min_periods=min_periods).mean()
+    with precision(kwargs.get('dtype')):
+        accbands = core.accbands(high.values, low.values, close.values, length=length, c=c, mamode=mamode, min_periods=min_periods)
+    lower, mid, upper = [as_pandas(x, close) for x in accbands]
 
     # Offset
     if offset != 0:
@@ -69,13 +61,14 @@ def accbands(high, low, close, length=None, c=None, drift=None, mamode=None, off
 
     # Prepare DataFrame to return
     data = {lower.name: lower, mid.name: mid, upper.name: upper}
-    accbandsdf = pd.DataFrame(data)
+    accbandsdf = pd.concat(data, axis=1)
     accbandsdf.name = f"ACCBANDS_{length}"
     accbandsdf.category = 'volatility'
 
     return accbandsdf
 
 
+@instrumented
 def atr(high, low, close, length=None, mamode=None, drift=None, offset=None, **kwargs):
     """Indicator: Average True Range (ATR)"""
     # Validate arguments
@@ -89,11 +82,9 @@ def atr(high, low, close, length=None, mamode=None, drift=None, offset=None, **k
     offset = get_offset(offset)
 
     # Calculate Result
-    tr = true_range(high=high, low=low, close=close, drift=drift)
-    if mamode == 'ema':
-        atr = tr.ewm(span=length, min_periods=min_periods).mean()
-    else:
-        atr = tr.rolling(length, min_periods=min_periods).mean()
+    with precision(kwargs.get('dtype')):
+        atr = core.atr(high.values, low.values, close.values, length=length, mamode=mamode, drift=drift, min_periods=min_periods)
+    atr = as_pandas(atr, close)
 
     # Offset
     if offset != 0:
@@ -112,6 +103,7 @@ def atr(high, low, close, length=None, mamode=None, drift=None, offset=None, **k
     return atr
 
 
+@instrumented
 def bbands(close, length=None, std=None, mamode=None, offset=None, **kwargs):
     """Indicator: Bollinger Bands (BBANDS)"""
     # Validate arguments
@@ -123,16 +115,9 @@ def bbands(close, length=None, std=None, mamode=None, offset=None, **kwargs):
     offset = get_offset(offset)
 
     # Calculate Result
-    standard_deviation = stdev(close=close, length=length)
-    # std = variance(close=close, length=length).apply(np.sqrt)
-
-    if mamode is None or mamode == 'sma':
-        mid = close.rolling(length, min_periods=min_periods).mean()
-    elif mamode == 'ema':
-        mid = close.ewm(span=length, min_periods=min_periods).mean()
-
-    lower = mid - std * standard_deviation
-    upper = mid + std * standard_deviation
+    with precision(kwargs.get('dtype')):
+        bbands = core.bbands(close.values, length=length, std=std, mamode=mamode, min_periods=min_periods)
+    lower, mid, upper = [as_pandas(x, close) for x in bbands]
 
     # Offset
     if offset != 0:
@@ -158,13 +143,14 @@ def bbands(close, length=None, std=None, mamode=None, offset=None, **kwargs):
 
     # Prepare DataFrame to return
     data = {lower.name: lower, mid.name: mid, upper.name: upper}
-    bbandsdf = pd.DataFrame(data)
+    bbandsdf = pd.concat(data, axis=1)
     bbandsdf.name = f"BBANDS_{length}"
     bbandsdf.category = 'volatility'
 
     return bbandsdf
 
 
+@instrumented
 def donchian(close, length=None, offset=None, **kwargs):
     """Indicator: Donchian Channels (DC)"""
     # Validate arguments
@@ -174,9 +160,9 @@ def donchian(close, length=None, offset=None, **kwargs):
     offset = get_offset(offset)
 
     # Calculate Result
-    lower = close.rolling(length, min_periods=min_periods).min()
-    upper = close.rolling(length, min_periods=min_periods).max()
-    mid = 0.5 * (lower + upper)
+    with precision(kwargs.get('dtype')):
+        donchian = core.donchian(close.values, length=length, min_periods=min_periods)
+    lower, mid, upper = [as_pandas(x, close) for x in donchian]
 
     # Handle fills
     if 'fillna' in kwargs:
@@ -202,13 +188,14 @@ def donchian(close, length=None, offset=None, **kwargs):
 
     # Prepare DataFrame to return
     data = {lower.name: lower, mid.name: mid, upper.name: upper}
-    dcdf = pd.DataFrame(data)
+    dcdf = pd.concat(data, axis=1)
     dcdf.name = f"DC_{length}"
     dcdf.category = 'volatility'
 
     return dcdf
 
 
+@instrumented
 def kc(high, low, close, length=None, scalar=None, mamode=None, offset=None, **kwargs):
     """Indicator: Keltner Channels (KC)"""
     # Validate arguments
@@ -222,19 +209,9 @@ def kc(high, low, close, length=None, scalar=None, mamode=None, offset=None, **k
     offset = get_offset(offset)
 
     # Calculate Result
-    std = variance(close=close, length=length).apply(np.sqrt)
-
-    if mamode == 'ema':
-        basis = close.ewm(span=length, min_periods=min_periods).mean()
-        band = atr(high=high, low=low, close=close)
-    else:
-        hl_range = high - low
-        typical_price = hlc3(high=high, low=low, close=close)
-        basis = typical_price.rolling(length, min_periods=min_periods).mean()
-        band = hl_range.rolling(length, min_periods=min_periods).mean()
-
-    lower = basis - scalar * band
-    upper = basis + scalar * band
+    with precision(kwargs.get('dtype')):
+        kc = core.kc(high.values, low.values, close.values, length=length, scalar=scalar, mamode=mamode, min_periods=min_periods)
+    lower, basis, upper = [as_pandas(x, close) for x in kc]
 
     # Offset
     if offset != 0:
@@ -260,13 +237,14 @@ def kc(high, low, close, length=None, scalar=None, mamode=None, offset=None, **k
 
     # Prepare DataFrame to return
     data = {lower.name: lower, basis.name: basis, upper.name: upper}
-    kcdf = pd.DataFrame(data)
+    kcdf = pd.concat(data, axis=1)
     kcdf.name = f"KC_{length}"
     kcdf.category = 'volatility'
 
     return kcdf
 
 
+@instrumented
 def massi(high, low, fast=None, slow=None, offset=None, **kwargs):
     """Indicator: Mass Index (MASSI)"""
     # Validate arguments
@@ -280,12 +258,8 @@ def massi(high, low, fast=None, slow=None, offset=None, **kwargs):
     offset = get_offset(offset)
 
     # Calculate Result
-    hl_range = high - low
-    hl_ema1 = ema(close=hl_range, length=fast)
-    hl_ema2 = ema(close=hl_ema1, length=fast)
-
-    hl_ratio = hl_ema1 / hl_ema2
-    massi = hl_ratio.rolling(slow, min_periods=slow).sum()
+    with precision(kwargs.get('dtype')):
+        massi = as_pandas(core.massi(high.values, low.values, fast=fast, slow=slow), high)
 
     # Offset
     if offset != 0:
@@ -304,6 +278,7 @@ def massi(high, low, fast=None, slow=None, offset=None, **kwargs):
     return massi
 
 
+@instrumented
 def natr(high, low, close, length=None, mamode=None, drift=None, offset=None, **kwargs):
     """Indicator: Normalized Average True Range (NATR)"""
     # Validate arguments
@@ -311,12 +286,15 @@ def natr(high, low, close, length=None, mamode=None, drift=None, offset=None, **
     low = verify_series(low)
     close = verify_series(close)
     length = int(length) if length and length > 0 else 14
+    min_periods = int(kwargs['min_periods']) if 'min_periods' in kwargs and kwargs['min_periods'] is not None else length
     mamode = mamode.lower() if mamode else 'ema'
     drift = get_drift(drift)
     offset = get_offset(offset)
 
     # Calculate Result
-    natr = (100 / close) * atr(high=high, low=low, close=close, length=length, mamode=mamode, drift=drift, offset=offset, **kwargs)
+    with precision(kwargs.get('dtype')):
+        natr = core.natr(high.values, low.values, close.values, length=length, mamode=mamode, drift=drift, min_periods=min_periods)
+    natr = as_pandas(natr, close)
 
     # Offset
     if offset != 0:
@@ -335,6 +313,7 @@ def natr(high, low, close, length=None, mamode=None, drift=None, offset=None, **
     return natr
 
 
+@instrumented
 def true_range(high, low, close, drift=None, offset=None, **kwargs):
     """Indicator: True Range"""
     # Validate arguments
@@ -345,10 +324,9 @@ def true_range(high, low, close, drift=None, offset=None, **kwargs):
     offset = get_offset(offset)
 
     # Calculate Result
-    prev_close = close.shift(drift)
-    ranges = [high - low, high - prev_close, low - prev_close]
-    true_range = pd.DataFrame(ranges).T
-    true_range = true_range.abs().max(axis=1)
+    with precision(kwargs.get('dtype')):
+        true_range = core.true_range(high.values, low.values, close.values, drift=drift)
+    true_range = as_pandas(true_range, close)
 
     # Offset
     if offset != 0:
@@ -686,8 +664,7 @@ def average_true_range_depreciated(high, low, close, n=14, fillna=False):
     Returns:
         pandas.Series: New feature generated.
     """
-    cs = close.shift(1)
-    tr = high.combine(cs, max) - low.combine(cs, min)
+    tr = as_pandas(core.true_range(high.values, low.values, close.values), close)
     tr = ema(tr, n)
     if fillna:
         tr = tr.replace([np.inf, -np.inf], np.nan).fillna(0)
@@ -9,11 +9,12 @@
 import numpy as np
 import pandas as pd
 
-from .utils import get_drift, get_offset, signed_series, verify_series
-from .momentum import roc
-from .overlap import hl2, hlc3, ema
+from . import core
+from .instrumentation import instrumented
+from .utils import as_pandas, get_drift, get_offset, precision, verify_series
 
 
+@instrumented
 def ad(high, low, close, volume, open_=None, offset=None, **kwargs):
     """Indicator: Accumulation/Distribution (AD)"""
     # Validate Arguments
@@ -24,15 +25,9 @@ def ad(high, low, close, volume, open_=None, offset=None, **kwargs):
     offset = get_offset(offset)
 
     # Calculate Result
-    if open_ is not None:
-        open_ = verify_series(open_)
-        ad = close - open_  # AD with Open
-    else:                
-        ad = 2 * close - high - low  # AD with High, Low, Close
-
-    hl_range = high - low
-    ad *= volume / hl_range
-    ad = ad.cumsum()
+    with precision(kwargs.get('dtype')):
+        ad = core.ad(high.values, low.values, close.values, volume.values, open_=open_.values if open_ is not None else None)
+    ad = as_pandas(ad, close)
 
     # Offset
     if offset != 0:
@@ -51,6 +46,7 @@ def ad(high, low, close, volume, open_=None, offset=None, **kwargs):
     return ad
 
 
+@instrumented
 def adosc(high, low, close, volume, open_=None, fast=None, slow=None, offset=None, **kwargs):
     """Indicator: Accumulation/Distribution Oscillator"""
     # Validate Arguments
@@ -65,10 +61,9 @@ def adosc(high, low, close, volume, open_=None, fast=None, slow=None, offset=Non
     offset = get_offset(offset)
 
     # Calculate Result
-    ad_ = ad(high=high, low=low, close=close, volume=volume, open_=open_)
-    fast_ad = ema(close=ad_, length=fast)
-    slow_ad = ema(close=ad_, length=slow)
-    adosc = fast_ad - slow_ad
+    with precision(kwargs.get('dtype')):
+        adosc = core.adosc(high.values, low.values, close.values, volume.values, open_=open_.values if open_ is not None else None, fast=fast, slow=slow)
+    adosc = as_pandas(adosc, close)
 
     # Offset
     if offset != 0:
@@ -87,6 +82,7 @@ def adosc(high, low, close, volume, open_=None, fast=None, slow=None, offset=Non
     return adosc
 
 
+@instrumented
 def cmf(high, low, close, volume, open_=None, length=None, offset=None, **kwargs):
     """Indicator: Chaikin Money Flow (CMF)"""
     # Validate Arguments
@@ -99,15 +95,9 @@ def cmf(high, low, close, volume, open_=None, length=None, offset=None, **kwargs
     offset = get_offset(offset)
 
     # Calculate Result
-    if open_ is not None:
-        open_ = verify_series(open_)
-        ad = close - open_  # AD with Open
-    else:                
-        ad = 2 * close - high - low  # AD with High, Low, Close
-
-    hl_range = high - low
-    ad *= volume / hl_range
-    cmf = ad.rolling(length, min_periods=min_periods).sum() / volume.rolling(length, min_periods=min_periods).sum()
+    with precision(kwargs.get('dtype')):
+        cmf = core.cmf(high.values, low.values, close.values, volume.values, open_=open_.values if open_ is not None else None, length=length, min_periods=min_periods)
+    cmf = as_pandas(cmf, close)
 
     # Offset
     if offset != 0:
@@ -126,6 +116,7 @@ def cmf(high, low, close, volume, open_=None, length=None, offset=None, **kwargs
     return cmf
 
 
+@instrumented
 def efi(close, volume, length=None, drift=None, mamode=None, offset=None, **kwargs):
     """Indicator: Elder's Force Index (EFI)"""
     # Validate arguments
@@ -138,12 +129,9 @@ def efi(close, volume, length=None, drift=None, mamode=None, offset=None, **kwar
     offset = get_offset(offset)
 
     # Calculate Result
-    pv_diff = close.diff(drift) * volume
-
-    if mamode == 'sma':
-        efi = pv_diff.rolling(length, min_periods=min_periods).mean()
-    else:
-        efi = pv_diff.ewm(span=length, min_periods=min_periods).mean()
+    with precision(kwargs.get('dtype')):
+        efi = core.efi(close.values, volume.values, length=length, drift=drift, mamode=mamode, min_periods=min_periods)
+    efi = as_pandas(efi, close)
 
     # Offset
     if offset != 0:
@@ -162,6 +150,7 @@ def efi(close, volume, length=None, drift=None, mamode=None, offset=None, **kwar
     return efi
 
 
+@instrumented
 def eom(high, low, close, volume, length=None, divisor=None, drift=None, offset=None, **kwargs):
     """Indicator: Ease of Movement (EOM)"""
     # Validate arguments
@@ -176,11 +165,9 @@ def eom(high, low, close, volume, length=None, divisor=None, drift=None, offset=
     offset = get_offset(offset)
 
     # Calculate Result
-    hl_range = high - low
-    distance = hl2(high=high, low=low) - hl2(high=high.shift(drift), low=low.shift(drift))
-    box_ratio = (volume / divisor) / hl_range
-    eom = distance / box_ratio
-    eom = eom.rolling(length, min_periods=min_periods).mean()
+    with precision(kwargs.get('dtype')):
+        eom = core.eom(high.values, low.values, close.values, volume.values, length=length, divisor=divisor, drift=drift, min_periods=min_periods)
+    eom = as_pandas(eom, close)
 
     # Offset
     if offset != 0:
@@ -199,6 +186,7 @@ def eom(high, low, close, volume, length=None, divisor=None, drift=None, offset=
     return eom
 
 
+@instrumented
 def mfi(high, low, close, volume, length=None, drift=None, offset=None, **kwargs):
     """Indicator: Money Flow Index (MFI)"""
     # Validate arguments
@@ -211,22 +199,9 @@ def mfi(high, low, close, volume, length=None, drift=None, offset=None, **kwargs
     offset = get_offset(offset)
 
     # Calculate Result
-    typical_price = hlc3(high=high, low=low, close=close)
-    raw_money_flow = typical_price * volume
-
-    tdf = pd.DataFrame({'diff': 0, 'rmf': raw_money_flow, '+mf': 0, '-mf': 0})
-
-    tdf.loc[(typical_price.diff(drift) > 0), 'diff'] =  1
-    tdf.loc[tdf['diff'] ==  1, '+mf'] = raw_money_flow
-
-    tdf.loc[(typical_price.diff(drift) < 0), 'diff'] = -1
-    tdf.loc[tdf['diff'] == -1, '-mf'] = raw_money_flow
-
-    psum = tdf['+mf'].rolling(length).sum()
-    nsum = tdf['-mf'].rolling(length).sum()
-    tdf['mr'] = psum / nsum
-    mfi = 100 * psum / (psum + nsum)
-    tdf['mfi'] = mfi
+    with precision(kwargs.get('dtype')):
+        mfi = core.mfi(high.values, low.values, close.values, volume.values, length=length, drift=drift)
+    mfi = as_pandas(mfi, close)
 
     # Offset
     if offset != 0:
@@ -245,6 +220,7 @@ def mfi(high, low, close, volume, length=None, drift=None, offset=None, **kwargs
     return mfi
 
 
+@instrumented
 def nvi(close, volume, length=None, initial=None, offset=None, **kwargs):
     """Indicator: Negative Volume Index (NVI)"""
     # Validate arguments
@@ -253,15 +229,12 @@ def nvi(close, volume, length=None, initial=None, offset=None, **kwargs):
     length = int(length) if length and length > 0 else 1
     min_periods = int(kwargs['min_periods']) if 'min_periods' in kwargs and kwargs['min_periods'] is not None else length
     initial = int(initial) if initial and initial > 0 else 1000
+    multiplicative = bool(kwargs['multiplicative']) if 'multiplicative' in kwargs and kwargs['multiplicative'] is not None else False
     offset = get_offset(offset)
 
     # Calculate Result
-    roc_ = roc(close=close)
-    signed_volume = signed_series(volume, initial=1)
-    nvi = signed_volume[signed_volume < 0].abs() * roc_
-    nvi.fillna(0, inplace=True)
-    nvi.iloc[0]= initial
-    nvi = nvi.cumsum()
+    with precision(kwargs.get('dtype')):
+        nvi = as_pandas(core.nvi(close.values, volume.values, initial=initial, multiplicative=multiplicative), close)
 
     # Offset
     if offset != 0:
@@ -280,6 +253,7 @@ def nvi(close, volume, length=None, initial=None, offset=None, **kwargs):
     return nvi
 
 
+@instrumented
 def obv(close, volume, offset=None, **kwargs):
     """Indicator: On Balance Volume (OBV)"""
     # Validate arguments
@@ -288,8 +262,8 @@ def obv(close, volume, offset=None, **kwargs):
     offset = get_offset(offset)
 
     # Calculate Result
-    signed_volume = signed_series(close, initial=1) * volume
-    obv = signed_volume.cumsum()
+    with precision(kwargs.get('dtype')):
+        obv = as_pandas(core.obv(close.values, volume.values), close)
 
     # Offset
     if offset != 0:
@@ -308,6 +282,39 @@ def obv(close, volume, offset=None, **kwargs):
     return obv
 
 
+@instrumented
+def pvi(close, volume, length=None, initial=None, offset=None, **kwargs):
+    """Indicator: Positive Volume Index (PVI)"""
+    # Validate arguments
+    close = verify_series(close)
+    volume = verify_series(volume)
+    length = int(length) if length and length > 0 else 1
+    initial = int(initial) if initial and initial > 0 else 1000
+    multiplicative = bool(kwargs['multiplicative']) if 'multiplicative' in kwargs and kwargs['multiplicative'] is not None else False
+    offset = get_offset(offset)
+
+    # Calculate Result
+    with precision(kwargs.get('dtype')):
+        pvi = as_pandas(core.pvi(close.values, volume.values, initial=initial, multiplicative=multiplicative), close)
+
+    # Offset
+    if offset != 0:
+        pvi = pvi.shift(offset)
+
+    # Handle fills
+    if 'fillna' in kwargs:
+        pvi.fillna(kwargs['fillna'], inplace=True)
+    if 'fill_method' in kwargs:
+        pvi.fillna(method=kwargs['fill_method'], inplace=True)
+
+    # Name and Categorize it
+    pvi.name = f"PVI_{length}"
+    pvi.category = 'volume'
+
+    return pvi
+
+
+@instrumented
 def pvol(close, volume, signed=True, offset=None, **kwargs):
     """Indicator: Price-Volume (PVOL)"""
     # Validate arguments
@@ -316,10 +323,8 @@ def pvol(close, volume, signed=True, offset=None, **kwargs):
     offset = get_offset(offset)
 
     # Calculate Result
-    if signed:
-        pvol = signed_series(close, 1) * close * volume
-    else:
-        pvol = close * volume
+    with precision(kwargs.get('dtype')):
+        pvol = as_pandas(core.pvol(close.values, volume.values, signed=signed), close)
 
     # Offset
     if offset != 0:
@@ -338,6 +343,7 @@ def pvol(close, volume, signed=True, offset=None, **kwargs):
     return pvol
 
 
+@instrumented
 def pvt(close, volume, drift=None, offset=None, **kwargs):
     """Indicator: Price-Volume Trend (PVT)"""
     # Validate arguments
@@ -347,8 +353,8 @@ def pvt(close, volume, drift=None, offset=None, **kwargs):
     offset = get_offset(offset)
 
     # Calculate Result
-    pv = roc(close=close, length=drift) * volume
-    pvt = pv.cumsum()
+    with precision(kwargs.get('dtype')):
+        pvt = as_pandas(core.pvt(close.values, volume.values, drift=drift), close)
 
     # Offset
     if offset != 0:
@@ -593,17 +599,8 @@ def negative_volume_index_depreciated(close, volume, fillna=False):
     See also:
     https://en.wikipedia.org/wiki/Negative_volume_index
     """
-    price_change = close.pct_change()
-    vol_decrease = (volume.shift(1) > volume)
-
-    nvi = pd.Series(data=np.nan, index=close.index, dtype='float64', name='nvi')
-
-    nvi.iloc[0] = 1000
-    for i in range(1,len(nvi)):
-        if vol_decrease.iloc[i]:
-            nvi.iloc[i] = nvi.iloc[i - 1] * (1.0 + price_change.iloc[i])
-        else:
-            nvi.iloc[i] = nvi.iloc[i - 1]
+    nvi = core.nvi(close.values, volume.values, initial=1000, multiplicative=True)
+    nvi = pd.Series(nvi, index=close.index, name='nvi')
 
     if fillna:
         nvi = nvi.replace([np.inf, -np.inf], np.nan).fillna(1000) # IDEA: There shouldn't be any na; might be better to throw exception
@@ -876,6 +873,9 @@ Calculation:
     nvi.iloc[0]= initial
     nvi = nvi.cumsum()
 
+    if multiplicative, the classic definition:
+    nvi = initial * (1 + close.pct_change()).where(volume < volume.shift(1), 1).cumprod()
+
 Args:
     close (pd.Series): Series of 'close's
     volume (pd.Series): Series of 'volume's
@@ -884,6 +884,8 @@ Args:
     offset (int): How many periods to offset the result.  Default: 0
 
 Kwargs:
+    multiplicative (bool, optional): Default: False.  When True, the index
+        compounds the percent change of 'close' instead of adding its ROC.
     fillna (value, optional): pd.DataFrame.fillna(value)
     fill_method (value, optional): Type of fill method
 
@@ -921,6 +923,48 @@ Returns:
 """
 
 
+pvi.__doc__ = \
+"""Positive Volume Index (PVI)
+
+The Positive Volume Index is the counterpart of the Negative Volume Index.
+It is a cumulative indicator that only changes on the bars whose volume rose,
+when the crowd is assumed to be active.
+
+Sources:
+    https://www.investopedia.com/terms/p/pvi.asp
+    https://en.wikipedia.org/wiki/Positive_volume_index
+
+Calculation:
+    Default Inputs:
+        initial=1000
+    ROC = Rate of Change
+
+    roc = ROC(close)
+    pvi = roc.where(volume > volume.shift(1), 0).fillna(0)
+    pvi.iloc[0]= initial
+    pvi = pvi.cumsum()
+
+    if multiplicative, the classic definition:
+    pvi = initial * (1 + close.pct_change()).where(volume > volume.shift(1), 1).cumprod()
+
+Args:
+    close (pd.Series): Series of 'close's
+    volume (pd.Series): Series of 'volume's
+    length (int): Only part of its name.  Default: 1
+    initial (int): The initial value.  Default: 1000
+    offset (int): How many periods to offset the result.  Default: 0
+
+Kwargs:
+    multiplicative (bool, optional): Default: False.  When True, the index
+        compounds the percent change of 'close' instead of adding its ROC.
+    fillna (value, optional): pd.DataFrame.fillna(value)
+    fill_method (value, optional): Type of fill method
+
+Returns:
+    pd.Series: New feature generated.
+"""
+
+
 pvol.__doc__ = \
 """Price-Volume (PVOL)
 